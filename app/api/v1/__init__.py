@@ -2,6 +2,7 @@
 
 # Import routers directly from their modules to avoid circular imports
 from app.api.v1.endpoints.events import eventsRouter as events
+from app.api.v1.endpoints.results import resultsRouter as results
 from app.api.v1.endpoints.teams import teamsRouter as teams
 
-__all__ = ["events", "teams"]
+__all__ = ["events", "results", "teams"]
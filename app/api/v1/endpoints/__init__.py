@@ -1,5 +1,5 @@
 """API v1 endpoints."""
 
-from app.api.v1.endpoints import events, teams
+from app.api.v1.endpoints import events, results, teams
 
-__all__ = ["events", "teams"]
+__all__ = ["events", "results", "teams"]
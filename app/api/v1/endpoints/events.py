@@ -1,13 +1,41 @@
 """Event endpoints."""
 
+import asyncio
 import traceback
-from typing import List
+from typing import AsyncIterator, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
+from app.core.config import settings
 from app.core.db.session import get_session
-from app.schemas.event import BaseResponse, EventFilter, EventResponse
+from app.core.exceptions import (
+    EventNotFoundException,
+    InvalidCursorException,
+    JobNotFoundException,
+)
+from app.schemas.event import (
+    BaseResponse,
+    EventDetailsResponse,
+    EventFilter,
+    EventResponse,
+    PageResponse,
+    event_page_adapter,
+)
+from app.schemas.job import IngestionJobResponse
+from app.services.broadcast import broadcast_hub
+from app.services.event_cache import events_cache, events_page_key
+from app.services.event_details_service import EventDetailsService
 from app.services.event_service import EventService
+from app.services.job_service import job_manager
+from app.utils.conditional import (
+    cache_control,
+    cache_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
 
 eventsRouter = APIRouter(prefix="/api", tags=["events"])
 
@@ -19,54 +47,82 @@ async def get_event_service(db=Depends(get_session)) -> EventService:
 
 @eventsRouter.get(
     "/events",
-    response_model=BaseResponse[List[EventResponse]],
+    response_model=PageResponse[List[EventResponse]],
     summary="Get events",
     operation_id="fetch_events",
     description=(
         "Get events from database with optional filtering. "
-        "Supports filtering by date range, types, groups, and disciplines."
+        "Supports filtering by date range, types, groups, and disciplines. "
+        "Events are ordered by link. With `limit` only that many events are "
+        "returned, and `next_cursor` is set if more follow; pass it as `cursor` "
+        "to get the next page. Responses are cached per filter until the next ingestion writes events. "
+        "Responses carry an ETag; a request whose If-None-Match matches it gets "
+        "an empty 304 response."
     ),
 )
 async def fetch_events(
     filter_: EventFilter = Depends(),
+    limit: Optional[int] = Query(
+        None, ge=1, le=settings.EVENTS_PAGE_MAX_LIMIT, description="Page size"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached response"),
     db: EventService = Depends(get_event_service),
-) -> BaseResponse[List[EventResponse]]:
+) -> Response:
     """
     Get events from database with optional filtering.
 
+    The serialized response is cached in events_cache under the canonical
+    filter, so repeated filters skip the query and the validation. Its ETag
+    is derived from the filter and the latest update time and number of the
+    matching events, so on a cache miss a client holding the current list
+    gets a 304 without the events being loaded. Pages are cached and
+    tagged separately.
+
     Args:
         filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
+        limit: Page size, all matching events if not set
+        cursor: Cursor of the page to get, the first page if not set
+        if_none_match: If-None-Match request header
         db: EventService instance
 
     Returns:
-        List of EventResponse objects matching the filter criteria
+        JSON response with the EventResponse objects matching the filter
+        criteria, or an empty 304 response if the client's copy is current
+
+    Raises:
+        InvalidCursorException: If the cursor cannot be decoded
     """
     try:
-        print("fetch_events_remote...")
-        events = await db.get_events(
-            start_date=filter_.start,
-            end_date=filter_.end,
-            types=filter_.types,
-            groups=filter_.groups,
-            disciplines=filter_.disciplines,
+        after = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise InvalidCursorException(str(e))
+
+    try:
+        control = cache_control(
+            settings.EVENTS_CDN_MAX_AGE, settings.EVENTS_STALE_WHILE_REVALIDATE
         )
+        key = events_page_key(filter_, after, limit)
+        entry = events_cache.lookup(key)
+        if entry is not None:
+            body, etag = entry.body, entry.etag
+        else:
+            # Read before querying, so a write during the query is not cached;
+            # validate before loading, so the ETag never claims newer data
+            generation = events_cache.generation
+            etag = await build_events_etag(filter_, key, db)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag, control)
+            body = await build_events_body(filter_, db, after, limit)
+            events_cache.set(key, body, generation, etag)
 
-        # Convert Event objects to EventResponse
-        event_dict_list = []
-        for event in events:
-            event_dict = event.__dict__.copy()
-            if event_dict.get("startdate") == "":
-                event_dict["startdate"] = None
-            if event_dict.get("enddate") == "":
-                event_dict["enddate"] = None
-            event_dict_list.append(event_dict)
-
-        event_responses = [
-            EventResponse.model_validate(event_dict) for event_dict in event_dict_list
-        ]
-        event_responses.sort(key=lambda x: x.link)
-
-        return BaseResponse(data=event_responses, success=True)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, control)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=cache_headers(etag, control),
+        )
     except Exception as e:
         error_detail = (
             f"Internal server error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
@@ -74,70 +130,297 @@ async def fetch_events(
         raise HTTPException(status_code=500, detail=error_detail)
 
 
+async def build_events_etag(filter_: EventFilter, key: str, db: EventService) -> str:
+    """
+    Build the entity tag of the events matching a filter.
+
+    Args:
+        filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
+        key: Canonical cache key of the filter
+        db: EventService instance
+
+    Returns:
+        Weak entity tag
+    """
+    updated_at, count = await db.get_events_validator(
+        start_date=filter_.start,
+        end_date=filter_.end,
+        types=filter_.types,
+        groups=filter_.groups,
+        disciplines=filter_.disciplines,
+    )
+    return make_etag(key, updated_at, count)
+
+
+async def build_events_body(
+    filter_: EventFilter,
+    db: EventService,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> bytes:
+    """
+    Query and serialize a page of the events matching a filter.
+
+    One event more than the page size is loaded to find out whether
+    another page follows. The rows are plain column dictionaries encoded
+    in a single event_page_adapter pass, into the same JSON as
+    PageResponse[List[EventResponse]] but without a model per event.
+
+    Args:
+        filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
+        db: EventService instance
+        after: Link the page starts after, None for the first page
+        limit: Page size, None for all events
+
+    Returns:
+        JSON-encoded PageResponse with the page's events sorted by link
+    """
+    rows = await db.get_event_rows(
+        start_date=filter_.start,
+        end_date=filter_.end,
+        types=filter_.types,
+        groups=filter_.groups,
+        disciplines=filter_.disciplines,
+        after=after,
+        limit=limit + 1 if limit is not None else None,
+    )
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["link"])
+
+    return event_page_adapter.dump_json(
+        {"success": True, "data": rows, "message": None, "next_cursor": next_cursor}
+    )
+
+
+@eventsRouter.get(
+    "/events/cache/stats",
+    summary="Get events cache statistics",
+    operation_id="get_events_cache_stats",
+    description=(
+        "Get hit rate, size and generation of this worker's /api/events "
+        "response cache."
+    ),
+)
+async def get_events_cache_stats() -> BaseResponse[dict]:
+    """
+    Get statistics of the events response cache.
+
+    Returns:
+        BaseResponse with hits, misses, hit rate, entries and memory use
+    """
+    return BaseResponse(data=events_cache.stats(), success=True)
+
+
+async def get_event_details_service(db=Depends(get_session)) -> EventDetailsService:
+    """Dependency for EventDetailsService."""
+    return EventDetailsService(db)
+
+
+async def stream_changes(filter_: EventFilter) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events with the changes matching a filter.
+
+    Args:
+        filter_: EventFilter selecting the events to stream
+
+    Yields:
+        Encoded SSE messages and keep-alive comments
+    """
+    async with broadcast_hub.subscribe(filter_) as subscription:
+        yield ": connected\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.get(), timeout=settings.SSE_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield message.encode()
+            if message.kind == "resync":
+                return
+
+
+@eventsRouter.get(
+    "/events/stream",
+    summary="Stream event changes",
+    operation_id="stream_events",
+    description=(
+        "Server-Sent Events stream of changes, filtered like /api/events. "
+        "An `events` message carries newly ingested or changed events, a "
+        "`results` message carries the changed and removed rows of a live "
+        "results page of a matching event. After a `resync` message the "
+        "stream ends and the client should reload the data and reconnect."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_events(filter_: EventFilter = Depends()) -> StreamingResponse:
+    """
+    Stream changes of the events matching a filter.
+
+    Args:
+        filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
+
+    Returns:
+        StreamingResponse with a text/event-stream body
+    """
+    return StreamingResponse(
+        stream_changes(filter_),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def get_ingestion_params(filter_: EventFilter, mode: str = "full") -> dict:
+    """
+    Build ingestion parameters from a filter, applying source defaults.
+
+    Args:
+        filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
+        mode: Ingestion mode, "full" or "incremental"
+
+    Returns:
+        Keyword arguments for EventService.fetch_and_save_events
+    """
+    return {
+        "mode": mode,
+        "start": filter_.start or "2000-01-01",
+        "end": filter_.end or "2100-12-31",
+        "ranks": filter_.ranks or ["Всероссийские", "Международные", "Региональные"],
+        "types": filter_.types or ["book_competition", "book_festival"],
+        "groups": filter_.groups
+        or [
+            "adults",
+            "juniors",
+            "teenagers",
+            "younger",
+            "v10",
+            "v13",
+            "v15",
+            "v19",
+        ],
+        "disciplines": filter_.disciplines
+        or [
+            "bouldering",
+            "dvoerobye",
+            "etalon",
+            "skorost",
+            "trudnost",
+            "sv",
+            "mnogobore",
+        ],
+    }
+
+
 @eventsRouter.get(
     "/events/fetch",
-    response_model=BaseResponse,
+    response_model=BaseResponse[IngestionJobResponse],
+    status_code=202,
     summary="Fetch and save events",
     operation_id="fetch_events_remote",
     description=(
-        "Fetch events from external source and save them to database. "
-        "Fetches events from the climbing competition source with specified "
-        "filters, checks for duplicates, and inserts new events into the database."
+        "Queue a background job that fetches events from external source and saves "
+        "them to database. Returns the job immediately; a job with the same filters "
+        "that is still queued or running is returned instead of starting a new one. "
+        "Use /api/events/fetch/{job_id} to follow its progress. In incremental mode "
+        "only current and upcoming seasons and stale past seasons are re-crawled."
     ),
 )
 async def fetch_events_remote(
     filter_: EventFilter = Depends(),
-    db: EventService = Depends(get_event_service),
-) -> BaseResponse:
+    mode: Literal["full", "incremental"] = "full",
+) -> BaseResponse[IngestionJobResponse]:
     """
-    Fetch events from external source and save them to database.
-
-    Fetches events from the climbing competition source with specified filters,
-    checks for duplicates, and inserts new events into the database.
+    Queue fetching events from external source and saving them to database.
 
     Args:
         filter_: EventFilter object with optional date range, ranks, types, groups, and disciplines
-        db: EventService instance
+        mode: "full" to crawl the whole range, "incremental" to crawl only
+            current seasons and stale shards
 
     Returns:
-        BaseResponse with message and success status
+        BaseResponse with the queued (or already active) ingestion job
 
     Raises:
-        HTTPException: If there's an error during fetching or saving
+        HTTPException: If the job cannot be queued
     """
     try:
         print("fetch_events_remote...")
-        result = await db.fetch_and_save_events(
-            start=filter_.start or "2000-01-01",
-            end=filter_.end or "2100-12-31",
-            ranks=filter_.ranks or ["Всероссийские", "Международные", "Региональные"],
-            types=filter_.types or ["book_competition", "book_festival"],
-            groups=filter_.groups
-            or [
-                "adults",
-                "juniors",
-                "teenagers",
-                "younger",
-                "v10",
-                "v13",
-                "v15",
-                "v19",
-            ],
-            disciplines=filter_.disciplines
-            or [
-                "bouldering",
-                "dvoerobye",
-                "etalon",
-                "skorost",
-                "trudnost",
-                "sv",
-                "mnogobore",
-            ],
+        job, created = job_manager.submit(get_ingestion_params(filter_, mode))
+        message = (
+            "Ingestion job queued"
+            if created
+            else "Ingestion job with the same filters is already in progress"
         )
-
-        return BaseResponse(data=result, success=True, message=result["message"])
+        return BaseResponse(data=job.to_response(), success=True, message=message)
     except Exception as e:
         error_detail = (
             f"Internal server error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
         )
         raise HTTPException(status_code=500, detail=error_detail)
+
+
+@eventsRouter.get(
+    "/events/fetch/{job_id}",
+    response_model=BaseResponse[IngestionJobResponse],
+    summary="Get ingestion job status",
+    operation_id="get_fetch_job",
+    description=(
+        "Get status of a background ingestion job, including progress counters, "
+        "result and timings. Jobs started by another worker are reported from their "
+        "recorded run, without progress counters."
+    ),
+)
+async def get_fetch_job(job_id: str) -> BaseResponse[IngestionJobResponse]:
+    """
+    Get status of a background ingestion job.
+
+    Args:
+        job_id: Job identifier returned by /api/events/fetch
+
+    Returns:
+        BaseResponse with the job status
+
+    Raises:
+        JobNotFoundException: If the job is unknown to every worker
+    """
+    job = await job_manager.get_response(job_id)
+    if job is None:
+        raise JobNotFoundException(f"Job {job_id} not found")
+    return BaseResponse(data=job, success=True)
+
+
+@eventsRouter.get(
+    "/events/{link}/details",
+    response_model=BaseResponse[EventDetailsResponse],
+    summary="Get event details",
+    operation_id="get_event_details",
+    description=(
+        "Get regulations, results links, protocols and other documents from the "
+        "event's detail page. Served from the database; detail pages of new and "
+        "changed events are crawled during ingestion."
+    ),
+)
+async def get_event_details(
+    link: str,
+    db: EventDetailsService = Depends(get_event_details_service),
+) -> BaseResponse[EventDetailsResponse]:
+    """
+    Get the stored details of an event.
+
+    Args:
+        link: Event link
+        db: EventDetailsService instance
+
+    Returns:
+        BaseResponse with the event details
+
+    Raises:
+        EventNotFoundException: If the event's detail page was not crawled yet
+    """
+    details = await db.get_details(link)
+    if details is None:
+        raise EventNotFoundException(f"Details of event {link} not found")
+    return BaseResponse(data=EventDetailsResponse.model_validate(details), success=True)
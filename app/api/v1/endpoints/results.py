@@ -0,0 +1,152 @@
+"""Live result endpoints."""
+
+import traceback
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.core.config import settings
+from app.core.db.session import get_session
+from app.schemas.event import BaseResponse
+from app.schemas.result import ResultResponse
+from app.services.live_poller import live_poller
+from app.services.result_service import ResultService
+
+resultsRouter = APIRouter(prefix="/api", tags=["results"])
+
+
+async def get_result_service(db=Depends(get_session)) -> ResultService:
+    """Dependency for ResultService."""
+    return ResultService(db)
+
+
+@resultsRouter.get(
+    "/results",
+    response_model=BaseResponse[List[ResultResponse]],
+    summary="Get results",
+    operation_id="get_results",
+    description=(
+        "Search stored live results. Athlete and team are matched by "
+        "case-insensitive prefix; event, discipline, round and group exactly."
+    ),
+)
+async def get_results(
+    athlete: Optional[str] = Query(None, description="Athlete name prefix"),
+    team: Optional[str] = Query(None, description="Team name prefix"),
+    event: Optional[str] = Query(None, description="Event link"),
+    discipline: Optional[str] = Query(None, description="Discipline"),
+    round: Optional[str] = Query(None, description="Round"),
+    group: Optional[str] = Query(None, description="Participant group"),
+    limit: int = Query(100, ge=1, le=settings.RESULTS_MAX_LIMIT),
+    db: ResultService = Depends(get_result_service),
+) -> BaseResponse[List[ResultResponse]]:
+    """
+    Search stored live results.
+
+    Args:
+        athlete: Athlete name prefix
+        team: Team name prefix
+        event: Event link
+        discipline: Discipline
+        round: Round
+        group: Participant group
+        limit: Maximum number of results
+        db: ResultService instance
+
+    Returns:
+        BaseResponse with matching results
+    """
+    try:
+        results = await db.search_results(
+            athlete=athlete,
+            team=team,
+            event_link=event,
+            discipline=discipline,
+            round_=round,
+            group=group,
+            limit=limit,
+        )
+        return BaseResponse(
+            data=[ResultResponse.model_validate(result) for result in results],
+            success=True,
+        )
+    except Exception as e:
+        error_detail = (
+            f"Internal server error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+        )
+        raise HTTPException(status_code=500, detail=error_detail)
+
+
+@resultsRouter.post(
+    "/results/fetch",
+    response_model=BaseResponse[dict],
+    summary="Fetch and save results",
+    operation_id="fetch_results_remote",
+    description=(
+        "Fetch the live results pages of an event, parse every result row and "
+        "store new and changed rows."
+    ),
+)
+async def fetch_results_remote(
+    event: str = Query(..., description="Event link"),
+    pages: Optional[List[str]] = Query(None, description="Live results page names"),
+    db: ResultService = Depends(get_result_service),
+) -> BaseResponse[dict]:
+    """
+    Fetch and save live results of an event.
+
+    Args:
+        event: Event link
+        pages: Live results page names, defaults to the configured pages
+        db: ResultService instance
+
+    Returns:
+        BaseResponse with per-page counts of inserted, updated and deleted rows
+    """
+    try:
+        summary = await db.ingest_event_results(event, pages)
+        return BaseResponse(data=summary, success=True)
+    except Exception as e:
+        error_detail = (
+            f"Internal server error: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+        )
+        raise HTTPException(status_code=500, detail=error_detail)
+
+
+@resultsRouter.get(
+    "/results/live",
+    response_model=BaseResponse[dict],
+    summary="Get live results",
+    operation_id="get_live_results",
+    description=(
+        "Get the latest polled live results of a running event from memory. "
+        "Never triggers a request to the live results site. Without an event, "
+        "returns the list of events being polled."
+    ),
+)
+async def get_live_results(
+    event: Optional[str] = Query(None, description="Event link"),
+) -> BaseResponse[dict]:
+    """
+    Get live results of a running event.
+
+    Args:
+        event: Event link
+
+    Returns:
+        BaseResponse with the event's page snapshots, or the polled events
+    """
+    if event is None:
+        return BaseResponse(data={"events": live_poller.polled_events()}, success=True)
+
+    snapshots = live_poller.get_event(event)
+    if not snapshots:
+        return BaseResponse(
+            data={"event": event, "pages": []},
+            success=True,
+            message="Event is not being polled",
+        )
+    return BaseResponse(
+        data={"event": event, "pages": [snapshot.to_dict() for snapshot in snapshots]},
+        success=True,
+    )
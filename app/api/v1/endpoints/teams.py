@@ -1,10 +1,18 @@
 """Team endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.db.session import get_session
+from app.schemas.event import BaseResponse
+from app.schemas.team import TeamEventResponse
+from app.services.season_crawl import get_season_crawl, start_season_crawl
 from app.services.team_service import TeamService
+from app.utils.conditional import cache_control, etag_matches, make_etag, not_modified
 
 teamsRouter = APIRouter(prefix="/api", tags=["teams"])
 
@@ -20,27 +28,187 @@ async def get_team_service(db: AsyncSession = Depends(get_session)) -> TeamServi
     operation_id="get_teams",
     description=(
         "Get teams from the specified event by parsing the live results page. "
-        "Finds the event 'Первенство России' with year 2025 and group 'Ю', "
-        "then fetches and parses the live results page to extract team names. "
-        "Returns cached data if available for the specified year."
+        "By default finds the event 'Всероссийские соревнования' of the given year "
+        "with group '13-14', then fetches and parses the live results page to extract "
+        "team names. Returns cached data if available for the year and event; stale "
+        "data is returned immediately and refreshed in the background. Cached "
+        "teams carry an ETag; a request whose If-None-Match matches it gets an "
+        "empty 304 response."
     ),
 )
 async def get_teams(
+    response: Response,
+    year: Optional[str] = Query(None, description="Competition year"),
+    event: Optional[str] = Query(None, description="Event link"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached response"),
     db: TeamService = Depends(get_team_service),
 ):
     """
     Get teams from the specified event.
 
+    Teams served from the team cache are validated by the cache entry's
+    year, event, update time and staleness. Responses reporting an error
+    are not cached by clients or the CDN.
+
     Args:
+        response: Response whose headers are set
+        year: Competition year, defaults to the configured year
+        event: Event link, defaults to the configured event of the year
+        if_none_match: If-None-Match request header
         db: TeamService instance
 
     Returns:
-        Dictionary containing teams, event info, and cache status
+        Dictionary containing teams, event info, and cache status, or an
+        empty 304 response if the client's copy is current
 
     Raises:
         HTTPException: If there's an error during fetching or parsing
     """
     try:
-        return await db.get_teams()
+        teams = await db.get_teams(year=year, event=event)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get teams: {str(e)}")
+
+    if teams.get("error"):
+        response.headers["Cache-Control"] = "no-store"
+        return teams
+
+    control = cache_control(settings.TEAMS_CDN_MAX_AGE, settings.TEAMS_STALE_WHILE_REVALIDATE)
+    response.headers["Cache-Control"] = control
+    if teams.get("updated_at") is not None:
+        etag = make_etag(teams["year"], teams["link"], teams["updated_at"], teams["stale"])
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, control)
+        response.headers["ETag"] = etag
+    return teams
+
+
+@teamsRouter.post(
+    "/teams/refresh",
+    summary="Refresh teams",
+    operation_id="refresh_teams",
+    description=(
+        "Fetch and parse the live results page of the event now and update "
+        "the team cache, regardless of the age of the cached entry."
+    ),
+)
+async def refresh_teams(
+    year: Optional[str] = Query(None, description="Competition year"),
+    event: Optional[str] = Query(None, description="Event link"),
+    db: TeamService = Depends(get_team_service),
+):
+    """
+    Refresh teams of the specified event.
+
+    Args:
+        year: Competition year, defaults to the configured year
+        event: Event link, defaults to the configured event of the year
+        db: TeamService instance
+
+    Returns:
+        Dictionary containing fresh teams and event info
+
+    Raises:
+        HTTPException: If there's an error during fetching or parsing
+    """
+    try:
+        return await db.refresh_teams(year=year, event=event)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to refresh teams: {str(e)}")
+
+
+@teamsRouter.post(
+    "/teams/crawl",
+    status_code=202,
+    summary="Crawl season teams",
+    operation_id="crawl_season_teams",
+    description=(
+        "Start a background crawl of the live results pages of every event of the "
+        "year and rebuild the team -> events index. A crawl of the same year that "
+        "is still running is returned instead of starting a new one. Use "
+        "/api/teams/crawl/{year} to follow its progress."
+    ),
+)
+async def crawl_season_teams(
+    year: str = Query(..., description="Competition year"),
+):
+    """
+    Start a season team crawl.
+
+    Args:
+        year: Competition year
+
+    Returns:
+        Dictionary with the crawl progress and whether it was started now
+    """
+    crawl, created = start_season_crawl(year)
+    message = (
+        "Season team crawl started"
+        if created
+        else "Season team crawl is already running"
+    )
+    return {"message": message, "started": created, **crawl.progress}
+
+
+@teamsRouter.get(
+    "/teams/crawl/{year}",
+    summary="Get season team crawl status",
+    operation_id="get_season_crawl",
+    description="Get progress counters of the latest season team crawl of a year.",
+)
+async def get_season_crawl_status(year: str):
+    """
+    Get the status of a season team crawl.
+
+    Args:
+        year: Competition year
+
+    Returns:
+        Dictionary with the crawl progress
+
+    Raises:
+        HTTPException: If no crawl of the year was started by this worker
+    """
+    crawl = get_season_crawl(year)
+    if crawl is None:
+        raise HTTPException(status_code=404, detail=f"No team crawl of season {year}")
+    return crawl.progress
+
+
+@teamsRouter.get(
+    "/teams/events",
+    response_model=BaseResponse[List[TeamEventResponse]],
+    summary="Get events of a team",
+    operation_id="get_team_events",
+    description=(
+        "Get the events a team attended, from the index built by the season "
+        "team crawl. The team name is matched exactly."
+    ),
+)
+async def get_team_events(
+    team: str = Query(..., description="Team name"),
+    year: Optional[str] = Query(None, description="Competition year"),
+    db: TeamService = Depends(get_team_service),
+) -> BaseResponse[List[TeamEventResponse]]:
+    """
+    Get the events a team attended.
+
+    Args:
+        team: Team name
+        year: Competition year, all years if not set
+        db: TeamService instance
+
+    Returns:
+        BaseResponse with the team's events, latest years first
+
+    Raises:
+        HTTPException: If the index cannot be queried
+    """
+    try:
+        events = await db.get_team_events(team, year)
+        return BaseResponse(
+            data=[TeamEventResponse.model_validate(event) for event in events],
+            success=True,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get team events: {str(e)}")
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
@@ -14,6 +17,65 @@ class Settings(BaseSettings):
         DATABASE_URL: Database connection URL
         BASE_URL: Base URL for fetching climbing competition data
         ORIGINS: List of allowed CORS origins
+        HTTP_TIMEOUT: Default timeout for upstream HTTP requests, in seconds
+        HTTP_CONNECT_TIMEOUT: Connection timeout for upstream HTTP requests, in seconds
+        HTTP_MAX_CONNECTIONS: Maximum size of the shared HTTP connection pool
+        HTTP_MAX_KEEPALIVE_CONNECTIONS: Maximum number of idle keep-alive connections
+        HTTP_MAX_CONNECTIONS_PER_HOST: Maximum concurrent requests to a single host
+        HTTP_USER_AGENT: User-Agent header sent to upstream sites
+        INGESTION_WORKERS: Number of background workers running ingestion jobs
+        INGESTION_JOB_HISTORY: Number of finished ingestion jobs kept for status queries
+        INGESTION_CHUNK_SIZE: Number of events written per bulk upsert statement
+        INGESTION_ATTACH_POLL_INTERVAL: Seconds between checks of a run in progress in another worker
+        INGESTION_ATTACH_TIMEOUT: Maximum seconds to wait for a run in progress in another worker
+        HTML_PARSER_BACKEND: Calendar parser backend, "lxml" (fast) or "bs4" (reference)
+        PARSE_POOL_SIZE: Number of processes parsing HTML, 0 parses in a thread instead
+        PARSE_CHUNK_LINKS: Number of calendar links per fragment parsed by one process
+        CRAWL_CONCURRENCY: Maximum number of calendar shards fetched at once
+        CRAWL_SPLIT_FILTERS: Filters split into one shard per value, besides the year
+        CRAWL_YEARS_AHEAD: Number of future years included in a crawl
+        CRAWL_SHARD_RETRIES: Number of retries of a failed shard
+        CRAWL_RETRY_BACKOFF: Initial delay between shard retries, in seconds
+        CRAWL_STALE_TTL_HOURS: Age after which past seasons are re-crawled by incremental syncs
+        PIPELINE_QUEUE_SIZE: Capacity of each queue between ingestion pipeline stages
+        PIPELINE_PARSE_WORKERS: Number of pages parsed at once by the ingestion pipeline
+        HTTP_CACHE_BACKEND: Upstream response cache storage: "none", "disk" or "postgres"
+        HTTP_CACHE_DIR: Directory of the disk response cache
+        TEAM_CACHE_TTL_SECONDS: Age after which cached teams are served as stale and refreshed
+        TEAM_CLAIM_POLL_INTERVAL: Seconds between cache checks while another worker loads the same teams
+        TEAM_CLAIM_TIMEOUT: Maximum seconds to wait for teams loaded by another worker
+        LIVE_RESULTS_TIMEOUT: Timeout of live results page requests, in seconds
+        LIVE_RESULTS_STREAMING: Whether team names are extracted from live results pages while they download
+        LIVE_RESULTS_BREAKER_FAILURES: Consecutive live results failures that open the circuit breaker
+        LIVE_RESULTS_BREAKER_COOLDOWN: Seconds the live results circuit breaker stays open
+        LIVE_RESULTS_PAGES: Live results pages ingested for every event, defaults to LIVE_RESULTS_PATH
+        RESULTS_MAX_LIMIT: Maximum number of results returned by one search
+        LIVE_POLL_ENABLED: Whether live results of running events are polled in the background
+        LIVE_POLL_MIN_INTERVAL: Seconds between polls of a page whose results are changing
+        LIVE_POLL_MAX_INTERVAL: Maximum seconds between polls of an unchanged page
+        LIVE_POLL_BACKOFF: Factor the poll interval grows by after each unchanged poll
+        LIVE_POLL_DISCOVERY_INTERVAL: Seconds between searches for running events
+        NOTIFY_ENABLED: Whether workers listen for change notifications from Postgres
+        NOTIFY_CHANNEL: Postgres NOTIFY channel carrying event and live result changes
+        NOTIFY_RECONNECT_DELAY: Seconds before re-opening a lost notification connection
+        SSE_QUEUE_SIZE: Messages buffered per stream subscriber before it is asked to resync
+        SSE_KEEPALIVE_SECONDS: Seconds between keep-alive comments on an idle stream
+        SEASON_CRAWL_CONCURRENCY: Maximum number of events whose live results are fetched at once by a season team crawl
+        SEASON_CRAWL_HOST_DELAY: Minimum seconds between requests to one host during a season team crawl
+        ENRICHMENT_ENABLED: Whether ingestion crawls the detail pages of new and changed events
+        ENRICHMENT_CONCURRENCY: Maximum number of event detail pages crawled at once
+        ENRICHMENT_MAX_EVENTS: Maximum number of event detail pages crawled per ingestion run
+        EVENTS_CACHE_MAX_ENTRIES: Maximum number of filter combinations whose /api/events responses are cached
+        EVENTS_CACHE_MAX_BYTES: Maximum total size of the cached /api/events responses
+        EVENTS_CACHE_TTL_SECONDS: Seconds a cached /api/events response is served
+        CACHE_INVALIDATION_CHANNEL: Postgres NOTIFY channel telling workers which cached data changed
+        TEAM_LOCAL_CACHE_MAX_ENTRIES: Maximum number of team cache entries kept in worker memory
+        TEAM_LOCAL_CACHE_TTL_SECONDS: Seconds a team cache entry is served from worker memory
+        EVENTS_CDN_MAX_AGE: Seconds shared caches may serve an /api/events response without revalidating
+        EVENTS_STALE_WHILE_REVALIDATE: Seconds shared caches may serve a stale /api/events response while revalidating it
+        TEAMS_CDN_MAX_AGE: Seconds shared caches may serve an /api/teams response without revalidating
+        TEAMS_STALE_WHILE_REVALIDATE: Seconds shared caches may serve a stale /api/teams response while revalidating it
+        EVENTS_PAGE_MAX_LIMIT: Maximum number of events on one /api/events page
     """
 
     PROJECT_NAME: str = "cfr-search"
@@ -30,6 +92,82 @@ class Settings(BaseSettings):
     # Words that should filter out events
     REJECTED_WORDS: list = ["ОТМЕНЕНО", "ОТМЕНЕНЫ"]
     ORIGINS: list = ["*"]
+    # Shared upstream HTTP client
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 4
+    HTTP_USER_AGENT: str = "cfr-search/1.0"
+    # Background ingestion jobs
+    INGESTION_WORKERS: int = 1
+    INGESTION_JOB_HISTORY: int = 100
+    INGESTION_CHUNK_SIZE: int = 500
+    INGESTION_ATTACH_POLL_INTERVAL: float = 2.0
+    INGESTION_ATTACH_TIMEOUT: float = 3600.0
+    # Calendar HTML parser backend
+    HTML_PARSER_BACKEND: str = "lxml"
+    PARSE_POOL_SIZE: int = 2
+    PARSE_CHUNK_LINKS: int = 200
+    # Sharded calendar crawl
+    CRAWL_CONCURRENCY: int = 4
+    CRAWL_SPLIT_FILTERS: list = ["types"]
+    CRAWL_YEARS_AHEAD: int = 2
+    CRAWL_SHARD_RETRIES: int = 2
+    CRAWL_RETRY_BACKOFF: float = 1.0
+    CRAWL_STALE_TTL_HOURS: float = 168.0
+    # Streaming ingestion pipeline
+    PIPELINE_QUEUE_SIZE: int = 8
+    PIPELINE_PARSE_WORKERS: int = 2
+    # Conditional-GET cache of upstream pages
+    HTTP_CACHE_BACKEND: str = "disk"
+    HTTP_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "cfr-search-http-cache")
+    # Team cache
+    TEAM_CACHE_TTL_SECONDS: float = 3600.0
+    TEAM_CLAIM_POLL_INTERVAL: float = 0.5
+    TEAM_CLAIM_TIMEOUT: float = 60.0
+    # Live results circuit breaker
+    LIVE_RESULTS_TIMEOUT: float = 10.0
+    LIVE_RESULTS_STREAMING: bool = True
+    LIVE_RESULTS_BREAKER_FAILURES: int = 5
+    LIVE_RESULTS_BREAKER_COOLDOWN: float = 30.0
+    # Live results ingestion
+    LIVE_RESULTS_PAGES: list = []
+    RESULTS_MAX_LIMIT: int = 1000
+    # Live results poller
+    LIVE_POLL_ENABLED: bool = True
+    LIVE_POLL_MIN_INTERVAL: float = 15.0
+    LIVE_POLL_MAX_INTERVAL: float = 300.0
+    LIVE_POLL_BACKOFF: float = 2.0
+    LIVE_POLL_DISCOVERY_INTERVAL: float = 600.0
+    # Change notifications and event streams
+    NOTIFY_ENABLED: bool = True
+    NOTIFY_CHANNEL: str = "cfr_search_changes"
+    NOTIFY_RECONNECT_DELAY: float = 5.0
+    SSE_QUEUE_SIZE: int = 100
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+    # Season team crawl
+    SEASON_CRAWL_CONCURRENCY: int = 8
+    SEASON_CRAWL_HOST_DELAY: float = 0.25
+    # Event detail page enrichment
+    ENRICHMENT_ENABLED: bool = True
+    ENRICHMENT_CONCURRENCY: int = 4
+    ENRICHMENT_MAX_EVENTS: int = 200
+    # Events response cache
+    EVENTS_CACHE_MAX_ENTRIES: int = 256
+    EVENTS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    EVENTS_CACHE_TTL_SECONDS: float = 3600.0
+    # Cross-worker cache invalidation
+    CACHE_INVALIDATION_CHANNEL: str = "cfr_search_invalidate"
+    TEAM_LOCAL_CACHE_MAX_ENTRIES: int = 256
+    TEAM_LOCAL_CACHE_TTL_SECONDS: float = 3600.0
+    # HTTP caching of read endpoints
+    EVENTS_CDN_MAX_AGE: int = 60
+    EVENTS_STALE_WHILE_REVALIDATE: int = 600
+    TEAMS_CDN_MAX_AGE: int = 300
+    TEAMS_STALE_WHILE_REVALIDATE: int = 3600
+    # Event list pagination
+    EVENTS_PAGE_MAX_LIMIT: int = 1000
 
 
 class Config:
@@ -80,16 +80,24 @@ async def startup_event() -> None:
                 type VARCHAR(255),
                 groups TEXT[],
                 disciplines TEXT[],
+                content_hash VARCHAR(64),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """))
         await conn.commit()
 
+        await conn.execute(text("""
+            ALTER TABLE events ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)
+        """))
+        await conn.commit()
+
         await conn.execute(text("""
             CREATE TABLE IF NOT EXISTS team_cache (
                 id SERIAL PRIMARY KEY,
-                year VARCHAR(10) UNIQUE NOT NULL,
+                year VARCHAR(10) NOT NULL,
+                event_link VARCHAR(255) NOT NULL DEFAULT '',
+                event_name VARCHAR(255),
                 teams TEXT[] NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -101,3 +109,145 @@ async def startup_event() -> None:
             CREATE INDEX IF NOT EXISTS idx_team_cache_year ON team_cache(year)
         """))
         await conn.commit()
+
+        # Team cache entries are keyed by year and event
+        await conn.execute(text("""
+            ALTER TABLE team_cache
+                ADD COLUMN IF NOT EXISTS event_link VARCHAR(255) NOT NULL DEFAULT '',
+                ADD COLUMN IF NOT EXISTS event_name VARCHAR(255),
+                DROP CONSTRAINT IF EXISTS team_cache_year_key
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_team_cache_year_event
+                ON team_cache(year, event_link)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag VARCHAR(255),
+                last_modified VARCHAR(255),
+                body_hash VARCHAR(64),
+                encoding VARCHAR(64),
+                body BYTEA,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                shard_key TEXT PRIMARY KEY,
+                year VARCHAR(10),
+                content_hash VARCHAR(64),
+                event_count INTEGER DEFAULT 0,
+                last_crawled_at TIMESTAMP
+            )
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_crawl_state_year ON crawl_state(year)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS ingestion_runs (
+                key TEXT PRIMARY KEY,
+                run_id VARCHAR(32) NOT NULL,
+                status VARCHAR(16) NOT NULL,
+                params JSONB,
+                result JSONB,
+                error TEXT,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS results (
+                id SERIAL PRIMARY KEY,
+                event_link VARCHAR(255) NOT NULL,
+                page VARCHAR(255) NOT NULL,
+                group_name VARCHAR(64),
+                discipline VARCHAR(64),
+                round VARCHAR(64),
+                athlete VARCHAR(255) NOT NULL,
+                team VARCHAR(255) NOT NULL DEFAULT '',
+                place INTEGER,
+                score VARCHAR(64),
+                content_hash VARCHAR(64),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (event_link, page, athlete, team)
+            )
+        """))
+        await conn.commit()
+
+        # Prefix lookups by athlete and team
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_results_athlete
+                ON results (lower(athlete) text_pattern_ops)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_results_team
+                ON results (lower(team) text_pattern_ops)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_results_event_link ON results(event_link)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS result_pages (
+                event_link VARCHAR(255) NOT NULL,
+                page VARCHAR(255) NOT NULL,
+                body_hash VARCHAR(64) NOT NULL,
+                ingested_at TIMESTAMP,
+                PRIMARY KEY (event_link, page)
+            )
+        """))
+        await conn.commit()
+
+        # The unique (team, event_link) index serves "events of a team" lookups
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS team_events (
+                id SERIAL PRIMARY KEY,
+                team TEXT NOT NULL,
+                event_link VARCHAR(255) NOT NULL,
+                event_name VARCHAR(255),
+                year VARCHAR(10),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (team, event_link)
+            )
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_team_events_event_link ON team_events(event_link)
+        """))
+        await conn.commit()
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS event_details (
+                link VARCHAR(255) PRIMARY KEY,
+                regulations JSONB NOT NULL DEFAULT '[]',
+                results JSONB NOT NULL DEFAULT '[]',
+                protocols JSONB NOT NULL DEFAULT '[]',
+                documents JSONB NOT NULL DEFAULT '[]',
+                event_hash VARCHAR(64),
+                body_hash VARCHAR(64),
+                error TEXT,
+                fetched_at TIMESTAMP,
+                updated_at TIMESTAMP
+            )
+        """))
+        await conn.commit()
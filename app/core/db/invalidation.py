@@ -0,0 +1,157 @@
+"""Cross-worker invalidation of process-local caches."""
+
+import json
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.config import settings
+from app.core.db.notify import (
+    PgListener,
+    encode_payload,
+    listener,
+    send_in_transaction,
+    split_payload,
+)
+
+# Identifies notifications sent by this process, which has already
+# invalidated its own caches when they arrive
+ORIGIN = uuid.uuid4().hex
+
+# Called with the affected years and links of an invalidation
+EvictCallback = Callable[[List[str], List[str]], None]
+
+
+def invalidation_payloads(
+    scope: str, years: Iterable[str] = (), links: Iterable[str] = ()
+) -> List[str]:
+    """
+    Build the notification payloads of an invalidation.
+
+    Years are few and always sent whole in every payload; links are
+    spread over as many payloads as needed.
+
+    Args:
+        scope: Kind of cached data that changed, e.g. "events" or "teams"
+        years: Affected competition years
+        links: Affected event links
+
+    Returns:
+        List of encoded payloads
+    """
+    base = {"scope": scope, "origin": ORIGIN, "years": sorted(set(years))}
+    links = sorted(set(links))
+    if not links:
+        return [encode_payload({**base, "links": []})] if base["years"] else []
+    return split_payload(base, "links", links)
+
+
+class InvalidationBus:
+    """
+    Keeps process-local caches in step with the database across workers.
+
+    Caches register an evict callback per scope. Writers call notify()
+    inside the transaction of their write, so every worker hears about
+    it once the write commits, and invalidate() after the commit, so the
+    writing worker itself never serves a stale entry. Notifications are
+    missed while the listener connection is down, so every cache is
+    cleared when it reconnects.
+    """
+
+    def __init__(self, pg_listener: Optional[PgListener] = None):
+        """
+        Initialize InvalidationBus.
+
+        Args:
+            pg_listener: Listener delivering notifications, defaults to the shared one
+        """
+        self.listener = pg_listener or listener
+        self._evict_callbacks: Dict[str, List[EvictCallback]] = {}
+        self._clear_callbacks: List[Callable[[], None]] = []
+        self._started = False
+
+    def register(
+        self, scope: str, evict: EvictCallback, clear: Callable[[], None]
+    ) -> None:
+        """
+        Register a process-local cache.
+
+        Args:
+            scope: Kind of cached data the cache holds
+            evict: Called with the affected years and links of an invalidation
+            clear: Called to drop the whole cache when notifications were missed
+        """
+        self._evict_callbacks.setdefault(scope, []).append(evict)
+        self._clear_callbacks.append(clear)
+
+    async def start(self) -> None:
+        """Start receiving invalidations. Called on application startup."""
+        if not self._started:
+            self.listener.add_listener(settings.CACHE_INVALIDATION_CHANNEL, self.handle)
+            self.listener.add_reconnect_callback(self.clear)
+            self._started = True
+
+    async def notify(
+        self,
+        db: Union[AsyncConnection, AsyncSession],
+        scope: str,
+        years: Iterable[str] = (),
+        links: Iterable[str] = (),
+    ) -> None:
+        """
+        Announce an invalidation to all workers when the transaction commits.
+
+        Args:
+            db: Connection or session holding the write
+            scope: Kind of cached data that changed
+            years: Affected competition years
+            links: Affected event links
+        """
+        if settings.NOTIFY_ENABLED:
+            await send_in_transaction(
+                db,
+                settings.CACHE_INVALIDATION_CHANNEL,
+                invalidation_payloads(scope, years, links),
+            )
+
+    def invalidate(
+        self, scope: str, years: Iterable[str] = (), links: Iterable[str] = ()
+    ) -> None:
+        """
+        Evict the affected entries of this process's caches.
+
+        Args:
+            scope: Kind of cached data that changed
+            years: Affected competition years
+            links: Affected event links
+        """
+        years, links = list(years), list(links)
+        for evict in self._evict_callbacks.get(scope, []):
+            try:
+                evict(years, links)
+            except Exception as e:
+                print(f"Error invalidating {scope} cache: {e}")
+
+    def handle(self, payload: str) -> None:
+        """
+        Apply an invalidation sent by another worker.
+
+        Args:
+            payload: Notification payload built by invalidation_payloads
+        """
+        data = json.loads(payload)
+        if data.get("origin") == ORIGIN:
+            return
+        self.invalidate(data["scope"], data.get("years", []), data.get("links", []))
+
+    def clear(self) -> None:
+        """Drop every registered cache."""
+        for clear in self._clear_callbacks:
+            try:
+                clear()
+            except Exception as e:
+                print(f"Error clearing cache: {e}")
+
+
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,201 @@
+"""Postgres LISTEN/NOTIFY shared by all application workers."""
+
+import asyncio
+import json
+from typing import Callable, Dict, List, Optional, Union
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.config import settings
+from app.core.db.database import DATABASE_URL, engine
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more, keep a margin
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+
+def listener_dsn() -> str:
+    """
+    Build the asyncpg DSN of the listener connection.
+
+    Returns:
+        DATABASE_URL without the SQLAlchemy driver suffix
+    """
+    return DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def encode_payload(payload: dict) -> str:
+    """Serialize a notification payload."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def split_payload(base: dict, key: str, items: list) -> List[str]:
+    """
+    Split a list into as few notification payloads as fit the NOTIFY limit.
+
+    Every payload is `base` with `key` set to a consecutive slice of `items`.
+    An item that does not fit even on its own is dropped.
+
+    Args:
+        base: Fields repeated in every payload
+        key: Name of the field holding the items
+        items: Items to spread over the payloads
+
+    Returns:
+        List of encoded payloads, empty if there are no items
+    """
+    overhead = len(encode_payload({**base, key: []}).encode("utf-8"))
+    payloads: List[str] = []
+    chunk: list = []
+    size = overhead
+    for item in items:
+        # One more byte for the separating comma
+        item_size = len(encode_payload(item).encode("utf-8")) + 1
+        if overhead + item_size > NOTIFY_PAYLOAD_LIMIT:
+            print(f"Dropping notification item of {item_size} bytes")
+            continue
+        if size + item_size > NOTIFY_PAYLOAD_LIMIT:
+            payloads.append(encode_payload({**base, key: chunk}))
+            chunk, size = [], overhead
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        payloads.append(encode_payload({**base, key: chunk}))
+    return payloads
+
+
+async def publish(channel: str, payloads: List[str]) -> None:
+    """
+    Send notifications to every worker listening on a channel.
+
+    All payloads are sent in one transaction, so listeners receive them
+    together and in order.
+
+    Args:
+        channel: Channel name
+        payloads: Encoded payloads, each below NOTIFY_PAYLOAD_LIMIT bytes
+    """
+    if not payloads:
+        return
+    async with engine.connect() as conn:
+        await send_in_transaction(conn, channel, payloads)
+        await conn.commit()
+
+
+async def send_in_transaction(
+    db: Union[AsyncConnection, AsyncSession], channel: str, payloads: List[str]
+) -> None:
+    """
+    Queue notifications in the current transaction of a connection or session.
+
+    Postgres delivers them only when the transaction commits, and drops
+    them if it rolls back, so listeners never hear of uncommitted writes.
+
+    Args:
+        db: Connection or session with an open transaction
+        channel: Channel name
+        payloads: Encoded payloads, each below NOTIFY_PAYLOAD_LIMIT bytes
+    """
+    for payload in payloads:
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": channel, "payload": payload},
+        )
+
+
+class PgListener:
+    """
+    Receives notifications on a dedicated asyncpg connection.
+
+    One listener per worker holds a single connection outside of the
+    SQLAlchemy pool, whatever the number of channels and callbacks.
+    The connection is re-opened after it is lost; notifications sent
+    while it was down are missed, so reconnect callbacks are called to
+    let consumers catch up.
+    """
+
+    def __init__(self, dsn: Optional[Callable[[], str]] = None):
+        """
+        Initialize PgListener.
+
+        Args:
+            dsn: Returns the DSN to connect to, defaults to listener_dsn
+        """
+        self.dsn = dsn or listener_dsn
+        self._callbacks: Dict[str, List[Callable[[str], None]]] = {}
+        self._reconnect_callbacks: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, channel: str, callback: Callable[[str], None]) -> None:
+        """
+        Call `callback` with the payload of every notification on a channel.
+
+        Callbacks run in the event loop and must not block; register them
+        before start().
+
+        Args:
+            channel: Channel name
+            callback: Function called with the payload string
+        """
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    def add_reconnect_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Call `callback` every time the connection is re-opened after a loss.
+
+        Args:
+            callback: Function called without arguments
+        """
+        self._reconnect_callbacks.append(callback)
+
+    async def start(self) -> None:
+        """Start listening. Called on application startup."""
+        if settings.NOTIFY_ENABLED and self._task is None and self._callbacks:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection. Called on application shutdown."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _notify(self, _conn, _pid: int, channel: str, payload: str) -> None:
+        """Pass a notification to the channel's callbacks."""
+        for callback in self._callbacks.get(channel, []):
+            try:
+                callback(payload)
+            except Exception as e:
+                print(f"Error handling notification on {channel}: {e}")
+
+    async def _listen_forever(self) -> None:
+        """Keep a listening connection open, re-opening it when it is lost."""
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn())
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                for channel in self._callbacks:
+                    await conn.add_listener(channel, self._notify)
+                print(f"Listening for notifications on {', '.join(self._callbacks)}")
+
+                if connected_before:
+                    for callback in self._reconnect_callbacks:
+                        callback()
+                connected_before = True
+                await lost.wait()
+                print("Notification connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error listening for notifications: {e}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(settings.NOTIFY_RECONNECT_DELAY)
+
+
+listener = PgListener()
@@ -0,0 +1,30 @@
+"""Detection of the charset a page declares."""
+
+import codecs
+import re
+from typing import Optional
+
+# Declared charset in the first bytes of a page
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w-]+)""", re.IGNORECASE)
+
+# Bytes inspected for a declared charset
+CHARSET_SNIFF_BYTES = 1024
+
+
+def sniff_encoding(head: bytes) -> Optional[str]:
+    """
+    Find the charset declared by a <meta> tag at the start of a page.
+
+    Args:
+        head: First bytes of the page
+
+    Returns:
+        Charset name, or None if none is declared or it is unknown
+    """
+    match = META_CHARSET_RE.search(head)
+    if match is None:
+        return None
+    try:
+        return codecs.lookup(match.group(1).decode("ascii")).name
+    except (LookupError, UnicodeDecodeError):
+        return None
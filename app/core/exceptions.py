@@ -17,6 +17,20 @@ class TeamNotFoundException(HTTPException):
         super().__init__(status_code=404, detail=message)
 
 
+class JobNotFoundException(HTTPException):
+    """Raised when a background job is not found."""
+
+    def __init__(self, message: str = "Job not found"):
+        super().__init__(status_code=404, detail=message)
+
+
+class InvalidCursorException(HTTPException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(status_code=400, detail=message)
+
+
 class DatabaseError(HTTPException):
     """Raised when a database operation fails."""
 
@@ -0,0 +1,379 @@
+"""Conditional-GET response cache for upstream pages."""
+
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import aiofiles
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.encoding import CHARSET_SNIFF_BYTES, sniff_encoding
+from app.core.http_client import HttpClient, get_http_client
+
+# Builds the repository of the http_cache table for a session; it must
+# provide get_by_url(url) and save(values), see HttpCacheRepository
+RepositoryFactory = Callable[[AsyncSession], Any]
+
+
+@dataclass
+class CachedResponse:
+    """
+    Validators and body of the last response for a URL.
+
+    Attributes:
+        url: Requested URL
+        etag: ETag header value
+        last_modified: Last-Modified header value
+        body_hash: SHA-256 hash of the body
+        encoding: Charset from the Content-Type header, None if it has none
+        body: Response body
+        fetched_at: Timestamp of the fetch
+    """
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    encoding: Optional[str]
+    body: bytes
+    fetched_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of a cached fetch.
+
+    Attributes:
+        url: Requested URL
+        content: Response body (from cache on 304)
+        encoding: Charset from the Content-Type header, None if it has none
+        body_hash: SHA-256 hash of the body, for callers to compare with
+            the hash of the body they last processed
+    """
+
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    body_hash: str
+
+    @property
+    def text(self) -> str:
+        """
+        Response body decoded as text.
+
+        Pages used to be handed to BeautifulSoup as bytes, which honours a
+        charset declared in the page. To decode them the same way, the
+        header charset is used first, then the page's <meta> charset, then UTF-8.
+        """
+        encoding = (
+            self.encoding
+            or sniff_encoding(self.content[:CHARSET_SNIFF_BYTES])
+            or "utf-8"
+        )
+        return self.content.decode(encoding, errors="replace")
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached responses."""
+
+    @abstractmethod
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get the cached response for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            CachedResponse if found, None otherwise
+        """
+
+    @abstractmethod
+    async def set(self, entry: CachedResponse) -> None:
+        """
+        Store the response for a URL.
+
+        Args:
+            entry: Response to store
+        """
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing, making every fetch unconditional."""
+
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get the cached response for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Always None
+        """
+        return None
+
+    async def set(self, entry: CachedResponse) -> None:
+        """
+        Discard the response for a URL.
+
+        Args:
+            entry: Response to store
+        """
+        return None
+
+
+class DiskCacheBackend(CacheBackend):
+    """Backend storing responses as files in a local directory."""
+
+    def __init__(self, directory: str = settings.HTTP_CACHE_DIR):
+        """
+        Initialize DiskCacheBackend.
+
+        Args:
+            directory: Directory for cache files, created if missing
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """Get the base file path for a URL."""
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name)
+
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Read the cached response for a URL from its files.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            CachedResponse if both files exist and are readable, None otherwise
+        """
+        path = self._path(url)
+        try:
+            async with aiofiles.open(f"{path}.json", "r", encoding="utf-8") as f:
+                meta = json.loads(await f.read())
+            async with aiofiles.open(f"{path}.body", "rb") as f:
+                body = await f.read()
+        except (OSError, ValueError):
+            return None
+        meta["fetched_at"] = datetime.fromisoformat(meta["fetched_at"])
+        return CachedResponse(body=body, **meta)
+
+    async def set(self, entry: CachedResponse) -> None:
+        """
+        Write the response for a URL to its body and metadata files.
+
+        Args:
+            entry: Response to store
+        """
+        path = self._path(entry.url)
+        meta = asdict(entry)
+        del meta["body"]
+        meta["fetched_at"] = entry.fetched_at.isoformat()
+        # The body is written first so metadata never points at a missing body
+        async with aiofiles.open(f"{path}.body", "wb") as f:
+            await f.write(entry.body)
+        async with aiofiles.open(f"{path}.json", "w", encoding="utf-8") as f:
+            await f.write(json.dumps(meta))
+
+
+class PostgresCacheBackend(CacheBackend):
+    """Backend storing responses in the http_cache table, shared by all instances."""
+
+    def __init__(self, repository_factory: RepositoryFactory):
+        """
+        Initialize PostgresCacheBackend.
+
+        Args:
+            repository_factory: Builds the http_cache repository for a session
+        """
+        self.repository_factory = repository_factory
+
+    async def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get the cached response for a URL from the http_cache table.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            CachedResponse if found, None otherwise
+        """
+        async with AsyncSessionLocal() as session:
+            row = await self.repository_factory(session).get_by_url(url)
+        if row is None:
+            return None
+        return CachedResponse(
+            url=row.url,
+            etag=row.etag,
+            last_modified=row.last_modified,
+            body_hash=row.body_hash,
+            encoding=row.encoding,
+            body=row.body,
+            fetched_at=row.fetched_at,
+        )
+
+    async def set(self, entry: CachedResponse) -> None:
+        """
+        Insert or replace the response for a URL in the http_cache table.
+
+        Args:
+            entry: Response to store
+        """
+        async with AsyncSessionLocal() as session:
+            await self.repository_factory(session).save(asdict(entry))
+
+
+# Available cache backends, selected by settings.HTTP_CACHE_BACKEND
+CACHE_BACKENDS = {
+    "none": NullCacheBackend,
+    "disk": DiskCacheBackend,
+    "postgres": PostgresCacheBackend,
+}
+
+
+class CachingFetcher:
+    """
+    Fetcher that makes refetches conditional.
+
+    Sends If-None-Match / If-Modified-Since with the validators of the
+    cached response and serves the cached body on 304, so an unchanged
+    page costs no download. The cache is shared by every reader of a URL,
+    so it cannot tell whether a caller has processed a body: callers that
+    skip unchanged pages compare FetchResult.body_hash with the hash they
+    stored after their own successful write.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        client: Optional[HttpClient] = None,
+    ):
+        """
+        Initialize CachingFetcher.
+
+        Args:
+            backend: Cache storage backend, defaults to the configured backend
+            client: HTTP client, defaults to the shared application client
+        """
+        self._backend = backend
+        self.client = client
+
+    @property
+    def backend(self) -> CacheBackend:
+        """Cache storage backend, resolved on first use."""
+        if self._backend is None:
+            self._backend = get_cache_backend()
+        return self._backend
+
+    async def fetch(self, url: str, timeout: Optional[float] = None) -> FetchResult:
+        """
+        Fetch a URL, revalidating the cached copy if there is one.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds, defaults to the client's timeout
+
+        Returns:
+            FetchResult with the current body and its hash
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        cached = await self.backend.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        client = self.client or get_http_client()
+        if timeout is not None:
+            response = await client.get(url, headers=headers, timeout=timeout)
+        else:
+            response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            return FetchResult(
+                url=url,
+                content=cached.body,
+                encoding=cached.encoding,
+                body_hash=cached.body_hash,
+            )
+
+        response.raise_for_status()
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        await self.backend.set(
+            CachedResponse(
+                url=url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash,
+                encoding=response.charset_encoding,
+                body=body,
+            )
+        )
+        return FetchResult(
+            url=url,
+            content=body,
+            encoding=response.charset_encoding,
+            body_hash=body_hash,
+        )
+
+
+_cache_backend: Optional[CacheBackend] = None
+
+# Repository of the http_cache table, provided by configure_cache_backend
+_repository_factory: Optional[RepositoryFactory] = None
+
+
+def configure_cache_backend(repository_factory: RepositoryFactory) -> None:
+    """
+    Provide the http_cache repository used by the Postgres backend.
+
+    Called by the application on import, before anything is fetched.
+
+    Args:
+        repository_factory: Builds the http_cache repository for a session
+    """
+    global _repository_factory, _cache_backend
+    _repository_factory = repository_factory
+    _cache_backend = None
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    Get the configured response cache backend.
+
+    Returns:
+        Shared CacheBackend instance
+
+    Raises:
+        ValueError: If settings.HTTP_CACHE_BACKEND is unknown
+        RuntimeError: If the Postgres backend is selected before
+            configure_cache_backend was called
+    """
+    global _cache_backend
+    if _cache_backend is None:
+        backend_class = CACHE_BACKENDS.get(settings.HTTP_CACHE_BACKEND)
+        if backend_class is None:
+            raise ValueError(f"Unknown HTTP cache backend: {settings.HTTP_CACHE_BACKEND}")
+        if backend_class is PostgresCacheBackend:
+            if _repository_factory is None:
+                raise RuntimeError("HTTP cache repository is not configured")
+            _cache_backend = PostgresCacheBackend(_repository_factory)
+        else:
+            _cache_backend = backend_class()
+    return _cache_backend
@@ -0,0 +1,141 @@
+"""Shared asynchronous HTTP client for upstream scraping."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+
+class HttpClient:
+    """
+    Application-wide async HTTP client.
+
+    Wraps a single httpx.AsyncClient so every scraper shares one keep-alive
+    connection pool. On top of the global pool limits, the number of
+    simultaneous requests to a single host is capped by a per-host semaphore.
+    """
+
+    def __init__(
+        self,
+        timeout: float = settings.HTTP_TIMEOUT,
+        connect_timeout: float = settings.HTTP_CONNECT_TIMEOUT,
+        max_connections: int = settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections_per_host: int = settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+    ):
+        """
+        Initialize HttpClient.
+
+        Args:
+            timeout: Default read/write/pool timeout in seconds
+            connect_timeout: Connection establishment timeout in seconds
+            max_connections: Maximum number of connections in the pool
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            max_connections_per_host: Maximum number of concurrent requests per host
+        """
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            headers={"User-Agent": settings.HTTP_USER_AGENT},
+            follow_redirects=True,
+        )
+        self._max_connections_per_host = max_connections_per_host
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get (or create) the concurrency semaphore for the URL's host."""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a GET request through the shared pool.
+
+        Args:
+            url: Request URL
+            **kwargs: Extra arguments passed to httpx.AsyncClient.get
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        async with self._host_semaphore(url):
+            return await self._client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Send a GET request whose body is read incrementally.
+
+        The host's concurrency slot is held until the block exits, and
+        leaving the block early closes the connection without reading the
+        rest of the body.
+
+        Args:
+            url: Request URL
+            **kwargs: Extra arguments passed to httpx.AsyncClient.stream
+
+        Yields:
+            httpx.Response object with an unread body
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        async with self._host_semaphore(url):
+            async with self._client.stream("GET", url, **kwargs) as response:
+                yield response
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying client has been closed."""
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the underlying client and all pooled connections."""
+        await self._client.aclose()
+
+
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the application-wide HTTP client.
+
+    The client is normally created on application startup; it is created
+    lazily here as well so that code running outside the app lifespan
+    (scripts, serverless cold starts) still shares a single pool.
+
+    Returns:
+        Shared HttpClient instance
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = HttpClient()
+    return _http_client
+
+
+async def start_http_client() -> None:
+    """Create the shared HTTP client. Called on application startup."""
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
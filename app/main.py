@@ -8,7 +8,18 @@ from fastapi import Depends, FastAPI
 from app.core.config import settings
 from app.core.permissions import PermissionCheck
 from app.core.db.database import startup_event
-from app.api.v1 import events, teams
+from app.core.db.invalidation import invalidation_bus
+from app.core.db.notify import listener
+from app.core.http_cache import configure_cache_backend
+from app.core.http_client import close_http_client, start_http_client
+from app.repositories.http_cache_repository import HttpCacheRepository
+from app.services.broadcast import broadcast_hub
+from app.services.job_service import job_manager
+from app.services.live_poller import live_poller
+from app.services.season_crawl import stop_season_crawls
+from app.services.team_service import stop_team_refreshes
+from app.utils.parse_pool import shutdown_parse_pool
+from app.api.v1 import events, results, teams
 from app.schemas.event import BaseResponse
 from app.middleware.cors import setup_cors
 
@@ -28,6 +39,9 @@ app = FastAPI(
     ],
 )
 
+# The Postgres HTTP cache backend stores responses through HttpCacheRepository
+configure_cache_backend(HttpCacheRepository)
+
 # Setup middleware
 setup_cors(app, settings.ORIGINS)
 
@@ -42,6 +56,7 @@ setup_cors(app, settings.ORIGINS)
 # )
 
 app.include_router(events)
+app.include_router(results)
 app.include_router(teams)
 
 
@@ -86,6 +101,35 @@ async def startup() -> None:
     """
     Startup event handler.
 
-    Initializes database connection on application startup.
+    Initializes database connection, the shared HTTP client,
+    background ingestion workers, the live results poller, the
+    change notification listener and cross-worker cache invalidation
+    on application startup.
     """
     await startup_event()
+    await start_http_client()
+    await job_manager.start()
+    await live_poller.start()
+    await broadcast_hub.start()
+    await invalidation_bus.start()
+    await listener.start()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """
+    Shutdown event handler.
+
+    Stops the change notification listener, background ingestion
+    workers, the live results poller, team cache refreshes and season
+    team crawls, the parsing process pool and closes the shared HTTP
+    client.
+    """
+    await listener.stop()
+    await broadcast_hub.stop()
+    await job_manager.stop()
+    await live_poller.stop()
+    await stop_team_refreshes()
+    await stop_season_crawls()
+    shutdown_parse_pool()
+    await close_http_client()
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from app.models import Base
+
+
+class CrawlState(Base):
+    """
+    Database model for the crawl cursor of calendar shards.
+
+    Records when each shard (year and filter subset) was last crawled
+    so incremental syncs can skip shards that are still fresh.
+
+    Attributes:
+        shard_key: Unique shard identifier (primary key)
+        year: Year covered by the shard
+        content_hash: Hash of the shard's page body at the last crawl
+        event_count: Number of events found at the last crawl
+        last_crawled_at: Timestamp of the last successful crawl
+    """
+
+    __tablename__ = "crawl_state"
+
+    shard_key = Column(String, primary_key=True)
+    year = Column(String, index=True)
+    content_hash = Column(String(64), nullable=True)
+    event_count = Column(Integer, default=0)
+    last_crawled_at = Column(DateTime)
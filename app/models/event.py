@@ -21,6 +21,7 @@ class Event(Base):
         type: Competition type
         groups: List of participant groups
         disciplines: List of competition disciplines
+        content_hash: Hash of the parsed event content, used to detect changes
         created_at: Timestamp of record creation
         updated_at: Timestamp of last record update
     """
@@ -39,5 +40,6 @@ class Event(Base):
     type = Column(String)
     groups = Column(ARRAY(String))
     disciplines = Column(ARRAY(String))
+    content_hash = Column(String(64))
     created_at = Column(DateTime, server_default=text("now()"))
     updated_at = Column(DateTime, server_default=text("now()"), onupdate=text("now()"))
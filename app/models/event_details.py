@@ -0,0 +1,37 @@
+from sqlalchemy import Column, DateTime, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.models import Base
+
+
+class EventDetails(Base):
+    """
+    Database model for the fields extracted from an event's detail page.
+
+    Detail pages are crawled for new and changed events only: an entry is
+    current while its event_hash equals the content_hash of its event.
+
+    Attributes:
+        link: Event link (primary key)
+        regulations: Regulation documents, list of {"title", "url"}
+        results: Links to results, list of {"title", "url"}
+        protocols: Protocol files, list of {"title", "url"}
+        documents: Other attached files, list of {"title", "url"}
+        event_hash: Content hash of the event when its page was crawled
+        body_hash: Hash of the detail page body
+        error: Error of the last crawl, None if it succeeded
+        fetched_at: Timestamp of the last crawl
+        updated_at: Timestamp of the last change of the extracted fields
+    """
+
+    __tablename__ = "event_details"
+
+    link = Column(String, primary_key=True)
+    regulations = Column(JSONB, nullable=False, server_default=text("'[]'"))
+    results = Column(JSONB, nullable=False, server_default=text("'[]'"))
+    protocols = Column(JSONB, nullable=False, server_default=text("'[]'"))
+    documents = Column(JSONB, nullable=False, server_default=text("'[]'"))
+    event_hash = Column(String(64), nullable=True)
+    body_hash = Column(String(64), nullable=True)
+    error = Column(Text, nullable=True)
+    fetched_at = Column(DateTime)
+    updated_at = Column(DateTime)
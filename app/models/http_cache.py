@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DateTime, LargeBinary, String, text
+from app.models import Base
+
+
+class HttpCacheEntry(Base):
+    """
+    Database model for cached upstream HTTP responses.
+
+    Stores validators and body of the last response per URL so refetches
+    can be made conditional and shared between serverless instances.
+
+    Attributes:
+        url: Requested URL (primary key)
+        etag: ETag header of the last response
+        last_modified: Last-Modified header of the last response
+        body_hash: SHA-256 hash of the last response body
+        encoding: Text encoding of the last response body
+        body: Last response body
+        fetched_at: Timestamp of the last fetch
+    """
+
+    __tablename__ = "http_cache"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    body_hash = Column(String(64))
+    encoding = Column(String, nullable=True)
+    body = Column(LargeBinary)
+    fetched_at = Column(DateTime, server_default=text("now()"))
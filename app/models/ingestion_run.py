@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.models import Base
+
+
+class IngestionRun(Base):
+    """
+    Database model for the latest ingestion run of each filter set.
+
+    Shared by all application workers so a request that finds a run
+    already in progress elsewhere can wait for its outcome.
+
+    Attributes:
+        key: Normalized filter set of the run (primary key)
+        run_id: Identifier of the job performing the run
+        status: Run status: running, succeeded or failed
+        params: Ingestion parameters
+        result: Result of a successful run
+        error: Error message of a failed run
+        started_at: Start timestamp, UTC
+        finished_at: Finish timestamp, UTC
+    """
+
+    __tablename__ = "ingestion_runs"
+
+    key = Column(Text, primary_key=True)
+    run_id = Column(String(32), nullable=False)
+    status = Column(String(16), nullable=False)
+    params = Column(JSONB)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime, nullable=True)
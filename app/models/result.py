@@ -0,0 +1,43 @@
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint, text
+from app.models import Base
+
+
+class Result(Base):
+    """
+    Database model for a single row of a live results table.
+
+    Each live results page of an event covers one discipline, round and
+    group; every athlete's row on it is stored as one Result.
+
+    Attributes:
+        id: Primary key
+        event_link: Link of the event
+        page: Name of the live results page, e.g. "l_q_f13.html"
+        group_name: Participant group, taken from the page name
+        discipline: Discipline, taken from the page name
+        round: Round, taken from the page name
+        athlete: Athlete name
+        team: Team name
+        place: Place, None if it is not a number
+        score: Score as shown on the page
+        content_hash: Hash of the row, used to detect changes
+        created_at: Timestamp of record creation
+        updated_at: Timestamp of last record update
+    """
+
+    __tablename__ = "results"
+    __table_args__ = (UniqueConstraint("event_link", "page", "athlete", "team"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_link = Column(String, nullable=False, index=True)
+    page = Column(String, nullable=False)
+    group_name = Column(String, nullable=True)
+    discipline = Column(String, nullable=True)
+    round = Column(String, nullable=True)
+    athlete = Column(String, nullable=False)
+    team = Column(String, nullable=False, default="")
+    place = Column(Integer, nullable=True)
+    score = Column(String, nullable=True)
+    content_hash = Column(String(64))
+    created_at = Column(DateTime, server_default=text("now()"))
+    updated_at = Column(DateTime, server_default=text("now()"), onupdate=text("now()"))
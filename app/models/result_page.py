@@ -0,0 +1,24 @@
+from sqlalchemy import Column, DateTime, String
+from app.models import Base
+
+
+class ResultPage(Base):
+    """
+    Database model for the ingestion state of a live results page.
+
+    Records the hash of the page body whose rows were last written, so a
+    page is parsed again only when its body differs from it.
+
+    Attributes:
+        event_link: Link of the event (primary key)
+        page: Name of the live results page (primary key)
+        body_hash: Hash of the page body the stored rows were built from
+        ingested_at: Timestamp of the last successful write
+    """
+
+    __tablename__ = "result_pages"
+
+    event_link = Column(String, primary_key=True)
+    page = Column(String, primary_key=True)
+    body_hash = Column(String(64), nullable=False)
+    ingested_at = Column(DateTime)
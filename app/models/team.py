@@ -1,4 +1,4 @@
-from sqlalchemy import ARRAY, Column, DateTime, Integer, String, text
+from sqlalchemy import ARRAY, Column, DateTime, Integer, String, UniqueConstraint, text
 from app.models import Base
 
 
@@ -6,20 +6,27 @@ class TeamCache(Base):
     """
     Database model for caching team data.
 
-    Stores parsed team names for each competition year to avoid repeated parsing.
+    Stores parsed team names for each competition year and event to avoid
+    repeated parsing. Entries older than settings.TEAM_CACHE_TTL_SECONDS are
+    served as stale and refreshed in the background.
 
     Attributes:
         id: Primary key
-        year: Competition year (key for cache)
+        year: Competition year (key for cache, together with event_link)
+        event_link: Link of the event whose live results were parsed
+        event_name: Name of the event
         teams: Array of unique team names sorted alphabetically
         created_at: Timestamp of record creation
         updated_at: Timestamp of last record update
     """
 
     __tablename__ = "team_cache"
+    __table_args__ = (UniqueConstraint("year", "event_link"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    year = Column(String, unique=True, index=True)
+    year = Column(String, index=True)
+    event_link = Column(String, nullable=False, default="")
+    event_name = Column(String, nullable=True)
     teams = Column(ARRAY(String))
     created_at = Column(DateTime, server_default=text("now()"))
     updated_at = Column(DateTime, server_default=text("now()"), onupdate=text("now()"))
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint, text
+from app.models import Base
+
+
+class TeamEvent(Base):
+    """
+    Database model for the team to events inverted index.
+
+    One row per team seen on the live results pages of an event, so the
+    events a team attended are found with a single indexed query.
+
+    Attributes:
+        id: Primary key
+        team: Team name as shown on the live results pages
+        event_link: Link of the event
+        event_name: Name of the event
+        year: Competition year
+        created_at: Timestamp of record creation
+    """
+
+    __tablename__ = "team_events"
+    __table_args__ = (UniqueConstraint("team", "event_link"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    team = Column(String, nullable=False, index=True)
+    event_link = Column(String, nullable=False, index=True)
+    event_name = Column(String, nullable=True)
+    year = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=text("now()"))
@@ -1,6 +1,21 @@
 """Repository layer for data access operations."""
 
+from app.repositories.crawl_state_repository import CrawlStateRepository
+from app.repositories.event_details_repository import EventDetailsRepository
 from app.repositories.event_repository import EventRepository
+from app.repositories.http_cache_repository import HttpCacheRepository
+from app.repositories.ingestion_run_repository import IngestionRunRepository
+from app.repositories.result_repository import ResultRepository
+from app.repositories.team_event_repository import TeamEventRepository
 from app.repositories.team_repository import TeamRepository
 
-__all__ = ["EventRepository", "TeamRepository"]
+__all__ = [
+    "CrawlStateRepository",
+    "EventDetailsRepository",
+    "EventRepository",
+    "HttpCacheRepository",
+    "IngestionRunRepository",
+    "ResultRepository",
+    "TeamEventRepository",
+    "TeamRepository",
+]
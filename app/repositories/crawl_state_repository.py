@@ -0,0 +1,63 @@
+"""Repository for CrawlState data access operations."""
+
+from typing import Dict, List
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawl_state import CrawlState
+
+
+class CrawlStateRepository:
+    """Repository for CrawlState database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize CrawlStateRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_by_keys(self, shard_keys: List[str]) -> Dict[str, CrawlState]:
+        """
+        Get crawl state of several shards.
+
+        Args:
+            shard_keys: Shard identifiers
+
+        Returns:
+            Dictionary mapping shard key to CrawlState, for shards crawled before
+        """
+        if not shard_keys:
+            return {}
+        result = await self.db.execute(
+            select(CrawlState).where(CrawlState.shard_key.in_(shard_keys))
+        )
+        return {state.shard_key: state for state in result.scalars().all()}
+
+    async def save_states(self, rows: List[dict]) -> None:
+        """
+        Insert or update crawl state of several shards.
+
+        Args:
+            rows: CrawlState column dictionaries, each with a `shard_key`;
+                a None `event_count` keeps the stored count
+        """
+        if not rows:
+            return
+        stmt = insert(CrawlState).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CrawlState.shard_key],
+            set_={
+                "year": stmt.excluded.year,
+                "content_hash": stmt.excluded.content_hash,
+                "event_count": func.coalesce(
+                    stmt.excluded.event_count, CrawlState.event_count
+                ),
+                "last_crawled_at": stmt.excluded.last_crawled_at,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
@@ -0,0 +1,83 @@
+"""Repository for EventDetails data access operations."""
+
+from typing import List, Optional, Tuple
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event import Event
+from app.models.event_details import EventDetails
+
+
+class EventDetailsRepository:
+    """Repository for EventDetails database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize EventDetailsRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_by_link(self, link: str) -> Optional[EventDetails]:
+        """
+        Get the details of an event.
+
+        Args:
+            link: Event link
+
+        Returns:
+            EventDetails if the event's page was crawled, None otherwise
+        """
+        result = await self.db.execute(
+            select(EventDetails).where(EventDetails.link == link)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_pending(self, limit: int) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get events whose detail page has to be crawled.
+
+        An event is pending if its page was never crawled successfully or
+        the event changed since. Never attempted events come first, then
+        the latest events.
+
+        Args:
+            limit: Maximum number of events
+
+        Returns:
+            List of (link, content_hash) pairs
+        """
+        result = await self.db.execute(
+            select(Event.link, Event.content_hash)
+            .outerjoin(EventDetails, EventDetails.link == Event.link)
+            .where(
+                or_(
+                    EventDetails.link.is_(None),
+                    EventDetails.event_hash.is_distinct_from(Event.content_hash),
+                )
+            )
+            .order_by(
+                EventDetails.fetched_at.asc().nulls_first(),
+                Event.startdate.desc().nulls_last(),
+            )
+            .limit(limit)
+        )
+        return [(link, content_hash) for link, content_hash in result]
+
+    async def save(self, values: dict) -> None:
+        """
+        Insert or replace the details of an event.
+
+        Args:
+            values: EventDetails column values, including `link`
+        """
+        stmt = insert(EventDetails).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EventDetails.link],
+            set_={name: stmt.excluded[name] for name in values if name != "link"},
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
@@ -1,11 +1,30 @@
 """Repository for Event data access operations."""
 
-from typing import List, Optional
-from sqlalchemy import select
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import Select, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.db.invalidation import invalidation_bus
 from app.models.event import Event
 
+# Columns written by the bulk upsert; `link` is the conflict target
+UPSERT_COLUMNS = (
+    "date",
+    "year",
+    "rank",
+    "startdate",
+    "enddate",
+    "name",
+    "location",
+    "type",
+    "groups",
+    "disciplines",
+    "content_hash",
+)
+
 
 class EventRepository:
     """Repository for Event database operations."""
@@ -37,9 +56,14 @@ class EventRepository:
         types: Optional[List[str]] = None,
         groups: Optional[List[str]] = None,
         disciplines: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Event]:
         """
-        Get events with optional filtering.
+        Get events with optional filtering, ordered by link.
+
+        The order and the `after` bound use the unique index on `link`, so
+        a page of `limit` events costs the same at any offset and table size.
 
         Args:
             start_date: Filter events starting after this date
@@ -48,9 +72,11 @@ class EventRepository:
             types: Filter events by type
             groups: Filter events by groups
             disciplines: Filter events by disciplines
+            after: Only return events whose link sorts after this one
+            limit: Maximum number of events, all if None
 
         Returns:
-            List of Event objects matching the filter criteria
+            List of Event objects matching the filter criteria, ordered by link
         """
         print(
             f"get_by_filters called with start_date={start_date}, end_date={end_date}"
@@ -59,8 +85,121 @@ class EventRepository:
             f"ranks={ranks}, types={types}, groups={groups}, disciplines={disciplines}"
         )
 
-        query = select(Event)
+        query = self._apply_filters(
+            select(Event), start_date, end_date, ranks, types, groups, disciplines
+        )
+        query = self._page(query, after, limit)
+
+        result = await self.db.execute(query)
+        events = list(result.scalars().all())
+        print(f"Found {len(events)} events")
+        return events
+
+    async def get_rows_by_filters(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        ranks: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+        disciplines: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Get the columns of events with optional filtering, ordered by link.
+
+        Like get_by_filters, but selects the columns of EventResponse as
+        plain dictionaries without building ORM objects, with empty start
+        and end dates turned into NULL by the database.
+
+        Args:
+            start_date: Filter events starting after this date
+            end_date: Filter events ending before this date
+            ranks: Filter events by rank
+            types: Filter events by type
+            groups: Filter events by groups
+            disciplines: Filter events by disciplines
+            after: Only return events whose link sorts after this one
+            limit: Maximum number of events, all if None
+
+        Returns:
+            List of column dictionaries matching the filter criteria, ordered by link
+        """
+        query = select(
+            Event.date,
+            Event.year,
+            Event.rank,
+            func.nullif(Event.startdate, "").label("startdate"),
+            func.nullif(Event.enddate, "").label("enddate"),
+            Event.link,
+            Event.name,
+            Event.location,
+            Event.type,
+            Event.groups,
+            Event.disciplines,
+            Event.id,
+            Event.created_at,
+            Event.updated_at,
+        )
+        query = self._apply_filters(
+            query, start_date, end_date, ranks, types, groups, disciplines
+        )
+        query = self._page(query, after, limit)
+
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_validator(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        ranks: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+        disciplines: Optional[List[str]] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get the latest update time and number of the events matching filters.
+
+        Every write of events changes one of the two, so together with the
+        filter they validate a cached list of events without loading it.
+
+        Args:
+            start_date: Filter events starting after this date
+            end_date: Filter events ending before this date
+            ranks: Filter events by rank
+            types: Filter events by type
+            groups: Filter events by groups
+            disciplines: Filter events by disciplines
+
+        Returns:
+            Tuple of (latest updated_at or None if no event matches, number of events)
+        """
+        query = self._apply_filters(
+            select(func.max(Event.updated_at), func.count()).select_from(Event),
+            start_date,
+            end_date,
+            ranks,
+            types,
+            groups,
+            disciplines,
+        )
+        result = await self.db.execute(query)
+        updated_at, count = result.one()
+        return updated_at, count
 
+    @staticmethod
+    def _apply_filters(
+        query: Select,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        ranks: Optional[List[str]],
+        types: Optional[List[str]],
+        groups: Optional[List[str]],
+        disciplines: Optional[List[str]],
+    ) -> Select:
+        """Add the conditions of the event filters to a query."""
         # Apply date range filter
         if start_date:
             print(f"Applying start_date filter: {start_date}")
@@ -89,10 +228,17 @@ class EventRepository:
             print(f"Applying disciplines filter: {disciplines}")
             query = query.where(Event.disciplines.overlap(disciplines))
 
-        result = await self.db.execute(query)
-        events = list(result.scalars().all())
-        print(f"Found {len(events)} events")
-        return events
+        return query
+
+    @staticmethod
+    def _page(query: Select, after: Optional[str], limit: Optional[int]) -> Select:
+        """Order a query by link and restrict it to one page."""
+        if after is not None:
+            query = query.where(Event.link > after)
+        query = query.order_by(Event.link)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
     async def exists_by_link(self, link: str) -> bool:
         """
@@ -123,3 +269,117 @@ class EventRepository:
             select(Event.link).where(Event.link.in_(batch_links))
         )
         return set(link[0] for link in result.fetchall())
+
+    async def get_by_links(self, links: List[str]) -> List[Event]:
+        """
+        Get events by their links.
+
+        Args:
+            links: Event links
+
+        Returns:
+            List of Event objects ordered by link, unknown links are ignored
+        """
+        if not links:
+            return []
+        result = await self.db.execute(
+            select(Event).where(Event.link.in_(links)).order_by(Event.link)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_year(self, year: str) -> List[Event]:
+        """
+        Get all events of a year.
+
+        Args:
+            year: Competition year
+
+        Returns:
+            List of Event objects ordered by link
+        """
+        result = await self.db.execute(
+            select(Event).where(Event.year == year).order_by(Event.link)
+        )
+        return list(result.scalars().all())
+
+    async def get_running(self, today: str) -> List[Event]:
+        """
+        Get events taking place on a given day.
+
+        Args:
+            today: Day (format: YYYY-MM-DD)
+
+        Returns:
+            List of Event objects whose startdate..enddate range covers the day
+        """
+        result = await self.db.execute(
+            select(Event).where(
+                Event.startdate != "",
+                Event.startdate <= today,
+                Event.enddate >= today,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def upsert_events(
+        self, rows: List[dict], chunk_size: int = settings.INGESTION_CHUNK_SIZE
+    ) -> dict:
+        """
+        Insert or update events in bulk.
+
+        Each chunk is written with a single multi-row
+        `INSERT ... ON CONFLICT (link) DO UPDATE` statement. Existing rows are
+        only updated when their `content_hash` differs, so unchanged events
+        cost one hash comparison and keep their `updated_at`. Each chunk is
+        committed separately; a chunk that wrote events announces their
+        years and links on the cache invalidation bus in the same
+        transaction, and evicts them from this process's caches once
+        committed.
+
+        Args:
+            rows: Event column dictionaries, each with a non-empty `link` and `content_hash`
+            chunk_size: Number of rows written per statement
+
+        Returns:
+            Dictionary with `inserted`, `updated` and `skipped` counts and
+            `written_links`, the links of the inserted and updated events
+        """
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
+        written_links: List[str] = []
+
+        # A statement cannot touch the same row twice, keep the last row per link
+        unique_rows = list({row["link"]: row for row in rows}.values())
+        counts["skipped"] += len(rows) - len(unique_rows)
+
+        for i in range(0, len(unique_rows), chunk_size):
+            chunk = unique_rows[i : i + chunk_size]
+            stmt = insert(Event).values(chunk)
+            changed = Event.content_hash.is_distinct_from(stmt.excluded.content_hash)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Event.link],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    "updated_at": func.now(),
+                },
+                where=changed,
+            ).returning(
+                Event.link, Event.year, literal_column("xmax = 0").label("inserted")
+            )
+
+            result = await self.db.execute(stmt)
+            written = list(result.all())
+            years = [row.year for row in written if row.year]
+            links = [row.link for row in written]
+            if written:
+                await invalidation_bus.notify(self.db, "events", years, links)
+            await self.db.commit()
+            if written:
+                invalidation_bus.invalidate("events", years, links)
+
+            inserted = sum(1 for row in written if row.inserted)
+            counts["inserted"] += inserted
+            counts["updated"] += len(written) - inserted
+            counts["skipped"] += len(chunk) - len(written)
+            written_links.extend(links)
+
+        return {**counts, "written_links": written_links}
@@ -0,0 +1,51 @@
+"""Repository for HttpCacheEntry data access operations."""
+
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.http_cache import HttpCacheEntry
+
+
+class HttpCacheRepository:
+    """Repository for HttpCacheEntry database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize HttpCacheRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_by_url(self, url: str) -> Optional[HttpCacheEntry]:
+        """
+        Get cached response for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            HttpCacheEntry object if found, None otherwise
+        """
+        result = await self.db.execute(
+            select(HttpCacheEntry).where(HttpCacheEntry.url == url).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def save(self, values: dict) -> None:
+        """
+        Insert or replace cached response for a URL.
+
+        Args:
+            values: HttpCacheEntry column values, including `url`
+        """
+        stmt = insert(HttpCacheEntry).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HttpCacheEntry.url],
+            set_={key: stmt.excluded[key] for key in values if key != "url"},
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
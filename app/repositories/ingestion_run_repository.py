@@ -0,0 +1,73 @@
+"""Repository for IngestionRun data access operations."""
+
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ingestion_run import IngestionRun
+
+
+class IngestionRunRepository:
+    """Repository for IngestionRun database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize IngestionRunRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_by_key(self, key: str) -> Optional[IngestionRun]:
+        """
+        Get the latest run of a filter set.
+
+        Args:
+            key: Normalized filter set
+
+        Returns:
+            IngestionRun if the filter set was ever ingested, None otherwise
+        """
+        result = await self.db.execute(
+            select(IngestionRun)
+            .where(IngestionRun.key == key)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_run_id(self, run_id: str) -> Optional[IngestionRun]:
+        """
+        Get a run by the id of the job that performed it.
+
+        Only the latest run of each filter set is kept, so older runs are
+        not found.
+
+        Args:
+            run_id: Job identifier
+
+        Returns:
+            IngestionRun if it is the latest run of its filter set, None otherwise
+        """
+        result = await self.db.execute(
+            select(IngestionRun)
+            .where(IngestionRun.run_id == run_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def save(self, values: dict) -> None:
+        """
+        Insert or replace the latest run of a filter set.
+
+        Args:
+            values: IngestionRun column values, including `key`
+        """
+        stmt = insert(IngestionRun).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IngestionRun.key],
+            set_={name: stmt.excluded[name] for name in values if name != "key"},
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
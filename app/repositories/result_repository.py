@@ -0,0 +1,235 @@
+"""Repository for Result data access operations."""
+
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.result import Result
+from app.models.result_page import ResultPage
+
+# Columns overwritten when a result row changes
+UPSERT_COLUMNS = (
+    "group_name",
+    "discipline",
+    "round",
+    "place",
+    "score",
+    "content_hash",
+)
+
+
+def _prefix_pattern(value: str) -> str:
+    """Build a LIKE pattern matching values starting with `value`, lowercased."""
+    escaped = value.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+class ResultRepository:
+    """Repository for Result database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize ResultRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def get_page_hashes(
+        self, event_link: str, page: str
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Get content hashes of the stored rows of a live results page.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+
+        Returns:
+            Dictionary mapping (athlete, team) to the row's content hash
+        """
+        result = await self.db.execute(
+            select(Result.athlete, Result.team, Result.content_hash).where(
+                Result.event_link == event_link, Result.page == page
+            )
+        )
+        return {(athlete, team): content_hash for athlete, team, content_hash in result}
+
+    async def get_event_rows(self, event_link: str) -> List[dict]:
+        """
+        Get the stored rows of all live results pages of an event.
+
+        Args:
+            event_link: Event link
+
+        Returns:
+            List of Result column dictionaries, without id and timestamps,
+            ordered by page and place
+        """
+        result = await self.db.execute(
+            select(
+                Result.event_link,
+                Result.page,
+                Result.group_name,
+                Result.discipline,
+                Result.round,
+                Result.athlete,
+                Result.team,
+                Result.place,
+                Result.score,
+                Result.content_hash,
+            )
+            .where(Result.event_link == event_link)
+            .order_by(Result.page, Result.place.asc().nulls_last(), Result.athlete)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    async def upsert_results(self, rows: List[dict]) -> Dict[str, int]:
+        """
+        Insert new result rows and update changed ones.
+
+        Args:
+            rows: Result column dictionaries
+
+        Returns:
+            Dictionary with numbers of inserted, updated and skipped rows
+        """
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
+        if not rows:
+            return counts
+
+        stmt = insert(Result).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Result.event_link, Result.page, Result.athlete, Result.team],
+            set_={
+                **{name: stmt.excluded[name] for name in UPSERT_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=Result.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        ).returning(literal_column("xmax = 0").label("inserted"))
+
+        result = await self.db.execute(stmt)
+        flags = [row.inserted for row in result]
+        await self.db.commit()
+
+        counts["inserted"] = sum(1 for inserted in flags if inserted)
+        counts["updated"] = len(flags) - counts["inserted"]
+        counts["skipped"] = len(rows) - len(flags)
+        return counts
+
+    async def delete_results(
+        self, event_link: str, page: str, keys: List[Tuple[str, str]]
+    ) -> int:
+        """
+        Delete rows that disappeared from a live results page.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+            keys: (athlete, team) pairs to delete
+
+        Returns:
+            Number of deleted rows
+        """
+        if not keys:
+            return 0
+        result = await self.db.execute(
+            delete(Result).where(
+                Result.event_link == event_link,
+                Result.page == page,
+                tuple_(Result.athlete, Result.team).in_(keys),
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def get_page_body_hash(self, event_link: str, page: str) -> Optional[str]:
+        """
+        Get the hash of the page body the stored rows of a page were built from.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+
+        Returns:
+            Body hash, None if the page was never ingested
+        """
+        result = await self.db.execute(
+            select(ResultPage.body_hash).where(
+                ResultPage.event_link == event_link, ResultPage.page == page
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def save_page_body_hash(self, event_link: str, page: str, body_hash: str) -> None:
+        """
+        Record the hash of the page body whose rows were written.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+            body_hash: Hash of the page body
+        """
+        stmt = insert(ResultPage).values(
+            event_link=event_link, page=page, body_hash=body_hash, ingested_at=func.now()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResultPage.event_link, ResultPage.page],
+            set_={"body_hash": stmt.excluded.body_hash, "ingested_at": func.now()},
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def search(
+        self,
+        athlete: Optional[str] = None,
+        team: Optional[str] = None,
+        event_link: Optional[str] = None,
+        discipline: Optional[str] = None,
+        round_: Optional[str] = None,
+        group: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Result]:
+        """
+        Search stored results.
+
+        Athlete and team are matched case-insensitively by prefix, which is
+        served by the lower(...) text_pattern_ops indexes.
+
+        Args:
+            athlete: Athlete name prefix
+            team: Team name prefix
+            event_link: Event link
+            discipline: Discipline
+            round_: Round
+            group: Participant group
+            limit: Maximum number of rows
+
+        Returns:
+            List of Result objects ordered by event, page and place
+        """
+        query = select(Result)
+        if athlete:
+            query = query.where(
+                func.lower(Result.athlete).like(_prefix_pattern(athlete), escape="\\")
+            )
+        if team:
+            query = query.where(
+                func.lower(Result.team).like(_prefix_pattern(team), escape="\\")
+            )
+        if event_link:
+            query = query.where(Result.event_link == event_link)
+        if discipline:
+            query = query.where(Result.discipline == discipline)
+        if round_:
+            query = query.where(Result.round == round_)
+        if group:
+            query = query.where(Result.group_name == group)
+
+        query = query.order_by(
+            Result.event_link, Result.page, Result.place.asc().nulls_last(), Result.athlete
+        ).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,84 @@
+"""Repository for TeamEvent data access operations."""
+
+from typing import List, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team_event import TeamEvent
+
+
+class TeamEventRepository:
+    """Repository for TeamEvent database operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize TeamEventRepository.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def replace_event_teams(
+        self,
+        event_link: str,
+        teams: List[str],
+        year: Optional[str] = None,
+        event_name: Optional[str] = None,
+    ) -> None:
+        """
+        Replace the teams indexed for an event.
+
+        Teams no longer on the event's pages are removed and new ones are
+        added in one transaction.
+
+        Args:
+            event_link: Event link
+            teams: Team names found on the event's live results pages
+            year: Competition year
+            event_name: Name of the event
+        """
+        await self.db.execute(
+            delete(TeamEvent).where(
+                TeamEvent.event_link == event_link, TeamEvent.team.not_in(teams)
+            )
+        )
+        if teams:
+            stmt = insert(TeamEvent).values(
+                [
+                    {
+                        "team": team,
+                        "event_link": event_link,
+                        "event_name": event_name,
+                        "year": year,
+                    }
+                    for team in teams
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TeamEvent.team, TeamEvent.event_link],
+                set_={"event_name": stmt.excluded.event_name, "year": stmt.excluded.year},
+            )
+            await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def get_events_by_team(
+        self, team: str, year: Optional[str] = None
+    ) -> List[TeamEvent]:
+        """
+        Get the events a team attended.
+
+        Args:
+            team: Team name, matched exactly
+            year: Competition year, all years if None
+
+        Returns:
+            List of TeamEvent objects, latest years first
+        """
+        query = select(TeamEvent).where(TeamEvent.team == team)
+        if year:
+            query = query.where(TeamEvent.year == year)
+        query = query.order_by(TeamEvent.year.desc(), TeamEvent.event_link)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
@@ -1,9 +1,11 @@
 """Repository for TeamCache data access operations."""
 
-from typing import List, Optional
-from sqlalchemy import select
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.db.invalidation import invalidation_bus
 from app.models.team import TeamCache
 
 
@@ -34,38 +36,67 @@ class TeamRepository:
         )
         return result.scalar_one_or_none()
 
-    async def save_teams(self, year: str, teams: List[str]) -> TeamCache:
+    async def get_entry(
+        self, year: str, event_link: str
+    ) -> Optional[Tuple[TeamCache, float]]:
         """
-        Save or update team cache entry.
+        Get team cache entry for a year and event, with its age.
+
+        The age is computed by the database so it does not depend on the
+        application clock.
 
         Args:
             year: Competition year
-            teams: List of team names
+            event_link: Event link
 
         Returns:
-            TeamCache object that was saved/updated
+            Tuple of (TeamCache, age in seconds) if found, None otherwise
+        """
+        age = func.extract("epoch", func.localtimestamp() - TeamCache.updated_at)
+        result = await self.db.execute(
+            select(TeamCache, age.label("age_seconds"))
+            .where(TeamCache.year == year, TeamCache.event_link == event_link)
+            .execution_options(populate_existing=True)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return row[0], float(row[1] or 0)
+
+    async def save_teams(
+        self,
+        year: str,
+        teams: List[str],
+        event_link: str = "",
+        event_name: Optional[str] = None,
+    ) -> None:
         """
-        # Check if entry exists
-        existing = await self.get_by_year(year)
-
-        if existing:
-            # Update existing entry
-            existing.teams = teams
-        else:
-            # Create new entry
-            cache_entry = TeamCache(year=year, teams=teams)
-            self.db.add(cache_entry)
-
-        # Commit changes to database
+        Save or update team cache entry.
+
+        The entry is announced on the cache invalidation bus in the same
+        transaction and evicted from this process's caches once committed.
+
+        Args:
+            year: Competition year
+            teams: List of team names
+            event_link: Link of the event the teams were parsed from
+            event_name: Name of the event
+        """
+        stmt = insert(TeamCache).values(
+            year=year, event_link=event_link, event_name=event_name, teams=teams
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TeamCache.year, TeamCache.event_link],
+            set_={
+                "event_name": stmt.excluded.event_name,
+                "teams": stmt.excluded.teams,
+                "updated_at": func.localtimestamp(),
+            },
+        )
+        await self.db.execute(stmt)
+        await invalidation_bus.notify(self.db, "teams", [year], [event_link])
         await self.db.commit()
-        
-        # Refresh the cache entry to get updated data
-        if existing:
-            await self.db.refresh(existing)
-        else:
-            await self.db.refresh(cache_entry)
-        
-        return existing if existing else cache_entry
+        invalidation_bus.invalidate("teams", [year], [event_link])
 
     async def get_all_years(self) -> List[str]:
         """
@@ -74,5 +105,5 @@ class TeamRepository:
         Returns:
             List of years with cached data
         """
-        result = await self.db.execute(select(TeamCache.year))
+        result = await self.db.execute(select(TeamCache.year).distinct())
         return list(result.scalars().all())
@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import Generic, List, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import TypedDict
 
 T = TypeVar("T")
 
@@ -14,6 +15,12 @@ class BaseResponse(BaseModel, Generic[T]):
     message: str | None = None
 
 
+class PageResponse(BaseResponse[T], Generic[T]):
+    """Response model for one page of a paginated list."""
+
+    next_cursor: str | None = None
+
+
 class EventBase(BaseModel):
     date: str
     year: str | None = None
@@ -38,6 +45,23 @@ class EventResponse(EventBase):
     updated_at: datetime
 
 
+# Plain-dict twins of EventResponse and PageResponse[List[EventResponse]],
+# serialized in one pass without building a model per event. They are
+# derived from the models, so the JSON has the same fields in the same order.
+EventRow = TypedDict(
+    "EventRow",
+    {name: field.annotation for name, field in EventResponse.model_fields.items()},
+)
+EventPage = TypedDict(
+    "EventPage",
+    {
+        name: List[EventRow] if name == "data" else field.annotation
+        for name, field in PageResponse.model_fields.items()
+    },
+)
+event_page_adapter = TypeAdapter(EventPage)
+
+
 class EventFilter(BaseModel):
     start: str | None = None
     end: str | None = None
@@ -45,3 +69,21 @@ class EventFilter(BaseModel):
     types: List[str] | None = None
     groups: List[str] | None = None
     disciplines: List[str] | None = None
+
+
+class DocumentLink(BaseModel):
+    title: str
+    url: str
+
+
+class EventDetailsResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    link: str
+    regulations: List[DocumentLink] = []
+    results: List[DocumentLink] = []
+    protocols: List[DocumentLink] = []
+    documents: List[DocumentLink] = []
+    error: str | None = None
+    fetched_at: datetime | None = None
+    updated_at: datetime | None = None
@@ -0,0 +1,26 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background ingestion job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestionJobResponse(BaseModel):
+    id: str
+    status: JobStatus
+    params: dict
+    progress: dict
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    duration_seconds: float | None = None
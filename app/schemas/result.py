@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ResultBase(BaseModel):
+    event_link: str
+    page: str
+    group_name: str | None = None
+    discipline: str | None = None
+    round: str | None = None
+    athlete: str
+    team: str
+    place: int | None = None
+    score: str | None = None
+
+
+class ResultResponse(ResultBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    updated_at: datetime | None = None
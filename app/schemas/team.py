@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Generic, List, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 T = TypeVar("T")
 
@@ -20,6 +20,7 @@ class TeamBase(BaseModel):
     event: str | None = None
     link: str | None = None
     from_cache: bool = False
+    stale: bool = False
     error: str | None = None
 
 
@@ -31,3 +32,12 @@ class TeamResponse(TeamBase):
     id: int
     created_at: datetime
     updated_at: datetime
+
+
+class TeamEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    team: str
+    event_link: str
+    event_name: str | None = None
+    year: str | None = None
@@ -0,0 +1,285 @@
+"""Fan-out of event and live result changes to stream subscribers."""
+
+import asyncio
+import json
+import traceback
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.db.notify import PgListener, listener, publish, split_payload
+from app.models.event import Event
+from app.repositories.event_repository import EventRepository
+from app.schemas.event import EventFilter, EventResponse
+
+
+@dataclass
+class StreamMessage:
+    """
+    Message sent to a stream subscriber.
+
+    Attributes:
+        kind: SSE event name: "events", "results" or "resync"
+        data: JSON-serializable message body
+    """
+
+    kind: str
+    data: object = None
+
+    def encode(self) -> str:
+        """Format the message as a Server-Sent Event."""
+        data = json.dumps(self.data, ensure_ascii=False, default=str)
+        return f"event: {self.kind}\ndata: {data}\n\n"
+
+
+def event_matches(filter_: EventFilter, event: dict) -> bool:
+    """
+    Check an event against a filter the way GET /api/events applies it.
+
+    Ranks are not checked: the list endpoint only uses them to choose what
+    to fetch from the remote calendar, so a stream subscriber receives the
+    same events a refresh of /api/events would show.
+
+    Args:
+        filter_: EventFilter with optional date range, ranks, types, groups and disciplines
+        event: Event dictionary with EventResponse fields
+
+    Returns:
+        True if the event passes every date, type, group and discipline filter that is set
+    """
+    startdate, enddate = event.get("startdate"), event.get("enddate")
+    if filter_.start and not (startdate and startdate >= filter_.start):
+        return False
+    if filter_.end and not (enddate and enddate <= filter_.end):
+        return False
+    if filter_.types and event.get("type") not in filter_.types:
+        return False
+    if filter_.groups and not set(filter_.groups) & set(event.get("groups") or []):
+        return False
+    if filter_.disciplines and not set(filter_.disciplines) & set(
+        event.get("disciplines") or []
+    ):
+        return False
+    return True
+
+
+def event_to_dict(event: Event) -> dict:
+    """
+    Serialize an Event the way GET /api/events returns it.
+
+    Args:
+        event: Event object
+
+    Returns:
+        JSON-serializable EventResponse dictionary with empty dates as None
+    """
+    values = {column: getattr(event, column) for column in EventResponse.model_fields}
+    for column in ("startdate", "enddate"):
+        if values[column] == "":
+            values[column] = None
+    return EventResponse.model_validate(values).model_dump(mode="json")
+
+
+class Subscription:
+    """
+    Queue of messages for one stream subscriber.
+
+    A subscriber that falls behind by more than settings.SSE_QUEUE_SIZE
+    messages gets a single "resync" message instead of the backlog and
+    receives nothing more; it is expected to reload and reconnect.
+    """
+
+    def __init__(self, filter_: EventFilter):
+        """
+        Initialize Subscription.
+
+        Args:
+            filter_: EventFilter selecting the events the subscriber receives
+        """
+        self.filter = filter_
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
+        self.closed = False
+
+    def push(self, message: StreamMessage) -> None:
+        """Queue a message, switching to resync if the subscriber fell behind."""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(StreamMessage("resync"))
+            self.closed = True
+
+    async def get(self) -> StreamMessage:
+        """Wait for the next message."""
+        return await self.queue.get()
+
+
+class BroadcastHub:
+    """
+    In-process broadcast of change notifications to stream subscribers.
+
+    Every worker runs one hub fed by the NOTIFY channel, so a change is
+    delivered to all workers whichever of them made it. Notifications are
+    handled one at a time; each is resolved against the database once and
+    the result is matched against every subscriber's filter in memory.
+    Idle subscribers cost a queue and a waiting coroutine each.
+    """
+
+    def __init__(self, pg_listener: Optional[PgListener] = None):
+        """
+        Initialize BroadcastHub.
+
+        Args:
+            pg_listener: Listener delivering notifications, defaults to the shared one
+        """
+        self.listener = pg_listener or listener
+        self.subscribers: Set[Subscription] = set()
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start dispatching notifications. Called on application startup."""
+        if self._task is None:
+            self.listener.add_listener(settings.NOTIFY_CHANNEL, self._inbox.put_nowait)
+            self.listener.add_reconnect_callback(self.resync)
+            self._task = asyncio.create_task(self._dispatch_forever())
+
+    async def stop(self) -> None:
+        """Stop dispatching and release subscribers. Called on application shutdown."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.resync()
+
+    @asynccontextmanager
+    async def subscribe(self, filter_: EventFilter) -> AsyncIterator[Subscription]:
+        """
+        Receive matching changes for the duration of the block.
+
+        Args:
+            filter_: EventFilter selecting the events to receive
+
+        Yields:
+            Subscription to read messages from
+        """
+        subscription = Subscription(filter_)
+        self.subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self.subscribers.discard(subscription)
+
+    def resync(self) -> None:
+        """Ask every subscriber to reload, e.g. after notifications were missed."""
+        for subscription in list(self.subscribers):
+            subscription.push(StreamMessage("resync"))
+            subscription.closed = True
+
+    async def load_events(self, links: List[str]) -> List[dict]:
+        """
+        Load events mentioned by a notification.
+
+        Args:
+            links: Event links
+
+        Returns:
+            List of serialized events
+        """
+        async with AsyncSessionLocal() as session:
+            events = await EventRepository(session).get_by_links(links)
+        return [event_to_dict(event) for event in events]
+
+    async def dispatch(self, payload: str) -> None:
+        """
+        Deliver one notification to the matching subscribers.
+
+        Args:
+            payload: Notification payload published by publish_event_changes
+                or publish_result_changes
+        """
+        if not self.subscribers:
+            return
+        message = json.loads(payload)
+        kind = message.get("kind")
+
+        if kind == "events":
+            events = await self.load_events(message["links"])
+            for subscription in list(self.subscribers):
+                matching = [
+                    event for event in events if event_matches(subscription.filter, event)
+                ]
+                if matching:
+                    subscription.push(StreamMessage("events", matching))
+
+        elif kind == "results":
+            events = await self.load_events([message["event"]])
+            if not events:
+                return
+            data = {key: message[key] for key in ("event", "page", "changed", "removed")}
+            for subscription in list(self.subscribers):
+                if event_matches(subscription.filter, events[0]):
+                    subscription.push(StreamMessage("results", data))
+
+    async def _dispatch_forever(self) -> None:
+        """Handle notifications in the order they arrive."""
+        while True:
+            payload = await self._inbox.get()
+            try:
+                await self.dispatch(payload)
+            except Exception as e:
+                print(f"Error dispatching notification: {e}")
+                traceback.print_exc()
+
+
+async def publish_event_changes(links: List[str]) -> None:
+    """
+    Notify all workers about inserted or updated events.
+
+    Failures are logged and ignored, notifications are best effort.
+
+    Args:
+        links: Links of the written events
+    """
+    try:
+        payloads = split_payload({"kind": "events"}, "links", links)
+        await publish(settings.NOTIFY_CHANNEL, payloads)
+    except Exception as e:
+        print(f"Error publishing event changes: {e}")
+
+
+async def publish_result_changes(
+    event_link: str, page: str, changed: List[dict], removed: List[Tuple[str, str]]
+) -> None:
+    """
+    Notify all workers about changed rows of a live results page.
+
+    Large diffs are split over several notifications with the same event
+    and page. Failures are logged and ignored, notifications are best effort.
+
+    Args:
+        event_link: Event link
+        page: Live results page name
+        changed: New and changed Result rows
+        removed: (athlete, team) keys of removed rows
+    """
+    try:
+        base = {"kind": "results", "event": event_link, "page": page}
+        changed_rows = [
+            {key: value for key, value in row.items() if key != "content_hash"}
+            for row in changed
+        ]
+        payloads = split_payload({**base, "removed": []}, "changed", changed_rows)
+        removed_rows = [{"athlete": athlete, "team": team} for athlete, team in removed]
+        payloads += split_payload({**base, "changed": []}, "removed", removed_rows)
+        await publish(settings.NOTIFY_CHANNEL, payloads)
+    except Exception as e:
+        print(f"Error publishing live result changes: {e}")
+
+
+broadcast_hub = BroadcastHub()
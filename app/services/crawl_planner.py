@@ -0,0 +1,193 @@
+"""Crawl planning: splitting upstream calendar queries into shards."""
+
+import itertools
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+# Filter parameters of the calendar query, in URL order
+SHARD_FILTERS = ("ranks", "types", "groups", "disciplines")
+
+
+@dataclass(frozen=True)
+class CrawlShard:
+    """
+    A single calendar query covering part of a crawl.
+
+    Attributes:
+        start: Start date (format: YYYY-MM-DD)
+        end: End date (format: YYYY-MM-DD)
+        ranks: Competition ranks
+        types: Event types
+        groups: Participant groups
+        disciplines: Disciplines
+    """
+
+    start: str
+    end: str
+    ranks: Tuple[str, ...] = ()
+    types: Tuple[str, ...] = ()
+    groups: Tuple[str, ...] = ()
+    disciplines: Tuple[str, ...] = ()
+
+    @property
+    def year(self) -> str:
+        """Year covered by the shard."""
+        return self.start[:4]
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the shard."""
+        filters = "|".join(
+            f"{name}={','.join(getattr(self, name))}" for name in SHARD_FILTERS
+        )
+        return f"{self.start}..{self.end}|{filters}"
+
+    def to_params(self) -> dict:
+        """Keyword arguments for fetching the shard."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            **{name: list(getattr(self, name)) for name in SHARD_FILTERS},
+        }
+
+
+@dataclass
+class ShardResult:
+    """
+    Outcome of crawling a single shard.
+
+    Attributes:
+        shard: Crawled shard
+        events: Parsed events, empty if the shard failed or was unchanged
+        unchanged: Whether the upstream page is the same as on the last crawl
+        failed: Whether the shard failed after all retries
+        content_hash: Hash of the fetched page body
+        event_count: Number of parsed events
+    """
+
+    shard: CrawlShard
+    events: List[dict] = field(default_factory=list)
+    unchanged: bool = False
+    failed: bool = False
+    content_hash: Optional[str] = None
+    event_count: int = 0
+
+
+def _split_years(start: str, end: str, years_ahead: int) -> List[Tuple[str, str]]:
+    """
+    Split a date range into calendar-year ranges.
+
+    The end of the range is capped at the end of the year `years_ahead`
+    years from now, since the calendar has nothing further ahead.
+
+    Args:
+        start: Start date (format: YYYY-MM-DD)
+        end: End date (format: YYYY-MM-DD)
+        years_ahead: Number of future years worth crawling
+
+    Returns:
+        List of (start, end) date pairs, one per year; the original range
+        if the dates cannot be parsed
+    """
+    try:
+        start_date = date.fromisoformat(start)
+        end_date = date.fromisoformat(end)
+    except (TypeError, ValueError):
+        return [(start, end)]
+
+    end_date = min(end_date, date(date.today().year + years_ahead, 12, 31))
+    ranges = []
+    for year in range(start_date.year, end_date.year + 1):
+        year_start = max(start_date, date(year, 1, 1))
+        year_end = min(end_date, date(year, 12, 31))
+        ranges.append((year_start.isoformat(), year_end.isoformat()))
+    return ranges
+
+
+def plan_shards(
+    start: str,
+    end: str,
+    ranks: Optional[Sequence[str]] = None,
+    types: Optional[Sequence[str]] = None,
+    groups: Optional[Sequence[str]] = None,
+    disciplines: Optional[Sequence[str]] = None,
+    split_filters: Optional[Sequence[str]] = None,
+    years_ahead: Optional[int] = None,
+) -> List[CrawlShard]:
+    """
+    Split a calendar query into shards by year and filter subset.
+
+    Each shard covers one calendar year. Filters listed in `split_filters`
+    are additionally split into one shard per value; other filters are
+    sent whole with every shard.
+
+    Args:
+        start: Start date (format: YYYY-MM-DD)
+        end: End date (format: YYYY-MM-DD)
+        ranks: Competition ranks
+        types: Event types
+        groups: Participant groups
+        disciplines: Disciplines
+        split_filters: Filter names to split by, defaults to settings.CRAWL_SPLIT_FILTERS
+        years_ahead: Number of future years worth crawling, defaults to settings.CRAWL_YEARS_AHEAD
+
+    Returns:
+        List of shards in year order
+    """
+    if split_filters is None:
+        split_filters = settings.CRAWL_SPLIT_FILTERS
+    if years_ahead is None:
+        years_ahead = settings.CRAWL_YEARS_AHEAD
+
+    values = {
+        "ranks": tuple(ranks or ()),
+        "types": tuple(types or ()),
+        "groups": tuple(groups or ()),
+        "disciplines": tuple(disciplines or ()),
+    }
+    subsets = [
+        [(value,) for value in values[name]]
+        if name in split_filters and values[name]
+        else [values[name]]
+        for name in SHARD_FILTERS
+    ]
+
+    return [
+        CrawlShard(year_start, year_end, *combination)
+        for year_start, year_end in _split_years(start, end, years_ahead)
+        for combination in itertools.product(*subsets)
+    ]
+
+
+def select_incremental_shards(
+    shards: List[CrawlShard],
+    last_crawled: Dict[str, Optional[datetime]],
+    now: datetime,
+    stale_after: timedelta,
+) -> List[CrawlShard]:
+    """
+    Select the shards an incremental crawl has to visit.
+
+    The current and upcoming seasons are always crawled. Past seasons are
+    crawled only if they were never crawled or their last crawl is older
+    than `stale_after`.
+
+    Args:
+        shards: Planned shards
+        last_crawled: Shard key to the time of its last successful crawl
+        now: Current time
+        stale_after: Age after which a past season's shard is crawled again
+
+    Returns:
+        Shards to crawl, in planned order
+    """
+    selected = []
+    for shard in shards:
+        crawled_at = last_crawled.get(shard.key)
+        is_current = not shard.year.isdigit() or int(shard.year) >= now.year
+        if is_current or crawled_at is None or now - crawled_at > stale_after:
+            selected.append(shard)
+    return selected
@@ -0,0 +1,77 @@
+"""Cache of serialized /api/events responses."""
+
+import json
+from typing import Optional
+
+from app.core.config import settings
+from app.core.db.invalidation import invalidation_bus
+from app.schemas.event import EventFilter
+from app.utils.response_cache import ResponseCache
+
+# Serialized /api/events responses of this worker, by canonical filter
+events_cache = ResponseCache(
+    max_entries=settings.EVENTS_CACHE_MAX_ENTRIES,
+    max_bytes=settings.EVENTS_CACHE_MAX_BYTES,
+    ttl=settings.EVENTS_CACHE_TTL_SECONDS,
+)
+
+
+def event_filter_key(filter_: EventFilter) -> str:
+    """
+    Build the canonical cache key of an event filter.
+
+    Filters selecting the same events get the same key: list values are
+    sorted and deduplicated, and empty strings and lists count as unset,
+    exactly as EventRepository.get_by_filters treats them.
+
+    Args:
+        filter_: EventFilter with optional date range, ranks, types, groups and disciplines
+
+    Returns:
+        Key string
+    """
+    values = {}
+    for name, value in filter_.model_dump().items():
+        if isinstance(value, list):
+            value = sorted(set(value))
+        values[name] = value or None
+    return json.dumps(values, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def events_page_key(filter_: EventFilter, after: Optional[str], limit: Optional[int]) -> str:
+    """
+    Build the cache key of one page of the events matching a filter.
+
+    Args:
+        filter_: EventFilter with optional date range, ranks, types, groups and disciplines
+        after: Link the page starts after, None for the first page
+        limit: Page size, None for all events
+
+    Returns:
+        Key string
+    """
+    if after is None and limit is None:
+        return event_filter_key(filter_)
+    page = json.dumps([after, limit], ensure_ascii=False, separators=(",", ":"))
+    return f"{event_filter_key(filter_)}|{page}"
+
+
+def invalidate_events_cache() -> int:
+    """
+    Start a new ingestion generation, dropping every cached response.
+
+    Responses are cached per filter and a date range or list filter may
+    select events of any year, so a write of some years or links cannot
+    be traced to the entries it affects; every write drops them all.
+
+    Returns:
+        New generation
+    """
+    return events_cache.bump_generation()
+
+
+invalidation_bus.register(
+    "events",
+    evict=lambda years, links: invalidate_events_cache(),
+    clear=invalidate_events_cache,
+)
@@ -0,0 +1,167 @@
+"""Enrichment of events with the contents of their detail pages."""
+
+import asyncio
+import traceback
+from datetime import datetime
+from typing import Optional
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.http_cache import CachingFetcher
+from app.models.event_details import EventDetails
+from app.repositories.event_details_repository import EventDetailsRepository
+from app.utils.parsers import parse_event_details
+
+# Outcomes of crawling one detail page
+ENRICHMENT_OUTCOMES = ("crawled", "unchanged", "missing", "failed")
+
+
+def event_details_url(link: str) -> str:
+    """
+    Build the URL of an event's detail page.
+
+    Args:
+        link: Event link
+
+    Returns:
+        Page URL under settings.BASE_URL
+    """
+    return f"{settings.BASE_URL}{link}/"
+
+
+class EventDetailsService:
+    """
+    Service for event detail pages.
+
+    Detail pages are crawled only for events that are new or changed since
+    their page was last crawled, concurrently and through the
+    conditional-GET cache. Requests to one host are additionally capped by
+    the shared HttpClient (settings.HTTP_MAX_CONNECTIONS_PER_HOST). The
+    extracted fields are stored, so detail responses never scrape.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize EventDetailsService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+        self.repository = EventDetailsRepository(db)
+        self.fetcher = CachingFetcher()
+
+    async def get_details(self, link: str) -> Optional[EventDetails]:
+        """
+        Get the stored details of an event.
+
+        Args:
+            link: Event link
+
+        Returns:
+            EventDetails, or None if the event's page was not crawled yet
+        """
+        return await self.repository.get_by_link(link)
+
+    async def enrich_pending(
+        self,
+        limit: int = settings.ENRICHMENT_MAX_EVENTS,
+        progress: Optional[dict] = None,
+    ) -> dict:
+        """
+        Crawl the detail pages of new and changed events.
+
+        Args:
+            limit: Maximum number of pages to crawl
+            progress: Optional dictionary updated in place with the counters
+
+        Returns:
+            Dictionary with numbers of crawled, unchanged, missing and failed pages
+        """
+        if progress is None:
+            progress = {}
+        pending = await self.repository.get_pending(limit)
+        counts = dict.fromkeys(ENRICHMENT_OUTCOMES, 0)
+        progress["enrichment"] = counts
+        print(f"Enriching {len(pending)} new or changed events")
+
+        semaphore = asyncio.Semaphore(settings.ENRICHMENT_CONCURRENCY)
+
+        async def enrich(link: str, event_hash: Optional[str]) -> None:
+            async with semaphore:
+                try:
+                    outcome = await self.enrich_event(link, event_hash)
+                except Exception as e:
+                    # A parse or database error fails only this event
+                    print(f"Error enriching {link}: {e}")
+                    traceback.print_exc()
+                    outcome = "failed"
+            counts[outcome] += 1
+
+        await asyncio.gather(*(enrich(link, event_hash) for link, event_hash in pending))
+        print(f"Event enrichment: {counts}")
+        return counts
+
+    async def enrich_event(self, link: str, event_hash: Optional[str]) -> str:
+        """
+        Crawl one detail page and store its fields.
+
+        A page that does not exist is recorded for the current version of
+        the event and not retried until the event changes; other errors
+        are retried by the next run.
+
+        Args:
+            link: Event link
+            event_hash: Current content hash of the event
+
+        Returns:
+            One of ENRICHMENT_OUTCOMES
+        """
+        url = event_details_url(link)
+        now = datetime.now()
+        async with AsyncSessionLocal() as session:
+            repository = EventDetailsRepository(session)
+            try:
+                fetched = await self.fetcher.fetch(url)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    print(f"Error fetching details of {link}: {e}")
+                    await repository.save({"link": link, "error": str(e), "fetched_at": now})
+                    return "failed"
+                await repository.save(
+                    {
+                        "link": link,
+                        "event_hash": event_hash,
+                        "error": "Not found",
+                        "fetched_at": now,
+                    }
+                )
+                return "missing"
+            except httpx.HTTPError as e:
+                print(f"Error fetching details of {link}: {e}")
+                await repository.save({"link": link, "error": str(e), "fetched_at": now})
+                return "failed"
+
+            stored = await repository.get_by_link(link)
+            if stored is not None and stored.body_hash == fetched.body_hash:
+                await repository.save(
+                    {"link": link, "event_hash": event_hash, "error": None, "fetched_at": now}
+                )
+                return "unchanged"
+
+            details = await asyncio.to_thread(parse_event_details, fetched.text, url)
+            await repository.save(
+                {
+                    "link": link,
+                    **details,
+                    "event_hash": event_hash,
+                    "body_hash": fetched.body_hash,
+                    "error": None,
+                    "fetched_at": now,
+                    "updated_at": now,
+                }
+            )
+            return "crawled"
@@ -1,17 +1,32 @@
 """Service layer for Event business logic."""
 
+import asyncio
 import traceback
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
 from urllib.parse import urlencode
-import requests
-from bs4 import BeautifulSoup
 
 from app.core.config import settings
+from app.core.http_cache import CachingFetcher, FetchResult
+from app.models.crawl_state import CrawlState
 from app.models.event import Event
+from app.repositories.crawl_state_repository import CrawlStateRepository
 from app.repositories.event_repository import EventRepository
-from app.utils.parsers import parse_events
-from app.utils.utils import parse_date_range
+from app.services.broadcast import publish_event_changes
+from app.services.crawl_planner import (
+    CrawlShard,
+    ShardResult,
+    plan_shards,
+    select_incremental_shards,
+)
+from app.services.event_details_service import EventDetailsService
+from app.services.ingestion_pipeline import IngestionPipeline
+from app.utils.parse_pool import parse_events_parallel
+from app.utils.utils import compute_event_hash, parse_date_range
+
+# Ingestion modes accepted by fetch_and_save_events
+INGESTION_MODES = ("full", "incremental")
 
 
 class EventService:
@@ -26,6 +41,8 @@ class EventService:
         """
         self.db = db
         self.repository = EventRepository(db)
+        self.crawl_state_repository = CrawlStateRepository(db)
+        self.fetcher = CachingFetcher()
 
     async def get_events(
         self,
@@ -35,9 +52,11 @@ class EventService:
         types: Optional[List[str]] = None,
         groups: Optional[List[str]] = None,
         disciplines: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[Event]:
         """
-        Get events with optional filtering.
+        Get events with optional filtering, ordered by link.
 
         Args:
             start_date: Filter events starting after this date
@@ -46,9 +65,11 @@ class EventService:
             types: Filter events by type
             groups: Filter events by groups
             disciplines: Filter events by disciplines
+            after: Only return events whose link sorts after this one
+            limit: Maximum number of events, all if None
 
         Returns:
-            List of Event objects matching the filter criteria
+            List of Event objects matching the filter criteria, ordered by link
         """
         events = await self.repository.get_by_filters(
             start_date=start_date,
@@ -57,6 +78,8 @@ class EventService:
             types=types,
             groups=groups,
             disciplines=disciplines,
+            after=after,
+            limit=limit,
         )
 
         # Convert empty strings to None for date fields
@@ -68,6 +91,76 @@ class EventService:
 
         return events
 
+    async def get_event_rows(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        ranks: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+        disciplines: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Get the columns of events with optional filtering, ordered by link.
+
+        Args:
+            start_date: Filter events starting after this date
+            end_date: Filter events ending before this date
+            ranks: Filter events by rank
+            types: Filter events by type
+            groups: Filter events by groups
+            disciplines: Filter events by disciplines
+            after: Only return events whose link sorts after this one
+            limit: Maximum number of events, all if None
+
+        Returns:
+            List of dictionaries with the EventResponse fields, empty dates as None
+        """
+        return await self.repository.get_rows_by_filters(
+            start_date=start_date,
+            end_date=end_date,
+            ranks=ranks,
+            types=types,
+            groups=groups,
+            disciplines=disciplines,
+            after=after,
+            limit=limit,
+        )
+
+    async def get_events_validator(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        ranks: Optional[List[str]] = None,
+        types: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+        disciplines: Optional[List[str]] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get the latest update time and number of the events matching filters.
+
+        Args:
+            start_date: Filter events starting after this date
+            end_date: Filter events ending before this date
+            ranks: Filter events by rank
+            types: Filter events by type
+            groups: Filter events by groups
+            disciplines: Filter events by disciplines
+
+        Returns:
+            Tuple of (latest updated_at or None if no event matches, number of events)
+        """
+        return await self.repository.get_validator(
+            start_date=start_date,
+            end_date=end_date,
+            ranks=ranks,
+            types=types,
+            groups=groups,
+            disciplines=disciplines,
+        )
+
     async def fetch_and_save_events(
         self,
         start: str = None,
@@ -76,12 +169,29 @@ class EventService:
         types: List[str] = None,
         groups: List[str] = None,
         disciplines: List[str] = None,
+        mode: str = "full",
+        progress: Optional[dict] = None,
     ) -> dict:
         """
         Fetch events from external source and save them to database.
 
-        Fetches events from the climbing competition source with specified filters,
-        checks for duplicates, and inserts new events into the database.
+        Fetches events from the climbing competition source with specified filters
+        and upserts them in bulk: new events are inserted, changed events are
+        updated and unchanged events are skipped by the database.
+
+        Shards are streamed through an IngestionPipeline, so pages are parsed
+        and rows are written in chunks while later shards are still being
+        downloaded. Events found by several shards are written once.
+
+        Afterwards the detail pages of new and changed events are crawled,
+        see EventDetailsService.enrich_pending.
+
+        In "incremental" mode only the current and upcoming seasons and the
+        shards whose last crawl is older than settings.CRAWL_STALE_TTL_HOURS
+        are crawled, and a shard whose page body has the hash recorded in the
+        crawl cursor by the last successful run is not parsed again. A "full"
+        run always parses every page, so it can repopulate the table or apply
+        parser fixes. The crawl cursor is updated after every successful run.
 
         Args:
             start: Start date for filtering (format: YYYY-MM-DD)
@@ -90,17 +200,27 @@ class EventService:
             types: List of event types to filter by
             groups: List of participant groups to filter by
             disciplines: List of disciplines to filter by
+            mode: "full" to crawl the whole range, "incremental" to crawl only
+                current seasons and stale shards
+            progress: Optional dictionary updated in place with the current
+                stage and counters, used by background jobs to report status
 
         Returns:
-            Dictionary with message and number of new events inserted
+            Dictionary with message and numbers of inserted, updated and skipped events
 
         Raises:
             Exception: If there's an error during fetching or saving
         """
 
+        if mode not in INGESTION_MODES:
+            raise ValueError(f"Unknown ingestion mode: {mode}")
+        if progress is None:
+            progress = {}
+
         try:
-            print("Fetching events from source...")
-            events = await self.fetch_events_from_source(
+            print(f"Fetching events from source ({mode})...")
+            progress.update(stage="fetching", mode=mode)
+            shards = plan_shards(
                 start=start,
                 end=end,
                 ranks=ranks,
@@ -108,83 +228,57 @@ class EventService:
                 groups=groups,
                 disciplines=disciplines,
             )
-
-            print(f"Found {len(events)} events to save")
-
-            # Check for duplicates and only insert new records
-            event_links = [comp["link"] for comp in events]
-            print(f"Total event links to check: {len(event_links)}")
-
-            existing_links = await self.repository.get_links_by_batch(event_links)
-            print(f"Existing links in DB: {len(existing_links)}")
-            print(f"Existing links sample: {list(existing_links)[:5]}")
-
-            new_events = [comp for comp in events if comp["link"] not in existing_links]
-
-            message = f"Found {len(events)} events, {len(new_events)} are new"
-            print(f"{message}")
-            print(f"Existing links: {len(existing_links)}")
-            print(f"New events: {len(new_events)}")
-
-            # Insert events in batches to avoid transaction size limits
-            batch_size = 100
-            inserted_count = 0
-
-            for i in range(0, len(new_events), batch_size):
-                batch = new_events[i : i + batch_size]
-                print(f"Processing batch {i//batch_size + 1} with {len(batch)} events")
-                try:
-                    for new_event in batch:
-                        try:
-                            if not new_event.get("link"):
-                                continue
-
-                            if not new_event.get("date"):
-                                continue
-
-                            if not new_event.get("name"):
-                                continue
-
-                            if new_event["date"] and new_event["year"]:
-                                start_date, end_date = parse_date_range(
-                                    new_event["date"], new_event["year"]
-                                )
-                            else:
-                                start_date = None
-                                end_date = None
-
-                            event = Event(
-                                date=new_event["date"],
-                                year=new_event["year"],
-                                rank=new_event.get("rank", None),
-                                startdate=start_date,
-                                enddate=end_date,
-                                link=new_event["link"],
-                                name=new_event["name"],
-                                location=new_event.get("location", ""),
-                                type=new_event.get("type", ""),
-                                groups=new_event.get("groups", []),
-                                disciplines=new_event.get("disciplines", []),
-                            )
-                            self.db.add(event)
-                            inserted_count += 1
-                        except Exception as e:
-                            print(f"Error inserting event: {e}")
-                            continue
-
-                    await self.db.commit()
-                    print(
-                        f"Successfully committed batch {i//batch_size + 1} with {len(batch)} events"
-                    )
-
-                except Exception as e:
-                    print(f"Error in batch {i//batch_size + 1}: {e}")
-                    traceback.print_exc()
-                    await self.db.rollback()
-                    continue
-
-            print(f"Successfully inserted total {inserted_count} events")
-            return {"message": message, "inserted_count": inserted_count}
+            planned = len(shards)
+            states: Dict[str, CrawlState] = {}
+            if mode == "incremental":
+                states = await self.crawl_state_repository.get_by_keys(
+                    [shard.key for shard in shards]
+                )
+                shards = self._select_incremental_shards(shards, states)
+            progress.update(shards_planned=planned)
+
+            async def parse_page(shard: CrawlShard, page: FetchResult) -> ShardResult:
+                state = states.get(shard.key)
+                return await self.parse_shard_page(
+                    shard, page, stored_hash=state.content_hash if state else None
+                )
+
+            pipeline = IngestionPipeline(
+                fetch_page=self.fetch_shard_page_with_retries,
+                parse_page=parse_page,
+                build_row=self._build_event_row,
+                write_chunk=self._write_chunk,
+                progress=progress,
+            )
+            print(f"Streaming {len(shards)} shards through the ingestion pipeline")
+            progress.update(stage="streaming")
+            counts = await pipeline.run(shards)
+
+            # Advance the crawl cursor only if everything was written
+            if not pipeline.failed_chunks:
+                await self._save_crawl_state(pipeline.shard_results)
+
+            enrichment = None
+            if settings.ENRICHMENT_ENABLED:
+                progress.update(stage="enriching")
+                enrichment = await self._enrich_events(progress)
+
+            message = (
+                f"Found {counts['found']} events, {counts['inserted']} are new, "
+                f"{counts['updated']} updated, {counts['skipped']} unchanged"
+            )
+            print(message)
+            progress.update(stage="done")
+            return {
+                "message": message,
+                "inserted_count": counts["inserted"],
+                "updated_count": counts["updated"],
+                "skipped_count": counts["skipped"],
+                "crawled_shards": len(shards),
+                "planned_shards": planned,
+                "failed_shards": progress.get("shards_failed", 0),
+                "enrichment": enrichment,
+            }
 
         except Exception as e:
             print(f"Error in fetch_and_save_events: {e}")
@@ -192,87 +286,217 @@ class EventService:
             await self.db.rollback()
             raise
 
-    async def fetch_events_from_source(
-        self,
-        start: str,
-        end: str,
-        ranks: List[str] = None,
-        types: List[str] = None,
-        groups: List[str] = None,
-        disciplines: List[str] = None,
-    ) -> List[dict]:
+    async def _enrich_events(self, progress: dict) -> Optional[dict]:
         """
-        Fetch events from external climbing competition source.
+        Crawl the detail pages of new and changed events.
 
-        Makes HTTP request to the competition source API with specified filters
-        and parses the response to extract event information.
+        Enrichment failures are logged and do not fail the ingestion.
 
         Args:
-            start: Start date for filtering (format: YYYY-MM-DD)
-            end: End date for filtering (format: YYYY-MM-DD)
-            ranks: List of competition ranks to filter by
-            types: List of event types to filter by
-            groups: List of participant groups to filter by
-            disciplines: List of disciplines to filter by
+            progress: Dictionary updated in place with the enrichment counters
 
         Returns:
-            List of dictionaries containing event information
+            Enrichment counters, or None if the enrichment failed
+        """
+        try:
+            return await EventDetailsService(self.db).enrich_pending(progress=progress)
+        except Exception as e:
+            print(f"Error enriching events: {e}")
+            traceback.print_exc()
+            await self.db.rollback()
+            return None
 
-        Raises:
-            requests.exceptions.RequestException: If network request fails
+    async def _write_chunk(self, rows: List[dict]) -> dict:
         """
-        base_url = settings.BASE_URL
+        Upsert a chunk of event rows, rolling the session back on failure.
 
-        params = {
-            "start": start,
-            "end": end,
+        Once a chunk that inserted or updated events is committed, the
+        events are announced to stream subscribers of every worker. Caches
+        are invalidated by the repository.
+
+        Args:
+            rows: Event rows to upsert
+
+        Returns:
+            Dictionary with numbers of inserted, updated and skipped events
+        """
+        try:
+            counts = await self.repository.upsert_events(
+                rows, chunk_size=settings.INGESTION_CHUNK_SIZE
+            )
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        written_links = counts.pop("written_links")
+        if written_links:
+            await publish_event_changes(written_links)
+        return counts
+
+    @staticmethod
+    def _build_event_row(event: dict) -> Optional[dict]:
+        """
+        Convert a parsed event into a database row.
+
+        Args:
+            event: Event dictionary produced by parse_events
+
+        Returns:
+            Dictionary of Event column values, or None if required fields are missing
+        """
+        if not event.get("link") or not event.get("date") or not event.get("name"):
+            return None
+
+        if event.get("year"):
+            start_date, end_date = parse_date_range(event["date"], event["year"])
+        else:
+            start_date = None
+            end_date = None
+
+        return {
+            "date": event["date"],
+            "year": event["year"],
+            "rank": event.get("rank", None),
+            "startdate": start_date,
+            "enddate": end_date,
+            "link": event["link"],
+            "name": event["name"],
+            "location": event.get("location", ""),
+            "type": event.get("type", ""),
+            "groups": event.get("groups", []),
+            "disciplines": event.get("disciplines", []),
+            "content_hash": event.get("content_hash") or compute_event_hash(event),
         }
 
-        def format_param(key: str, values: List[str]) -> dict:
-            return {f"{key}[]": values}
+    def _select_incremental_shards(
+        self, shards: List[CrawlShard], states: Dict[str, CrawlState]
+    ) -> List[CrawlShard]:
+        """
+        Keep only the shards an incremental crawl has to visit.
+
+        Args:
+            shards: Planned shards
+            states: Crawl cursor of the planned shards by shard key
 
-        params.update(format_param("ranks", ranks))
-        params.update(format_param("types", types))
-        params.update(format_param("groups", groups))
-        params.update(format_param("disciplines", disciplines))
+        Returns:
+            Shards of current and upcoming seasons plus stale past shards
+        """
+        selected = select_incremental_shards(
+            shards,
+            {key: state.last_crawled_at for key, state in states.items()},
+            now=datetime.now(),
+            stale_after=timedelta(hours=settings.CRAWL_STALE_TTL_HOURS),
+        )
+        print(f"Incremental crawl: {len(selected)} of {len(shards)} shards")
+        return selected
 
-        try:
-            print(f"Making HTTP request to: {base_url}")
-            print(f"Parameters: {params}")
+    async def _save_crawl_state(self, results: List[ShardResult]) -> None:
+        """
+        Record successfully crawled shards in the crawl cursor.
+
+        Args:
+            results: Crawl results; failed shards are not recorded
+        """
+        now = datetime.now()
+        await self.crawl_state_repository.save_states(
+            [
+                {
+                    "shard_key": result.shard.key,
+                    "year": result.shard.year,
+                    "content_hash": result.content_hash,
+                    # An unchanged page keeps the previously recorded count
+                    "event_count": None if result.unchanged else result.event_count,
+                    "last_crawled_at": now,
+                }
+                for result in results
+                if not result.failed
+            ]
+        )
+
+    async def fetch_shard_page_with_retries(
+        self, shard: CrawlShard
+    ) -> Optional[FetchResult]:
+        """
+        Fetch a single shard's page, retrying it with exponential backoff.
+
+        Args:
+            shard: Shard to fetch
+
+        Returns:
+            FetchResult, or None if all attempts failed
+        """
+        attempts = settings.CRAWL_SHARD_RETRIES + 1
+        for attempt in range(attempts):
+            try:
+                return await self.fetch_shard_page(shard)
+            except Exception as e:
+                print(
+                    f"Error fetching shard {shard.key} "
+                    f"(attempt {attempt + 1}/{attempts}): {e}"
+                )
+                if attempt + 1 < attempts:
+                    await asyncio.sleep(settings.CRAWL_RETRY_BACKOFF * 2**attempt)
+        return None
+
+    async def fetch_shard_page(self, shard: CrawlShard) -> FetchResult:
+        """
+        Fetch a single calendar shard's page.
 
-            # Build URL manually to see what's being generated
+        The page is fetched conditionally, so an unchanged page is served
+        from the HTTP cache.
 
-            url_with_params = f"{base_url}?{urlencode(params, doseq=True)}"
-            print(f"Full URL: {url_with_params}")
+        Args:
+            shard: Shard to fetch
 
-            # Check for invalid characters in URL
-            if "?" in url_with_params and url_with_params.count("?") > 1:
-                print("ERROR: Multiple '?' in URL")
-                return []
+        Returns:
+            FetchResult with the page body
 
-            print("Sending HTTP request...")
-            print(f"Python version: {__import__('sys').version}")
-            print(f"requests version: {requests.__version__}")
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        params = {
+            "start": shard.start,
+            "end": shard.end,
+        }
 
-            response = requests.get(url_with_params, timeout=10)
-            print(f"Response status code: {response.status_code}")
+        def format_param(key: str, values: List[str]) -> dict:
+            return {f"{key}[]": values}
 
-            if response.status_code != 200:
-                print(f"Received status code {response.status_code}")
-                print(f"Response content (first 500 chars): {response.text[:500]}")
-                return []
+        params.update(format_param("ranks", list(shard.ranks)))
+        params.update(format_param("types", list(shard.types)))
+        params.update(format_param("groups", list(shard.groups)))
+        params.update(format_param("disciplines", list(shard.disciplines)))
 
-            response.raise_for_status()
-            print("Parsing HTML content...")
-            soup = BeautifulSoup(response.content, "html.parser")
-            events = parse_events(soup)
+        url_with_params = f"{settings.BASE_URL}?{urlencode(params, doseq=True)}"
+        print(f"Fetching shard: {url_with_params}")
+        return await self.fetcher.fetch(url_with_params)
 
-            print(f"Parsed {len(events)} events from HTML")
-            return events
+    async def parse_shard_page(
+        self, shard: CrawlShard, page: FetchResult, stored_hash: Optional[str] = None
+    ) -> ShardResult:
+        """
+        Parse a fetched calendar shard's page.
 
-        except requests.exceptions.RequestException as e:
-            print(f"Network error fetching events: {e}")
-            return []
-        except Exception as e:
-            print(f"Error fetching events: {e}")
-            return []
+        Parsing is skipped if the page body is the one whose events were
+        written by the last successful crawl.
+
+        Args:
+            shard: Fetched shard
+            page: Fetched page
+            stored_hash: Content hash recorded in the shard's crawl cursor
+
+        Returns:
+            ShardResult with parsed events
+        """
+        if stored_hash is not None and page.body_hash == stored_hash:
+            print(f"Shard {shard.key} is unchanged, skipping parsing")
+            return ShardResult(shard=shard, unchanged=True, content_hash=page.body_hash)
+
+        events = await parse_events_parallel(page.text)
+        print(f"Parsed {len(events)} events from shard {shard.key}")
+        return ShardResult(
+            shard=shard,
+            events=events,
+            event_count=len(events),
+            content_hash=page.body_hash,
+        )
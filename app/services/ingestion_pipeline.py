@@ -0,0 +1,260 @@
+"""Staged streaming pipeline for event ingestion."""
+
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.services.crawl_planner import CrawlShard, ShardResult
+
+# Marks the end of a stage's output stream
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """
+    Counters of a single pipeline stage.
+
+    Attributes:
+        items_in: Number of items taken from the input queue
+        items_out: Number of items produced
+        busy_seconds: Time spent processing items
+        started_at: Monotonic time the stage started
+        finished_at: Monotonic time the stage finished
+    """
+
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    def as_dict(self, queue: Optional[asyncio.Queue] = None) -> dict:
+        """
+        Get a serializable snapshot of the counters.
+
+        Args:
+            queue: Output queue of the stage, whose depth is reported
+
+        Returns:
+            Dictionary with counters, throughput and queue depth
+        """
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throughput_per_second": (
+                round(self.items_out / elapsed, 2) if elapsed > 0 else 0.0
+            ),
+            "queue_depth": queue.qsize() if queue is not None else 0,
+            "finished": self.finished_at is not None,
+        }
+
+
+class IngestionPipeline:
+    """
+    Streaming ingestion pipeline: fetch -> parse -> normalize -> write.
+
+    Stages run concurrently and are joined by bounded queues, so shards are
+    parsed and written while later shards are still downloading, and a slow
+    stage applies backpressure to the ones before it. At most a few pages
+    and chunks are held in memory at any time, regardless of crawl size.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[CrawlShard], Awaitable],
+        parse_page: Callable[[CrawlShard, object], Awaitable[ShardResult]],
+        build_row: Callable[[dict], Optional[dict]],
+        write_chunk: Callable[[List[dict]], Awaitable[dict]],
+        progress: Optional[dict] = None,
+        fetch_workers: int = settings.CRAWL_CONCURRENCY,
+        parse_workers: int = settings.PIPELINE_PARSE_WORKERS,
+        queue_size: int = settings.PIPELINE_QUEUE_SIZE,
+        chunk_size: int = settings.INGESTION_CHUNK_SIZE,
+    ):
+        """
+        Initialize IngestionPipeline.
+
+        Args:
+            fetch_page: Fetches a shard's page, returns None if the shard failed
+            parse_page: Parses a fetched page into a ShardResult
+            build_row: Converts a parsed event into a database row, None to drop it
+            write_chunk: Writes a chunk of rows, returns inserted/updated/skipped counts
+            progress: Optional dictionary updated in place with counters and stage stats
+            fetch_workers: Number of concurrent fetch workers
+            parse_workers: Number of concurrent parse workers
+            queue_size: Capacity of each queue between stages
+            chunk_size: Number of rows per written chunk
+        """
+        self.fetch_page = fetch_page
+        self.parse_page = parse_page
+        self.build_row = build_row
+        self.write_chunk = write_chunk
+        self.progress = progress if progress is not None else {}
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = max(1, parse_workers)
+        self.chunk_size = chunk_size
+
+        self.pages: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.parsed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.chunks: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.stats: Dict[str, StageStats] = {}
+
+        self.shard_results: List[ShardResult] = []
+        self.counts = {"found": 0, "inserted": 0, "updated": 0, "skipped": 0}
+        self.failed_chunks = 0
+        self._seen_links: Set[str] = set()
+
+    async def run(self, shards: List[CrawlShard]) -> dict:
+        """
+        Run the pipeline over a list of shards.
+
+        Args:
+            shards: Shards to ingest
+
+        Returns:
+            Dictionary with found/inserted/updated/skipped counts
+        """
+        self.progress.update(
+            shards_total=len(shards), shards_done=0, shards_failed=0, shards_unchanged=0
+        )
+        pending = iter(shards)
+        stages = [
+            self._run_stage("fetch", self.fetch_workers, self._fetch_worker, pending, self.pages),
+            self._run_stage("parse", self.parse_workers, self._parse_worker, self.pages, self.parsed),
+            self._run_stage("normalize", 1, self._normalize_worker, self.parsed, self.chunks),
+            self._run_stage("write", 1, self._write_worker, self.chunks, None),
+        ]
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self._report()
+        return dict(self.counts)
+
+    async def _run_stage(self, name, workers, worker, source, output) -> None:
+        """Run a stage's workers and signal the next stage when all are done."""
+        self.stats[name] = StageStats()
+        await asyncio.gather(*(worker(source, output) for _ in range(workers)))
+        self.stats[name].finished_at = time.monotonic()
+        if output is not None:
+            # One end marker per consumer of the next stage
+            consumers = self.parse_workers if output is self.pages else 1
+            for _ in range(consumers):
+                await output.put(_DONE)
+        self._report()
+
+    async def _fetch_worker(self, shards, output: asyncio.Queue) -> None:
+        """Fetch shards from the shared iterator until it is exhausted."""
+        stats = self.stats["fetch"]
+        for shard in shards:
+            stats.items_in += 1
+            started = time.monotonic()
+            page = await self.fetch_page(shard)
+            stats.busy_seconds += time.monotonic() - started
+
+            if page is None:
+                self.progress["shards_failed"] += 1
+                self.shard_results.append(ShardResult(shard=shard, failed=True))
+            else:
+                await output.put((shard, page))
+                stats.items_out += 1
+            self._report()
+
+    async def _parse_worker(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        """Parse fetched pages into events."""
+        stats = self.stats["parse"]
+        while (item := await source.get()) is not _DONE:
+            shard, page = item
+            stats.items_in += 1
+            started = time.monotonic()
+            try:
+                result = await self.parse_page(shard, page)
+            except Exception as e:
+                # Only this shard fails; its crawl state is not saved, so it is retried
+                print(f"Error parsing shard {shard.key}: {e}")
+                traceback.print_exc()
+                self.progress["shards_failed"] += 1
+                self.shard_results.append(ShardResult(shard=shard, failed=True))
+                self._report()
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+
+            self.progress["shards_done"] += 1
+            if result.unchanged:
+                self.progress["shards_unchanged"] += 1
+            if result.events:
+                await output.put(result.events)
+                stats.items_out += 1
+            # Only metadata is kept, events move on to the next stage
+            result.events = []
+            self.shard_results.append(result)
+            self._report()
+
+    async def _normalize_worker(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        """
+        Convert parsed events into rows and group them into chunks.
+
+        Events found by several shards are kept once, the first one parsed wins.
+        """
+        stats = self.stats["normalize"]
+        buffer = []
+        while (events := await source.get()) is not _DONE:
+            stats.items_in += 1
+            started = time.monotonic()
+            events = [event for event in events if event["link"] not in self._seen_links]
+            self._seen_links.update(event["link"] for event in events)
+            rows = [row for row in map(self.build_row, events) if row]
+            stats.busy_seconds += time.monotonic() - started
+
+            self.counts["found"] += len(events)
+            self.counts["skipped"] += len(events) - len(rows)
+            buffer.extend(rows)
+            while len(buffer) >= self.chunk_size:
+                await output.put(buffer[: self.chunk_size])
+                stats.items_out += 1
+                buffer = buffer[self.chunk_size :]
+            self._report()
+        if buffer:
+            await output.put(buffer)
+            stats.items_out += 1
+
+    async def _write_worker(self, source: asyncio.Queue, _output) -> None:
+        """Write chunks of rows to the database."""
+        stats = self.stats["write"]
+        while (chunk := await source.get()) is not _DONE:
+            stats.items_in += 1
+            started = time.monotonic()
+            try:
+                chunk_counts = await self.write_chunk(chunk)
+            except Exception as e:
+                print(f"Error writing chunk of {len(chunk)} events: {e}")
+                traceback.print_exc()
+                self.failed_chunks += 1
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+
+            for key, value in chunk_counts.items():
+                self.counts[key] += value
+            stats.items_out += 1
+            self._report()
+
+    def _report(self) -> None:
+        """Publish counters and per-stage stats to the progress dictionary."""
+        outputs = {"fetch": self.pages, "parse": self.parsed, "normalize": self.chunks}
+        self.progress.update(self.counts)
+        self.progress["pipeline"] = {
+            name: stats.as_dict(outputs.get(name)) for name, stats in self.stats.items()
+        }
@@ -0,0 +1,376 @@
+"""Background job queue for event ingestion."""
+
+import asyncio
+import json
+import traceback
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.db.locks import advisory_lock
+from app.models.ingestion_run import IngestionRun
+from app.repositories.ingestion_run_repository import IngestionRunRepository
+from app.schemas.job import IngestionJobResponse, JobStatus
+from app.services.event_service import EventService
+
+# Advisory lock namespace of ingestion runs
+INGESTION_LOCK_NAMESPACE = "ingestion"
+
+
+def normalize_ingestion_params(params: dict) -> dict:
+    """
+    Normalize ingestion parameters so equal filter sets compare equal.
+
+    List values are de-duplicated and sorted; scalar values are kept as is.
+
+    Args:
+        params: Keyword arguments for EventService.fetch_and_save_events
+
+    Returns:
+        Normalized copy of the parameters
+    """
+    return {
+        key: sorted(set(value)) if isinstance(value, list) else value
+        for key, value in sorted(params.items())
+    }
+
+
+def ingestion_key(params: dict) -> str:
+    """
+    Build a stable key identifying an ingestion filter set.
+
+    Args:
+        params: Keyword arguments for EventService.fetch_and_save_events
+
+    Returns:
+        Canonical JSON string of the normalized parameters
+    """
+    return json.dumps(
+        normalize_ingestion_params(params), ensure_ascii=False, sort_keys=True
+    )
+
+
+def run_to_response(run: IngestionRun) -> IngestionJobResponse:
+    """
+    Convert a recorded ingestion run to the API representation of its job.
+
+    Progress counters live only in the memory of the worker running the
+    job, so they are not available for a recorded run.
+
+    Args:
+        run: Latest run of a filter set
+
+    Returns:
+        IngestionJobResponse of the job that performed the run
+    """
+    duration = None
+    if run.started_at and run.finished_at:
+        duration = (run.finished_at - run.started_at).total_seconds()
+    return IngestionJobResponse(
+        id=run.run_id,
+        status=JobStatus(run.status),
+        params=run.params or {},
+        progress={},
+        result=run.result,
+        error=run.error,
+        created_at=run.started_at,
+        started_at=run.started_at,
+        finished_at=run.finished_at,
+        duration_seconds=duration,
+    )
+
+
+@dataclass
+class IngestionJob:
+    """State of a single ingestion job."""
+
+    id: str
+    key: str
+    params: dict
+    status: JobStatus = JobStatus.QUEUED
+    progress: dict = field(default_factory=dict)
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is still queued or running."""
+        return self.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+    def to_response(self) -> IngestionJobResponse:
+        """Convert job state to its API representation."""
+        duration = None
+        if self.started_at:
+            duration = (
+                (self.finished_at or datetime.utcnow()) - self.started_at
+            ).total_seconds()
+        return IngestionJobResponse(
+            id=self.id,
+            status=self.status,
+            params=self.params,
+            progress=dict(self.progress),
+            result=self.result,
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            duration_seconds=duration,
+        )
+
+
+class IngestionJobManager:
+    """
+    In-process queue and worker pool for ingestion jobs.
+
+    Jobs are executed by background asyncio tasks, each with its own database
+    session. Submitting a filter set that already has a queued or running job
+    returns that job instead of creating a new one.
+
+    Across application workers, ingestion of a filter set is guarded by a
+    Postgres advisory lock: a job whose filter set is being ingested by
+    another worker waits for that run and reports its result instead of
+    crawling the same shards again.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.INGESTION_WORKERS,
+        history_size: int = settings.INGESTION_JOB_HISTORY,
+    ):
+        """
+        Initialize IngestionJobManager.
+
+        Args:
+            workers: Number of concurrent worker tasks
+            history_size: Number of finished jobs kept for status queries
+        """
+        self.workers = workers
+        self.history_size = history_size
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._active_by_key: Dict[str, IngestionJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def submit(self, params: dict) -> Tuple[IngestionJob, bool]:
+        """
+        Enqueue an ingestion job, deduplicating by filter set.
+
+        Args:
+            params: Keyword arguments for EventService.fetch_and_save_events
+
+        Returns:
+            Tuple of (job, created) where created is False if an active job
+            with the same filter set already existed
+        """
+        key = ingestion_key(params)
+        active = self._active_by_key.get(key)
+        if active and active.is_active:
+            return active, False
+
+        self._ensure_workers()
+        job = IngestionJob(
+            id=uuid.uuid4().hex,
+            key=key,
+            params=normalize_ingestion_params(params),
+        )
+        self._jobs[job.id] = job
+        self._active_by_key[key] = job
+        self._trim_history()
+        self._queue.put_nowait(job)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        """
+        Get a job by its id.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            IngestionJob if known, None otherwise
+        """
+        return self._jobs.get(job_id)
+
+    async def get_response(self, job_id: str) -> Optional[IngestionJobResponse]:
+        """
+        Get the status of a job started by any application worker.
+
+        Jobs of this worker are answered from memory; jobs of other workers
+        from their recorded ingestion run.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            IngestionJobResponse if the job is known, None otherwise
+        """
+        job = self.get(job_id)
+        if job is not None:
+            return job.to_response()
+        async with AsyncSessionLocal() as session:
+            run = await IngestionRunRepository(session).get_by_run_id(job_id)
+        return run_to_response(run) if run is not None else None
+
+    async def start(self) -> None:
+        """Start worker tasks. Called on application startup."""
+        self._ensure_workers()
+
+    async def stop(self) -> None:
+        """Cancel worker tasks. Called on application shutdown."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _ensure_workers(self) -> None:
+        """Create the queue and worker tasks if they are not running."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._tasks = [task for task in self._tasks if not task.done()]
+        while len(self._tasks) < self.workers:
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    def _trim_history(self) -> None:
+        """Drop the oldest finished jobs above the history limit."""
+        finished = [job for job in self._jobs.values() if not job.is_active]
+        for job in finished[: max(0, len(self._jobs) - self.history_size)]:
+            del self._jobs[job.id]
+
+    async def _worker(self) -> None:
+        """Take jobs from the queue and run them one at a time."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: IngestionJob) -> None:
+        """Run a single ingestion job and record its outcome."""
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        print(f"Ingestion job {job.id} started with params {job.params}")
+        try:
+            job.result = await self._run_exclusive(job)
+            job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            print(f"Ingestion job {job.id} failed: {e}")
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = datetime.utcnow()
+            if self._active_by_key.get(job.key) is job:
+                del self._active_by_key[job.key]
+            print(f"Ingestion job {job.id} finished with status {job.status.value}")
+
+    async def _run_exclusive(self, job: IngestionJob) -> dict:
+        """
+        Run the job's ingestion, or attach to the same run in another worker.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            Result of the ingestion, either this job's or the attached run's
+
+        Raises:
+            TimeoutError: If the attached run does not finish within
+                settings.INGESTION_ATTACH_TIMEOUT
+            RuntimeError: If the attached run failed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.INGESTION_ATTACH_TIMEOUT
+        attached_to = None
+
+        while True:
+            async with advisory_lock(INGESTION_LOCK_NAMESPACE, job.key) as acquired:
+                run = await self._get_run(job.key)
+                if (
+                    attached_to
+                    and run is not None
+                    and run.run_id == attached_to
+                    and run.status != JobStatus.RUNNING.value
+                ):
+                    return self._attached_result(job, run)
+                if acquired:
+                    # Either nobody was running or the holder died mid-run
+                    return await self._ingest(job)
+
+            if run is not None and run.status == JobStatus.RUNNING.value:
+                if run.run_id != attached_to:
+                    print(f"Ingestion job {job.id} attached to run {run.run_id}")
+                    job.progress.update(stage="attached", attached_to=run.run_id)
+                attached_to = run.run_id
+            if loop.time() > deadline:
+                raise TimeoutError(
+                    f"Ingestion run {attached_to} did not finish in time"
+                )
+            await asyncio.sleep(settings.INGESTION_ATTACH_POLL_INTERVAL)
+
+    async def _get_run(self, key: str) -> Optional[IngestionRun]:
+        """Get the latest recorded run of a filter set."""
+        async with AsyncSessionLocal() as session:
+            return await IngestionRunRepository(session).get_by_key(key)
+
+    @staticmethod
+    def _attached_result(job: IngestionJob, run: IngestionRun) -> dict:
+        """Take over the outcome of a run finished by another worker."""
+        job.progress.update(stage="done")
+        if run.status == JobStatus.FAILED.value:
+            raise RuntimeError(f"Attached ingestion run {run.run_id} failed: {run.error}")
+        return dict(run.result or {}, attached_to=run.run_id)
+
+    async def _ingest(self, job: IngestionJob) -> dict:
+        """Ingest the job's filter set, recording the run for other workers."""
+        async with AsyncSessionLocal() as session:
+            runs = IngestionRunRepository(session)
+            await runs.save(
+                {
+                    "key": job.key,
+                    "run_id": job.id,
+                    "status": JobStatus.RUNNING.value,
+                    "params": job.params,
+                    "result": None,
+                    "error": None,
+                    "started_at": job.started_at,
+                    "finished_at": None,
+                }
+            )
+            try:
+                service = EventService(session)
+                result = await service.fetch_and_save_events(
+                    **job.params, progress=job.progress
+                )
+            except Exception as e:
+                await session.rollback()
+                await runs.save(
+                    {
+                        "key": job.key,
+                        "run_id": job.id,
+                        "status": JobStatus.FAILED.value,
+                        "error": str(e),
+                        "finished_at": datetime.utcnow(),
+                    }
+                )
+                raise
+            await runs.save(
+                {
+                    "key": job.key,
+                    "run_id": job.id,
+                    "status": JobStatus.SUCCEEDED.value,
+                    "result": result,
+                    "finished_at": datetime.utcnow(),
+                }
+            )
+            return result
+
+
+job_manager = IngestionJobManager()
@@ -0,0 +1,298 @@
+"""Background polling of live results during running competitions."""
+
+import asyncio
+import traceback
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.db.locks import advisory_lock
+from app.core.http_cache import CachingFetcher
+from app.repositories.event_repository import EventRepository
+from app.repositories.result_repository import ResultRepository
+from app.services.broadcast import publish_result_changes
+from app.services.result_service import (
+    ResultService,
+    build_result_rows,
+    diff_page_results,
+    fetch_live_page,
+    live_results_pages,
+    result_key,
+)
+from app.utils.parsers import parse_live_results
+
+# Advisory lock namespace electing the one worker that polls an event
+LIVE_POLL_LOCK_NAMESPACE = "live-results"
+
+
+@dataclass
+class LivePageSnapshot:
+    """
+    Last polled state of a live results page.
+
+    Attributes:
+        event_link: Event link
+        page: Live results page name
+        rows: Result rows in page order, or in place order when read from the database
+        version: Number of polls that found changes
+        interval: Seconds until the next poll
+        fetched_at: Time of the last successful poll
+        changed_at: Time of the last poll that found changes
+        error: Error of the last poll, None if it succeeded
+        body_hash: Hash of the page body the rows were built from, None until
+            this worker has polled the page itself
+    """
+
+    event_link: str
+    page: str
+    rows: List[dict] = field(default_factory=list)
+    version: int = 0
+    interval: float = settings.LIVE_POLL_MIN_INTERVAL
+    fetched_at: Optional[datetime] = None
+    changed_at: Optional[datetime] = None
+    error: Optional[str] = None
+    body_hash: Optional[str] = None
+
+    @property
+    def hashes(self) -> Dict[Tuple[str, str], str]:
+        """Content hashes of the rows by (athlete, team)."""
+        return {result_key(row): row["content_hash"] for row in self.rows}
+
+    def to_dict(self) -> dict:
+        """Serializable representation of the snapshot."""
+        return {
+            "event": self.event_link,
+            "page": self.page,
+            "version": self.version,
+            "interval_seconds": self.interval,
+            "fetched_at": self.fetched_at,
+            "changed_at": self.changed_at,
+            "error": self.error,
+            "rows": self.rows,
+        }
+
+
+def next_interval(interval: float, changed: bool) -> float:
+    """
+    Compute the delay before the next poll of a page.
+
+    Args:
+        interval: Current delay in seconds
+        changed: Whether the last poll found changes
+
+    Returns:
+        settings.LIVE_POLL_MIN_INTERVAL after a change, otherwise the current
+        delay grown by settings.LIVE_POLL_BACKOFF up to settings.LIVE_POLL_MAX_INTERVAL
+    """
+    if changed:
+        return settings.LIVE_POLL_MIN_INTERVAL
+    return min(interval * settings.LIVE_POLL_BACKOFF, settings.LIVE_POLL_MAX_INTERVAL)
+
+
+class LiveResultsPoller:
+    """
+    Polls live results pages of running events on an adaptive interval.
+
+    Events whose startdate..enddate covers today are discovered every
+    settings.LIVE_POLL_DISCOVERY_INTERVAL seconds and each of their pages
+    gets its own polling task. A page is polled often while its results
+    change and less and less often while they do not. Each poll is diffed
+    against the previous snapshot and only changed rows are written and
+    published to stream subscribers.
+    Only the worker holding an event's advisory lock polls its pages; the
+    other workers refresh their snapshots from the stored rows every
+    settings.LIVE_POLL_MIN_INTERVAL seconds and take over if it goes away.
+    Snapshots are kept in memory, so clients read them without ever
+    triggering a scrape.
+    """
+
+    def __init__(self):
+        """Initialize LiveResultsPoller."""
+        self.snapshots: Dict[Tuple[str, str], LivePageSnapshot] = {}
+        self.fetcher = CachingFetcher()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._discovery: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start discovering running events. Called on application startup."""
+        if settings.LIVE_POLL_ENABLED and self._discovery is None:
+            self._discovery = asyncio.create_task(self._discover_forever())
+
+    async def stop(self) -> None:
+        """Cancel discovery and polling tasks. Called on application shutdown."""
+        tasks = list(self._tasks.values())
+        if self._discovery is not None:
+            tasks.append(self._discovery)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._discovery = None
+
+    def get_event(self, event_link: str) -> List[LivePageSnapshot]:
+        """
+        Get snapshots of an event's polled pages.
+
+        Args:
+            event_link: Event link
+
+        Returns:
+            List of snapshots, empty if the event is not being polled
+        """
+        return [
+            snapshot
+            for (link, _), snapshot in self.snapshots.items()
+            if link == event_link
+        ]
+
+    def polled_events(self) -> List[str]:
+        """
+        Get links of the events being polled.
+
+        Returns:
+            Sorted list of event links
+        """
+        return sorted(self._tasks)
+
+    def track(self, event_links: List[str]) -> None:
+        """
+        Poll the pages of the given events and stop polling all others.
+
+        Args:
+            event_links: Links of the running events
+        """
+        wanted = set(event_links)
+        for link in list(self._tasks):
+            if link not in wanted:
+                self._tasks.pop(link).cancel()
+                for key in [key for key in self.snapshots if key[0] == link]:
+                    del self.snapshots[key]
+        for link in wanted - set(self._tasks):
+            self._tasks[link] = asyncio.create_task(self._run_event(link))
+
+    async def _discover_forever(self) -> None:
+        """Track running events, re-checking them periodically."""
+        while True:
+            try:
+                today = date.today().isoformat()
+                async with AsyncSessionLocal() as session:
+                    events = await EventRepository(session).get_running(today)
+                self.track([event.link for event in events])
+                print(f"Polling live results of {len(events)} running events")
+            except Exception as e:
+                print(f"Error discovering running events: {e}")
+                traceback.print_exc()
+            await asyncio.sleep(settings.LIVE_POLL_DISCOVERY_INTERVAL)
+
+    async def _run_event(self, event_link: str) -> None:
+        """Poll an event's pages while leading it, otherwise follow the leader."""
+        pages = live_results_pages()
+        while True:
+            try:
+                async with advisory_lock(LIVE_POLL_LOCK_NAMESPACE, event_link) as acquired:
+                    if acquired:
+                        print(f"Polling live results of {event_link}")
+                        await asyncio.gather(
+                            *(self._poll_forever(event_link, page) for page in pages)
+                        )
+                await self.follow(event_link, pages)
+            except Exception as e:
+                print(f"Error following live results of {event_link}: {e}")
+                traceback.print_exc()
+            await asyncio.sleep(settings.LIVE_POLL_MIN_INTERVAL)
+
+    async def follow(self, event_link: str, pages: List[str]) -> None:
+        """
+        Refresh the snapshots of an event polled by another worker from the database.
+
+        Args:
+            event_link: Event link
+            pages: Live results page names of the event
+        """
+        async with AsyncSessionLocal() as session:
+            stored = await ResultRepository(session).get_event_rows(event_link)
+        now = datetime.now()
+        for page in pages:
+            snapshot = self.snapshots.setdefault(
+                (event_link, page), LivePageSnapshot(event_link, page)
+            )
+            rows = [row for row in stored if row["page"] == page]
+            if {result_key(row): row["content_hash"] for row in rows} != snapshot.hashes:
+                snapshot.rows = rows
+                snapshot.version += 1
+                snapshot.changed_at = now
+            snapshot.fetched_at = now
+            snapshot.interval = settings.LIVE_POLL_MIN_INTERVAL
+            snapshot.error = None
+            # The leader's body is unknown here, so a takeover diffs against stored rows
+            snapshot.body_hash = None
+
+    async def _poll_forever(self, event_link: str, page: str) -> None:
+        """Poll a page until its event stops running."""
+        key = (event_link, page)
+        snapshot = self.snapshots.setdefault(key, LivePageSnapshot(event_link, page))
+        while True:
+            changed = False
+            try:
+                changed = await self.poll(snapshot)
+                snapshot.error = None
+            except Exception as e:
+                print(f"Error polling live results {event_link}/{page}: {e}")
+                snapshot.error = str(e)
+            snapshot.interval = next_interval(snapshot.interval, changed)
+            await asyncio.sleep(snapshot.interval)
+
+    async def poll(self, snapshot: LivePageSnapshot) -> bool:
+        """
+        Poll a page once and apply its changes.
+
+        Args:
+            snapshot: Snapshot of the page, updated in place
+
+        Returns:
+            True if the page's results changed since the previous poll
+        """
+        event_link, page = snapshot.event_link, snapshot.page
+        fetched = await fetch_live_page(event_link, page, self.fetcher)
+        now = datetime.now()
+        # The HTTP cache is shared, so the body is compared with the one this
+        # snapshot was built from rather than with the last fetch
+        if fetched.body_hash == snapshot.body_hash:
+            snapshot.fetched_at = now
+            return False
+
+        parsed = await asyncio.to_thread(parse_live_results, fetched.text)
+        rows = build_result_rows(event_link, page, parsed)
+        async with AsyncSessionLocal() as session:
+            service = ResultService(session)
+            # The first poll diffs against the stored rows instead of an empty snapshot
+            previous = (
+                snapshot.hashes
+                if snapshot.body_hash is not None
+                else await service.repository.get_page_hashes(event_link, page)
+            )
+            changed, removed = diff_page_results(rows, previous)
+            if changed or removed:
+                counts = await service.apply_page_results(
+                    event_link, page, rows, previous, body_hash=fetched.body_hash
+                )
+                if counts["inserted"] or counts["updated"] or counts["deleted"]:
+                    await publish_result_changes(event_link, page, changed, removed)
+
+        snapshot.body_hash = fetched.body_hash
+        snapshot.fetched_at = now
+        if not (changed or removed) and snapshot.version:
+            return False
+        snapshot.rows = rows
+        snapshot.version += 1
+        snapshot.changed_at = now
+        print(
+            f"Live results {event_link}/{page}: {len(changed)} changed, "
+            f"{len(removed)} removed rows"
+        )
+        return bool(changed or removed)
+
+
+live_poller = LiveResultsPoller()
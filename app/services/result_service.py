@@ -0,0 +1,274 @@
+"""Service layer for live Result business logic."""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.http_cache import CachingFetcher, FetchResult
+from app.models.result import Result
+from app.repositories.result_repository import ResultRepository
+from app.services.team_service import live_results_breaker
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.parsers import parse_live_results
+from app.utils.utils import compute_event_hash, parse_live_page_name
+
+
+def live_results_pages() -> List[str]:
+    """
+    Get the live results pages ingested for every event.
+
+    Returns:
+        settings.LIVE_RESULTS_PAGES, or settings.LIVE_RESULTS_PATH if it is empty
+    """
+    return list(settings.LIVE_RESULTS_PAGES) or [settings.LIVE_RESULTS_PATH]
+
+
+def live_results_url(event_link: str, page: str) -> str:
+    """
+    Build the URL of a live results page.
+
+    Args:
+        event_link: Event link
+        page: Live results page name
+
+    Returns:
+        Page URL
+    """
+    return f"{settings.LIVE_RESULTS_BASE_URL}{event_link}/{page}"
+
+
+async def fetch_live_page(
+    event_link: str, page: str, fetcher: Optional[CachingFetcher] = None
+) -> FetchResult:
+    """
+    Fetch a live results page through the live results circuit breaker.
+
+    Args:
+        event_link: Event link
+        page: Live results page name
+        fetcher: Fetcher to use, defaults to a new CachingFetcher
+
+    Returns:
+        FetchResult with the page body
+
+    Raises:
+        CircuitOpenError: If the live results site is failing
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    fetcher = fetcher or CachingFetcher()
+    return await live_results_breaker.call(
+        fetcher.fetch,
+        live_results_url(event_link, page),
+        timeout=settings.LIVE_RESULTS_TIMEOUT,
+    )
+
+
+def result_key(row: dict) -> Tuple[str, str]:
+    """Identity of a result row within its page."""
+    return row["athlete"], row["team"]
+
+
+def build_result_rows(event_link: str, page: str, parsed: List[dict]) -> List[dict]:
+    """
+    Convert parsed live results into Result rows.
+
+    Discipline, round and group are taken from the page name. Repeated
+    (athlete, team) rows are dropped, the first one wins.
+
+    Args:
+        event_link: Event link
+        page: Live results page name
+        parsed: Rows produced by parse_live_results
+
+    Returns:
+        List of Result column dictionaries with content hashes
+    """
+    meta = parse_live_page_name(page)
+    rows = {}
+    for item in parsed:
+        row = {
+            "event_link": event_link,
+            "page": page,
+            "group_name": meta["group"],
+            "discipline": meta["discipline"],
+            "round": meta["round"],
+            "athlete": item["athlete"],
+            "team": item.get("team") or "",
+            "place": item.get("place"),
+            "score": item.get("score") or "",
+        }
+        row["content_hash"] = compute_event_hash(row)
+        rows.setdefault(result_key(row), row)
+    return list(rows.values())
+
+
+def diff_page_results(
+    rows: List[dict], previous: Dict[Tuple[str, str], str]
+) -> Tuple[List[dict], List[Tuple[str, str]]]:
+    """
+    Compare the current rows of a page with its previous rows.
+
+    Args:
+        rows: Current Result rows of the page
+        previous: Content hashes of the previous rows by (athlete, team)
+
+    Returns:
+        Tuple of (new or changed rows, sorted keys of removed rows)
+    """
+    changed = [row for row in rows if previous.get(result_key(row)) != row["content_hash"]]
+    removed = sorted(set(previous) - {result_key(row) for row in rows})
+    return changed, removed
+
+
+class ResultService:
+    """Service for live Result business logic and operations."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize ResultService.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+        self.repository = ResultRepository(db)
+        self.fetcher = CachingFetcher()
+
+    async def ingest_event_results(
+        self, event_link: str, pages: Optional[List[str]] = None
+    ) -> dict:
+        """
+        Fetch, parse and store the live results pages of an event.
+
+        Pages whose body is the one the stored rows were built from are not
+        parsed again. Only new and changed rows are written; rows that
+        disappeared from a page are deleted.
+
+        Args:
+            event_link: Event link
+            pages: Live results page names, defaults to live_results_pages()
+
+        Returns:
+            Dictionary with per-page counts and totals of inserted, updated,
+            deleted and unchanged rows
+        """
+        pages = pages or live_results_pages()
+        totals = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        page_counts: Dict[str, dict] = {}
+
+        for page in pages:
+            try:
+                fetched = await self.fetch_page(event_link, page)
+            except (CircuitOpenError, httpx.HTTPError) as e:
+                print(f"Error fetching live results {event_link}/{page}: {e}")
+                page_counts[page] = {"error": str(e)}
+                continue
+
+            # The HTTP cache is shared with other readers, so the page is compared
+            # with the body its stored rows came from rather than the last fetch
+            stored_hash = await self.repository.get_page_body_hash(event_link, page)
+            if stored_hash == fetched.body_hash:
+                page_counts[page] = {"unchanged_page": True}
+                continue
+
+            parsed = await asyncio.to_thread(parse_live_results, fetched.text)
+            rows = build_result_rows(event_link, page, parsed)
+            previous = await self.repository.get_page_hashes(event_link, page)
+            counts = await self.apply_page_results(
+                event_link, page, rows, previous, body_hash=fetched.body_hash
+            )
+            page_counts[page] = counts
+            for key in totals:
+                totals[key] += counts[key]
+
+        print(f"Ingested live results of {event_link}: {totals}")
+        return {"event": event_link, "pages": page_counts, **totals}
+
+    async def fetch_page(self, event_link: str, page: str) -> FetchResult:
+        """
+        Fetch a live results page through the live results circuit breaker.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+
+        Returns:
+            FetchResult with the page body
+
+        Raises:
+            CircuitOpenError: If the live results site is failing
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        return await fetch_live_page(event_link, page, self.fetcher)
+
+    async def apply_page_results(
+        self,
+        event_link: str,
+        page: str,
+        rows: List[dict],
+        previous: Dict[Tuple[str, str], str],
+        body_hash: Optional[str] = None,
+    ) -> dict:
+        """
+        Write the difference between a page's new rows and its previous rows.
+
+        Args:
+            event_link: Event link
+            page: Live results page name
+            rows: Current Result rows of the page
+            previous: Content hashes of the previous rows by (athlete, team)
+            body_hash: Hash of the page body the rows were built from, recorded
+                once they are written
+
+        Returns:
+            Dictionary with numbers of inserted, updated, deleted and unchanged rows
+        """
+        changed, removed = diff_page_results(rows, previous)
+        counts = await self.repository.upsert_results(changed)
+        deleted = await self.repository.delete_results(event_link, page, removed)
+        if body_hash is not None:
+            await self.repository.save_page_body_hash(event_link, page, body_hash)
+        return {
+            "inserted": counts["inserted"],
+            "updated": counts["updated"],
+            "deleted": deleted,
+            "unchanged": len(rows) - len(changed) + counts["skipped"],
+        }
+
+    async def search_results(
+        self,
+        athlete: Optional[str] = None,
+        team: Optional[str] = None,
+        event_link: Optional[str] = None,
+        discipline: Optional[str] = None,
+        round_: Optional[str] = None,
+        group: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Result]:
+        """
+        Search stored live results.
+
+        Args:
+            athlete: Athlete name prefix, case-insensitive
+            team: Team name prefix, case-insensitive
+            event_link: Event link
+            discipline: Discipline
+            round_: Round
+            group: Participant group
+            limit: Maximum number of rows
+
+        Returns:
+            List of Result objects
+        """
+        return await self.repository.search(
+            athlete=athlete,
+            team=team,
+            event_link=event_link,
+            discipline=discipline,
+            round_=round_,
+            group=group,
+            limit=limit,
+        )
@@ -0,0 +1,241 @@
+"""Season-wide crawl of the teams taking part in every event of a year."""
+
+import asyncio
+import traceback
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.db.locks import advisory_lock
+from app.core.http_cache import CachingFetcher
+from app.models.event import Event
+from app.repositories.event_repository import EventRepository
+from app.repositories.team_event_repository import TeamEventRepository
+from app.services.result_service import live_results_pages, live_results_url
+from app.services.team_service import live_results_breaker
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.parsers import parse_live_results
+from app.utils.throttle import HostThrottle
+
+# Advisory lock namespace of season team crawls
+SEASON_CRAWL_LOCK_NAMESPACE = "team-season"
+
+# Season crawls started in this process, by year
+_season_crawls: Dict[str, "SeasonTeamCrawl"] = {}
+
+
+def extract_teams(parsed: List[dict]) -> List[str]:
+    """
+    Get the unique team names of parsed live results.
+
+    Args:
+        parsed: Rows produced by parse_live_results
+
+    Returns:
+        Sorted list of non-empty team names
+    """
+    return sorted({row["team"] for row in parsed if row.get("team")})
+
+
+class SeasonTeamCrawl:
+    """
+    Builds the team -> events index for every event of a year.
+
+    The live results pages of all events of the year are fetched
+    concurrently, at most `concurrency` events at a time, with request
+    starts to one host spaced by `host_delay` seconds. Requests go through
+    the conditional-GET cache and live_results_breaker, so unchanged
+    pages are cheap and a failing site stops the crawl quickly. Each
+    event's teams are written as soon as its pages are parsed; events
+    without a live results page, or whose pages failed, keep their
+    previously indexed teams.
+    """
+
+    def __init__(
+        self,
+        year: str,
+        concurrency: int = settings.SEASON_CRAWL_CONCURRENCY,
+        host_delay: float = settings.SEASON_CRAWL_HOST_DELAY,
+    ):
+        """
+        Initialize SeasonTeamCrawl.
+
+        Args:
+            year: Competition year
+            concurrency: Maximum number of events crawled at once
+            host_delay: Minimum seconds between requests to one host
+        """
+        self.year = year
+        self.concurrency = concurrency
+        self.fetcher = CachingFetcher()
+        self.throttle = HostThrottle(host_delay)
+        self.task: Optional[asyncio.Task] = None
+        self.progress = {
+            "year": year,
+            "stage": "queued",
+            "events_total": 0,
+            "events_done": 0,
+            "events_missing": 0,
+            "events_failed": 0,
+            "teams": 0,
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+        }
+        self._teams: set = set()
+
+    @property
+    def done(self) -> bool:
+        """Whether the crawl has finished, successfully or not."""
+        return self.task is not None and self.task.done()
+
+    async def run(self) -> dict:
+        """
+        Crawl the season unless another worker is already crawling it.
+
+        Returns:
+            Progress dictionary with the final counters
+        """
+        self.progress.update(stage="running", started_at=datetime.now())
+        try:
+            async with advisory_lock(SEASON_CRAWL_LOCK_NAMESPACE, self.year) as acquired:
+                if not acquired:
+                    self.progress.update(
+                        stage="skipped", error="Season is being crawled by another worker"
+                    )
+                    return self.progress
+                await self._crawl()
+            self.progress["stage"] = "done"
+        except Exception as e:
+            print(f"Error crawling teams of season {self.year}: {e}")
+            traceback.print_exc()
+            self.progress.update(stage="failed", error=str(e))
+        finally:
+            self.progress["finished_at"] = datetime.now()
+        return self.progress
+
+    async def _crawl(self) -> None:
+        """Crawl every event of the year with bounded concurrency."""
+        async with AsyncSessionLocal() as session:
+            events = await EventRepository(session).get_by_year(self.year)
+        self.progress["events_total"] = len(events)
+        print(f"Crawling teams of {len(events)} events of season {self.year}")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def crawl(event: Event) -> None:
+            async with semaphore:
+                try:
+                    await self.crawl_event(event.link, event.name)
+                except Exception as e:
+                    # A parse or database error fails only this event
+                    print(f"Error crawling teams of {event.link}: {e}")
+                    traceback.print_exc()
+                    self.progress["events_failed"] += 1
+
+        await asyncio.gather(*(crawl(event) for event in events))
+        print(f"Season {self.year} team crawl: {self.progress}")
+
+    async def crawl_event(self, event_link: str, event_name: Optional[str]) -> None:
+        """
+        Fetch an event's live results pages and index its teams.
+
+        Args:
+            event_link: Event link
+            event_name: Event name
+        """
+        try:
+            teams = await self.fetch_event_teams(event_link)
+        except (CircuitOpenError, httpx.HTTPError) as e:
+            print(f"Error fetching teams of {event_link}: {e}")
+            self.progress["events_failed"] += 1
+            return
+
+        if teams is None:
+            self.progress["events_missing"] += 1
+            return
+
+        async with AsyncSessionLocal() as session:
+            await TeamEventRepository(session).replace_event_teams(
+                event_link, teams, year=self.year, event_name=event_name
+            )
+        self._teams.update(teams)
+        self.progress["events_done"] += 1
+        self.progress["teams"] = len(self._teams)
+
+    async def fetch_event_teams(self, event_link: str) -> Optional[List[str]]:
+        """
+        Get the teams on an event's live results pages.
+
+        Args:
+            event_link: Event link
+
+        Returns:
+            Sorted list of team names, or None if the event has no live results pages
+
+        Raises:
+            CircuitOpenError: If the live results site is failing
+            httpx.HTTPError: If a page cannot be fetched
+        """
+        parsed: List[dict] = []
+        found = False
+        for page in live_results_pages():
+            url = live_results_url(event_link, page)
+            await self.throttle.wait(url)
+            try:
+                fetched = await live_results_breaker.call(
+                    self.fetcher.fetch, url, timeout=settings.LIVE_RESULTS_TIMEOUT
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    continue
+                raise
+            found = True
+            parsed += await asyncio.to_thread(parse_live_results, fetched.text)
+        return extract_teams(parsed) if found else None
+
+
+def start_season_crawl(year: str) -> Tuple[SeasonTeamCrawl, bool]:
+    """
+    Start a season team crawl in a background task.
+
+    At most one crawl per year runs at a time in this process.
+
+    Args:
+        year: Competition year
+
+    Returns:
+        Tuple of (crawl, created); created is False if a crawl of the year
+        was already running and is returned instead
+    """
+    crawl = _season_crawls.get(year)
+    if crawl is not None and not crawl.done:
+        return crawl, False
+    crawl = SeasonTeamCrawl(year)
+    crawl.task = asyncio.create_task(crawl.run())
+    _season_crawls[year] = crawl
+    return crawl, True
+
+
+def get_season_crawl(year: str) -> Optional[SeasonTeamCrawl]:
+    """
+    Get the latest season team crawl of a year started in this process.
+
+    Args:
+        year: Competition year
+
+    Returns:
+        SeasonTeamCrawl, or None if none was started
+    """
+    return _season_crawls.get(year)
+
+
+async def stop_season_crawls() -> None:
+    """Cancel running season team crawls. Called on application shutdown."""
+    tasks = [crawl.task for crawl in _season_crawls.values() if crawl.task is not None]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,15 +1,72 @@
 """Service layer for Team business logic."""
 
+import asyncio
 import traceback
+from typing import Dict, List, Optional, Tuple
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.db.database import AsyncSessionLocal
+from app.core.db.invalidation import invalidation_bus
+from app.core.db.locks import advisory_lock
+from app.core.http_cache import CachingFetcher
+from app.core.http_client import get_http_client
 from app.models.event import Event
+from app.models.team import TeamCache
+from app.models.team_event import TeamEvent
+from app.repositories.team_event_repository import TeamEventRepository
 from app.repositories.team_repository import TeamRepository
+from app.utils.cell_stream import parse_cells_stream
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.singleflight import SingleFlight
+from app.utils.ttl_cache import TTLCache
+
+# Advisory lock namespace of team cache loads
+TEAM_LOCK_NAMESPACE = "teams"
+
+# Background refreshes of stale team cache entries, by (year, event link)
+_refresh_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
+# Team cache misses being loaded in this process, by (year, event link)
+_team_loads = SingleFlight()
+
+# Team cache rows read by this process, by (year, event link): the cached
+# response and the row's age when it was read. Kept in step with the
+# database by the cache invalidation bus.
+team_entries = TTLCache(
+    max_entries=settings.TEAM_LOCAL_CACHE_MAX_ENTRIES,
+    ttl=settings.TEAM_LOCAL_CACHE_TTL_SECONDS,
+)
+
+
+def _evict_team_entries(years: List[str], links: List[str]) -> None:
+    """Evict the local team cache entries of the given years and event links."""
+    team_entries.evict(
+        lambda key: (not years or key[0] in years) and (not links or key[1] in links)
+    )
+
+
+invalidation_bus.register("teams", evict=_evict_team_entries, clear=team_entries.clear)
+
+
+def _is_upstream_failure(e: Exception) -> bool:
+    """Timeouts, connection errors and server errors count as upstream failures."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, httpx.TransportError)
+
+
+# Fails live results fetches fast while the site is down
+live_results_breaker = CircuitBreaker(
+    "live-results",
+    failure_threshold=settings.LIVE_RESULTS_BREAKER_FAILURES,
+    reset_timeout=settings.LIVE_RESULTS_BREAKER_COOLDOWN,
+    is_failure=_is_upstream_failure,
+)
 
 
 class TeamService:
@@ -24,114 +81,368 @@ class TeamService:
         """
         self.db = db
         self.repository = TeamRepository(db)
+        self.team_event_repository = TeamEventRepository(db)
+        self.fetcher = CachingFetcher()
 
-    async def get_teams(self) -> dict:
+    async def get_teams(
+        self, year: Optional[str] = None, event: Optional[str] = None
+    ) -> dict:
         """
-        Get teams from the specified event by parsing the live results page.
+        Get teams of an event, served from the team cache when possible.
+
+        By default the event 'settings.EVENT_NAME' of the given year with group
+        settings.EVENT_GROUP is used. Cached teams are returned immediately;
+        entries older than settings.TEAM_CACHE_TTL_SECONDS are marked stale
+        and refreshed in a background task, so a cache hit never waits on
+        the live results site. Cache rows are also kept in this worker's
+        memory, see team_entries, so a hit usually does not query the
+        database either. Only a cache miss fetches and parses the live
+        results page in the request, and concurrent misses for the same
+        entry share a single fetch, see load_teams.
 
-        Finds the event 'Первенство России' with year 2025 and group 'Ю',
-        then fetches and parses the live results page to extract team names.
-        Returns cached data if available for the specified year.
-        Returns empty teams list if external site is unavailable.
+        Args:
+            year: Competition year, defaults to settings.EVENT_YEAR
+            event: Event link, defaults to the configured event of the year
 
         Returns:
             Dictionary containing teams, event info, and cache status
 
         Raises:
-            Exception: If there's an error during fetching or parsing
+            Exception: If the event is not found or the page cannot be parsed
         """
-        try:
-            # First, try to get teams from cache
-            cached_teams = await self.repository.get_by_year(str(settings.EVENT_YEAR))
-            # If cache exists, return cached data
-            if cached_teams:
-                return {
-                    "teams": cached_teams.teams,
-                    "event": settings.EVENT_NAME,
-                    "link": str(settings.EVENT_YEAR),
-                    "from_cache": True,
-                }
-
-            # Find the event with name EVENT_NAME and year EVENT_YEAR
-            events = await self.db.execute(
-                select(Event).where(
-                    Event.name == settings.EVENT_NAME,
-                    Event.year == settings.EVENT_YEAR,
-                )
-            )
-            events_list = events.scalars().all()
+        year = str(year or settings.EVENT_YEAR)
+        event_link = event or await self._find_default_event_link(year)
 
-            # Filter events by group EVENT_GROUP
-            filtered_events = [
-                event for event in events_list if settings.EVENT_GROUP in event.groups
-            ]
+        key = (year, event_link)
+        local = team_entries.get(key)
+        if local is None:
+            generation = team_entries.generation
+            cached = await self.repository.get_entry(year, event_link)
+            if cached is not None:
+                entry, age = cached
+                response = self._cached_response(entry, stale=False, refreshing=False)
+                team_entries.set(key, (response, age), generation)
+                local = (response, age), 0.0
 
-            if not filtered_events:
-                raise Exception(
-                    f"Event '{settings.EVENT_NAME}' with group '{settings.EVENT_GROUP}' "
-                    f"and year {settings.EVENT_YEAR} not found"
-                )
+        if local is not None:
+            (response, age), held = local
+            stale = age + held > settings.TEAM_CACHE_TTL_SECONDS
+            refreshing = stale and schedule_team_refresh(year, event_link)
+            return {**response, "stale": stale, "refreshing": refreshing}
+
+        return await _team_loads.do((year, event_link), lambda: load_teams(year, event_link))
+
+    async def refresh_teams(
+        self, year: Optional[str] = None, event: Optional[str] = None
+    ) -> dict:
+        """
+        Fetch and parse the live results page and update the team cache.
+
+        With settings.LIVE_RESULTS_STREAMING the team cells are extracted
+        while the page downloads, see _stream_team_names; otherwise the page
+        is fetched through the conditional-GET cache and parsed whole.
+
+        Requests go through live_results_breaker: after repeated failures the
+        site is not contacted for a cooldown period. If the site is unavailable
+        or the breaker is open, the last known good cached teams are returned
+        marked as stale, or an empty teams list if nothing is cached.
+
+        Args:
+            year: Competition year, defaults to settings.EVENT_YEAR
+            event: Event link, defaults to the configured event of the year
+
+        Returns:
+            Dictionary containing teams, event info, and cache status
 
-            # Take the first matching event
-            event = filtered_events[0]
+        Raises:
+            Exception: If the event is not found or the page cannot be parsed
+        """
+        year = str(year or settings.EVENT_YEAR)
+        event_link = event or await self._find_default_event_link(year)
+        event_name = await self._get_event_name(event_link)
 
+        try:
             # Construct the URL for live results
-            url = f"{settings.LIVE_RESULTS_BASE_URL}{event.link}/{settings.LIVE_RESULTS_PATH}"
+            url = f"{settings.LIVE_RESULTS_BASE_URL}{event_link}/{settings.LIVE_RESULTS_PATH}"
 
-            # Make GET request to the live results page
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            if settings.LIVE_RESULTS_STREAMING:
+                # Extract team cells while the page downloads
+                team_names = await live_results_breaker.call(self._stream_team_names, url)
+            else:
+                # Make (conditional) GET request to the live results page
+                response = await live_results_breaker.call(
+                    self.fetcher.fetch, url, timeout=settings.LIVE_RESULTS_TIMEOUT
+                )
 
-            # Parse the HTML content
-            soup = BeautifulSoup(response.content, "html.parser")
+                # Parse the HTML content
+                soup = BeautifulSoup(response.content, "html.parser")
 
-            # Find all td elements with class "Команда" (Team)
-            team_elements = soup.find_all("td", class_="command")
+                # Find all td elements with class "Команда" (Team)
+                team_elements = soup.find_all("td", class_="command")
+                team_names = [elem.get_text(strip=True) for elem in team_elements]
 
-            # Extract text from each element, create a set of unique teams, and sort alphabetically
-            teams = sorted(set(elem.get_text(strip=True) for elem in team_elements))
+            # Create a set of unique teams and sort alphabetically
+            teams = sorted(set(team_names))
 
             # Save teams to cache
-            await self.repository.save_teams(str(settings.EVENT_YEAR), teams)
+            await self.repository.save_teams(year, teams, event_link, event_name)
 
             return {
                 "teams": teams,
-                "event": event.name,
-                "link": event.link,
+                "year": year,
+                "event": event_name,
+                "link": event_link,
                 "from_cache": False,
+                "stale": False,
             }
 
-        except requests.exceptions.Timeout:
+        except CircuitOpenError as e:
+            print(f"Skipping live results fetch: {e}")
+            return await self._fallback_response(
+                year, event_link, event_name, "External site unavailable, serving cached teams"
+            )
+        except httpx.TimeoutException:
             print(f"Timeout fetching live results from {settings.LIVE_RESULTS_BASE_URL}")
-            # Return empty list instead of raising exception
-            return {
-                "teams": [],
-                "event": settings.EVENT_NAME,
-                "link": str(settings.EVENT_YEAR),
-                "from_cache": False,
-                "error": "External site timeout, no teams available"
-            }
-        except requests.exceptions.ConnectionError as e:
+            return await self._fallback_response(
+                year, event_link, event_name, "External site timeout, serving cached teams"
+            )
+        except httpx.ConnectError as e:
             print(f"Connection error fetching live results: {e}")
-            # Return empty list instead of raising exception
-            return {
-                "teams": [],
-                "event": settings.EVENT_NAME,
-                "link": str(settings.EVENT_YEAR),
-                "from_cache": False,
-                "error": "External site connection error, no teams available"
-            }
-        except requests.exceptions.RequestException as e:
+            return await self._fallback_response(
+                year,
+                event_link,
+                event_name,
+                "External site connection error, serving cached teams",
+            )
+        except httpx.HTTPError as e:
             print(f"Network error fetching live results: {e}")
-            # Return empty list instead of raising exception
-            return {
-                "teams": [],
-                "event": settings.EVENT_NAME,
-                "link": str(settings.EVENT_YEAR),
-                "from_cache": False,
-                "error": f"Failed to fetch live results: {str(e)}"
-            }
+            return await self._fallback_response(
+                year, event_link, event_name, f"Failed to fetch live results: {str(e)}"
+            )
         except Exception as e:
             print(f"Error parsing live results: {e}")
             traceback.print_exc()
             raise Exception(f"Failed to parse live results: {str(e)}")
+
+    @staticmethod
+    async def _stream_team_names(url: str) -> List[str]:
+        """
+        Extract the team cells of a live results page while it downloads.
+
+        The page is parsed chunk by chunk with parse_cells_stream, so no
+        document tree and no full copy of the body are kept in memory.
+        The page bypasses the conditional-GET cache.
+
+        Args:
+            url: Live results page URL
+
+        Returns:
+            Texts of the page's td.command cells in page order
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        async with get_http_client().stream(
+            url, timeout=settings.LIVE_RESULTS_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            return await parse_cells_stream(
+                response.aiter_bytes(), "command", encoding=response.charset_encoding
+            )
+
+    async def get_team_events(
+        self, team: str, year: Optional[str] = None
+    ) -> List[TeamEvent]:
+        """
+        Get the events a team attended, from the season team crawl index.
+
+        Args:
+            team: Team name, matched exactly
+            year: Competition year, all years if None
+
+        Returns:
+            List of TeamEvent objects, latest years first
+        """
+        return await self.team_event_repository.get_events_by_team(team, year)
+
+    async def _find_default_event_link(self, year: str) -> str:
+        """
+        Find the link of the configured event of a year.
+
+        Args:
+            year: Competition year
+
+        Returns:
+            Link of the first event named settings.EVENT_NAME with group
+            settings.EVENT_GROUP in that year
+
+        Raises:
+            Exception: If no such event exists
+        """
+        events = await self.db.execute(
+            select(Event).where(
+                Event.name == settings.EVENT_NAME,
+                Event.year == year,
+            )
+        )
+        # Filter events by group EVENT_GROUP
+        for event in events.scalars().all():
+            if settings.EVENT_GROUP in (event.groups or []):
+                return event.link
+
+        raise Exception(
+            f"Event '{settings.EVENT_NAME}' with group '{settings.EVENT_GROUP}' "
+            f"and year {year} not found"
+        )
+
+    async def _get_event_name(self, event_link: str) -> Optional[str]:
+        """Get the name of an event by its link, None if it is unknown."""
+        result = await self.db.execute(
+            select(Event.name).where(Event.link == event_link).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _cached_response(entry: TeamCache, stale: bool, refreshing: bool) -> dict:
+        """Build the response for a team cache entry."""
+        return {
+            "teams": entry.teams,
+            "year": entry.year,
+            "event": entry.event_name,
+            "link": entry.event_link,
+            "from_cache": True,
+            "stale": stale,
+            "refreshing": refreshing,
+            "updated_at": entry.updated_at,
+        }
+
+    async def _fallback_response(
+        self, year: str, event_link: str, event_name: Optional[str], error: str
+    ) -> dict:
+        """
+        Build the response for a failed fetch of the live results page.
+
+        Args:
+            year: Competition year
+            event_link: Event link
+            event_name: Event name
+            error: Error message
+
+        Returns:
+            Last known good cached teams marked as stale, or an empty teams
+            list if nothing is cached
+        """
+        cached = await self.repository.get_entry(year, event_link)
+        if cached is None:
+            return self._error_response(year, event_link, event_name, error)
+        response = self._cached_response(cached[0], stale=True, refreshing=False)
+        response["error"] = error
+        return response
+
+    @staticmethod
+    def _error_response(
+        year: str, event_link: str, event_name: Optional[str], error: str
+    ) -> dict:
+        """Build the response for a failed fetch of the live results page."""
+        return {
+            "teams": [],
+            "year": year,
+            "event": event_name,
+            "link": event_link,
+            "from_cache": False,
+            "stale": False,
+            "error": error,
+        }
+
+
+def _team_lock_key(year: str, event_link: str) -> str:
+    """Advisory lock key of a team cache entry."""
+    return f"{year}|{event_link}"
+
+
+async def load_teams(year: str, event_link: str) -> dict:
+    """
+    Load a missing team cache entry, at most once across all workers.
+
+    The worker holding the entry's advisory lock fetches the live results
+    page; the others wait for the cache row it saves. If the holder fails
+    without saving, the next waiter takes the lock and tries itself.
+
+    Args:
+        year: Competition year
+        event_link: Event link
+
+    Returns:
+        Dictionary containing teams, event info, and cache status
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.TEAM_CLAIM_TIMEOUT
+    lock_key = _team_lock_key(year, event_link)
+
+    while True:
+        async with advisory_lock(TEAM_LOCK_NAMESPACE, lock_key) as acquired:
+            async with AsyncSessionLocal() as session:
+                service = TeamService(session)
+                cached = await service.repository.get_entry(year, event_link)
+                if cached is not None:
+                    entry, age = cached
+                    stale = age > settings.TEAM_CACHE_TTL_SECONDS
+                    return service._cached_response(entry, stale=stale, refreshing=False)
+                if acquired:
+                    return await service.refresh_teams(year, event_link)
+                if loop.time() > deadline:
+                    return service._error_response(
+                        year,
+                        event_link,
+                        None,
+                        "Timed out waiting for teams loaded by another worker",
+                    )
+        await asyncio.sleep(settings.TEAM_CLAIM_POLL_INTERVAL)
+
+
+def schedule_team_refresh(year: str, event_link: str) -> bool:
+    """
+    Refresh a team cache entry in a background task.
+
+    At most one refresh per entry runs at a time in this process.
+
+    Args:
+        year: Competition year
+        event_link: Event link
+
+    Returns:
+        True if a refresh was started, False if one is already running
+    """
+    key = (year, event_link)
+    task = _refresh_tasks.get(key)
+    if task is not None and not task.done():
+        return False
+    _refresh_tasks[key] = asyncio.create_task(_refresh_in_background(year, event_link))
+    return True
+
+
+async def _refresh_in_background(year: str, event_link: str) -> None:
+    """Refresh a team cache entry unless another worker is refreshing it."""
+    try:
+        async with advisory_lock(TEAM_LOCK_NAMESPACE, _team_lock_key(year, event_link)) as acquired:
+            if not acquired:
+                return
+            async with AsyncSessionLocal() as session:
+                result = await TeamService(session).refresh_teams(year, event_link)
+        if result.get("error"):
+            print(f"Background refresh of teams {year}/{event_link} failed: {result['error']}")
+    except Exception as e:
+        print(f"Background refresh of teams {year}/{event_link} failed: {e}")
+        traceback.print_exc()
+    finally:
+        if _refresh_tasks.get((year, event_link)) is asyncio.current_task():
+            del _refresh_tasks[(year, event_link)]
+
+
+async def stop_team_refreshes() -> None:
+    """Cancel background team cache refreshes. Called on application shutdown."""
+    tasks = list(_refresh_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _refresh_tasks.clear()
@@ -0,0 +1,599 @@
+import asyncio
+import contextlib
+import json
+import unittest
+from datetime import datetime
+from typing import List
+from unittest import mock
+
+from app.core.config import settings
+from app.core.db import invalidation as invalidation_module
+from app.core.db.invalidation import InvalidationBus, invalidation_payloads
+from app.core.db.notify import NOTIFY_PAYLOAD_LIMIT
+from app.core.http_cache import FetchResult
+from app.schemas.event import (
+    EventFilter,
+    EventResponse,
+    PageResponse,
+    event_page_adapter,
+)
+from app.services import live_poller as live_poller_module
+from app.services import team_service as team_service_module
+from app.services.event_cache import event_filter_key, events_page_key
+from app.services.live_poller import LivePageSnapshot, LiveResultsPoller, next_interval
+from app.utils.conditional import cache_control, etag_matches, make_etag, not_modified
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.response_cache import ResponseCache
+from app.utils.singleflight import SingleFlight
+from app.utils.ttl_cache import TTLCache
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Unit tests for SingleFlight.
+
+    Tests coalescing of concurrent calls on a cold cache.
+    """
+
+    def test_burst_runs_once(self):
+        """Test that a burst of concurrent calls with one key runs the call once."""
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["Команда 1", "Команда 2"]
+
+        async def run():
+            flight = SingleFlight()
+            results = await asyncio.gather(
+                *(flight.do(("2025", "event"), load) for _ in range(500))
+            )
+            return flight, results
+
+        flight, results = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == ["Команда 1", "Команда 2"] for result in results))
+        self.assertFalse(flight.in_flight(("2025", "event")))
+
+    def test_different_keys_run_separately(self):
+        """Test that calls with different keys are not coalesced."""
+        calls = []
+
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        async def run():
+            flight = SingleFlight()
+            return await asyncio.gather(
+                flight.do("a", lambda: load("a")), flight.do("b", lambda: load("b"))
+            )
+
+        self.assertEqual(asyncio.run(run()), ["a", "b"])
+        self.assertEqual(sorted(calls), ["a", "b"])
+
+    def test_error_is_shared_and_forgotten(self):
+        """Test that a failed call fails every waiter and can be retried."""
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0)
+            if len(calls) == 1:
+                raise RuntimeError("upstream unavailable")
+            return "ok"
+
+        async def run():
+            flight = SingleFlight()
+            first = await asyncio.gather(
+                flight.do("key", load), flight.do("key", load), return_exceptions=True
+            )
+            second = await flight.do("key", load)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in first))
+        self.assertEqual(second, "ok")
+        self.assertEqual(len(calls), 2)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Unit tests for CircuitBreaker.
+
+    Tests opening, fast failing and half-open probing with a fake clock.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.calls = 0
+        self.breaker = CircuitBreaker(
+            "test",
+            failure_threshold=3,
+            reset_timeout=30.0,
+            is_failure=lambda e: isinstance(e, TimeoutError),
+            clock=lambda: self.now,
+        )
+
+    async def failing(self):
+        self.calls += 1
+        raise TimeoutError("upstream timeout")
+
+    async def succeeding(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    def call(self, fn):
+        """Call through the breaker, returning the result or the exception."""
+        try:
+            return asyncio.run(self.breaker.call(fn))
+        except Exception as e:
+            return e
+
+    def open_circuit(self):
+        for _ in range(3):
+            self.assertIsInstance(self.call(self.failing), TimeoutError)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    def test_opens_and_fails_fast(self):
+        """Test that the circuit opens at the threshold and stops calling upstream."""
+        self.open_circuit()
+        self.assertIsInstance(self.call(self.succeeding), CircuitOpenError)
+        self.assertEqual(self.calls, 3)
+
+    def test_other_errors_do_not_open(self):
+        """Test that exceptions which are not upstream failures keep the circuit closed."""
+
+        async def not_found():
+            raise LookupError("page not found")
+
+        for _ in range(5):
+            self.assertIsInstance(self.call(not_found), LookupError)
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_half_open_single_probe(self):
+        """Test that only one probe goes through when half-open and its success closes."""
+        self.open_circuit()
+        self.now += 31
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+
+        async def burst():
+            return await asyncio.gather(
+                *(self.breaker.call(self.succeeding) for _ in range(5)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(burst())
+        self.assertEqual(results.count("ok"), 1)
+        self.assertEqual(sum(isinstance(r, CircuitOpenError) for r in results), 4)
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the circuit for another cooldown."""
+        self.open_circuit()
+        self.now += 31
+        self.assertIsInstance(self.call(self.failing), TimeoutError)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertEqual(self.breaker.retry_after, 30.0)
+
+
+class FakeResultService:
+    """ResultService stand-in recording the applied pages."""
+
+    applied: list = []
+
+    def __init__(self, session):
+        self.repository = mock.Mock()
+        self.repository.get_page_hashes = mock.AsyncMock(return_value={})
+
+    async def apply_page_results(self, event_link, page, rows, previous, body_hash=None):
+        self.applied.append([row["athlete"] for row in rows])
+        return {"inserted": len(rows) - len(previous), "updated": 0, "deleted": 0}
+
+
+class TestLiveResultsPoller(unittest.TestCase):
+    """
+    Unit tests for LiveResultsPoller.
+
+    Tests diffing of polled pages, following another worker's polls and
+    the adaptive polling interval.
+    """
+
+    def page(self, *athletes, spacing=""):
+        rows = "".join(
+            f'<tr><td class="place">{i}</td><td class="name">{name}</td>'
+            f'<td class="command">Москва</td><td class="result">{i}</td></tr>{spacing}'
+            for i, name in enumerate(athletes, 1)
+        )
+        return f"<table>{rows}</table>"
+
+    def poll_all(self, bodies):
+        """Poll one page once per body, returning the change flags."""
+        bodies = list(bodies)
+        FakeResultService.applied = []
+        snapshot = LivePageSnapshot("2610msk", "l_f_f13.html")
+        self.published = []
+
+        async def fetch(event_link, page, fetcher=None):
+            body = bodies.pop(0)
+            return FetchResult(
+                url=page,
+                content=body.encode("utf-8"),
+                encoding="utf-8",
+                body_hash=str(hash(body)),
+            )
+
+        async def publish(event_link, page, changed, removed):
+            self.published.append([row["athlete"] for row in changed])
+
+        @contextlib.asynccontextmanager
+        async def session():
+            yield None
+
+        async def run():
+            poller = LiveResultsPoller()
+            return [await poller.poll(snapshot) for _ in range(len(bodies))]
+
+        with mock.patch.object(live_poller_module, "ResultService", FakeResultService), \
+                mock.patch.object(live_poller_module, "fetch_live_page", fetch), \
+                mock.patch.object(live_poller_module, "AsyncSessionLocal", session), \
+                mock.patch.object(live_poller_module, "publish_result_changes", publish):
+            return asyncio.run(run()), snapshot
+
+    def test_only_changes_are_applied(self):
+        """Test that repeated bodies are skipped and changed bodies are diffed."""
+        flags, snapshot = self.poll_all(
+            [
+                self.page("Анна"),
+                self.page("Анна"),
+                self.page("Анна", spacing="\n"),
+                self.page("Анна", "Мария"),
+            ]
+        )
+        self.assertEqual(flags, [True, False, False, True])
+        self.assertEqual(FakeResultService.applied, [["Анна"], ["Анна", "Мария"]])
+        self.assertEqual(self.published, [["Анна"], ["Мария"]])
+        self.assertEqual(snapshot.version, 2)
+        self.assertEqual([row["athlete"] for row in snapshot.rows], ["Анна", "Мария"])
+
+    def test_follower_reads_stored_rows(self):
+        """Test that a worker not polling an event serves the stored rows."""
+        stored = [
+            {"page": "l_f_f13.html", "athlete": "Анна", "team": "", "content_hash": "a"},
+            {"page": "l_q_f13.html", "athlete": "Мария", "team": "", "content_hash": "m"},
+        ]
+        repository = mock.Mock()
+        repository.get_event_rows = mock.AsyncMock(return_value=stored)
+
+        @contextlib.asynccontextmanager
+        async def session():
+            yield None
+
+        poller = LiveResultsPoller()
+        pages = ["l_f_f13.html", "l_q_f13.html"]
+        with mock.patch.object(live_poller_module, "AsyncSessionLocal", session), \
+                mock.patch.object(
+                    live_poller_module, "ResultRepository", return_value=repository
+                ):
+            asyncio.run(poller.follow("2610msk", pages))
+            asyncio.run(poller.follow("2610msk", pages))
+
+        snapshots = poller.get_event("2610msk")
+        self.assertEqual(
+            [[row["athlete"] for row in snapshot.rows] for snapshot in snapshots],
+            [["Анна"], ["Мария"]],
+        )
+        self.assertEqual([snapshot.version for snapshot in snapshots], [1, 1])
+        self.assertTrue(all(snapshot.body_hash is None for snapshot in snapshots))
+
+    def test_interval_backs_off(self):
+        """Test that the interval grows while unchanged and resets on change."""
+        with mock.patch.multiple(
+            live_poller_module.settings,
+            LIVE_POLL_MIN_INTERVAL=10.0,
+            LIVE_POLL_MAX_INTERVAL=35.0,
+            LIVE_POLL_BACKOFF=2.0,
+        ):
+            intervals = [10.0]
+            for changed in (False, False, False, True):
+                intervals.append(next_interval(intervals[-1], changed))
+        self.assertEqual(intervals, [10.0, 20.0, 35.0, 35.0, 10.0])
+
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Unit tests for ResponseCache and event filter keys.
+
+    Tests LRU eviction, expiry, generations and statistics.
+    """
+
+    def make_cache(self, **kwargs):
+        self.now = 0.0
+        options = {"max_entries": 2, "max_bytes": 100, "ttl": 10.0}
+        options.update(kwargs)
+        return ResponseCache(clock=lambda: self.now, **options)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the entry not read for the longest time is evicted first."""
+        cache = self.make_cache()
+        cache.set("a", b"1", cache.generation)
+        cache.set("b", b"2", cache.generation)
+        self.assertEqual(cache.get("a"), b"1")
+        cache.set("c", b"3", cache.generation)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertEqual(cache.get("c"), b"3")
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_size_bound(self):
+        """Test that entries are evicted to stay within max_bytes."""
+        cache = self.make_cache(max_entries=10, max_bytes=10)
+        cache.set("a", b"x" * 6, cache.generation)
+        cache.set("b", b"y" * 6, cache.generation)
+        cache.set("c", b"z" * 11, cache.generation)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.stats()["bytes"], 6)
+
+    def test_entries_expire(self):
+        """Test that entries are not served after their TTL."""
+        cache = self.make_cache()
+        cache.set("a", b"1", cache.generation)
+        self.now = 9.9
+        self.assertEqual(cache.get("a"), b"1")
+        self.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_generation_bump_invalidates(self):
+        """Test that a bump drops entries and bodies built before it are not stored."""
+        cache = self.make_cache()
+        generation = cache.generation
+        cache.set("a", b"1", generation)
+        cache.bump_generation()
+        self.assertIsNone(cache.get("a"))
+        cache.set("b", b"2", generation)
+        self.assertIsNone(cache.get("b"))
+
+    def test_stats(self):
+        """Test hit rate and memory use reporting."""
+        cache = self.make_cache()
+        cache.set("a", b"12345", cache.generation)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        self.assertEqual(stats["bytes"], 5)
+
+    def test_filter_key_is_canonical(self):
+        """Test that list order, duplicates and empty values do not change the key."""
+        self.assertEqual(
+            event_filter_key(EventFilter(groups=["v13", "adults", "v13"], types=[])),
+            event_filter_key(EventFilter(groups=["adults", "v13"], start="")),
+        )
+        self.assertNotEqual(
+            event_filter_key(EventFilter(groups=["adults"])),
+            event_filter_key(EventFilter(disciplines=["adults"])),
+        )
+
+
+class FakeListener:
+    """Records listener registrations of an InvalidationBus."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.reconnect_callbacks = []
+
+    def add_listener(self, channel, callback):
+        self.callbacks[channel] = callback
+
+    def add_reconnect_callback(self, callback):
+        self.reconnect_callbacks.append(callback)
+
+
+class TestInvalidationBus(unittest.TestCase):
+    """
+    Unit tests for InvalidationBus and TTLCache.
+
+    Tests per-key eviction by notifications of other workers and clearing
+    on reconnect.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.cache = TTLCache(max_entries=10, ttl=60.0, clock=lambda: self.now)
+        self.cache.set(("2024", "a"), "teams a")
+        self.cache.set(("2024", "b"), "teams b")
+        self.cache.set(("2025", "a"), "teams a 2025")
+        patcher = mock.patch.object(team_service_module, "team_entries", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bus = InvalidationBus(FakeListener())
+        self.bus.register(
+            "teams", evict=team_service_module._evict_team_entries, clear=self.cache.clear
+        )
+        asyncio.run(self.bus.start())
+
+    def receive(self, payload):
+        self.bus.listener.callbacks[settings.CACHE_INVALIDATION_CHANNEL](payload)
+
+    def test_other_worker_evicts_matching_entries(self):
+        """Test that a notification evicts only the entries of its years and links."""
+        with mock.patch.object(invalidation_module, "ORIGIN", "other"):
+            payloads = invalidation_payloads("teams", ["2024"], ["a"])
+        self.receive(payloads[0])
+        self.assertIsNone(self.cache.get(("2024", "a")))
+        self.assertEqual(self.cache.get(("2024", "b"))[0], "teams b")
+        self.assertEqual(self.cache.get(("2025", "a"))[0], "teams a 2025")
+
+    def test_own_notifications_are_ignored(self):
+        """Test that a worker does not evict again on its own notifications."""
+        self.receive(invalidation_payloads("teams", ["2024"], ["a"])[0])
+        self.assertEqual(self.cache.get(("2024", "a"))[0], "teams a")
+
+    def test_other_scopes_are_ignored(self):
+        """Test that a notification of another scope leaves the cache alone."""
+        with mock.patch.object(invalidation_module, "ORIGIN", "other"):
+            payloads = invalidation_payloads("events", ["2024"], ["a"])
+        self.receive(payloads[0])
+        self.assertEqual(len(self.cache), 3)
+
+    def test_reconnect_clears(self):
+        """Test that caches are cleared when notifications may have been missed."""
+        for callback in self.bus.listener.reconnect_callbacks:
+            callback()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_load_racing_eviction_is_not_stored(self):
+        """Test that a value read before an eviction does not put the old value back."""
+        generation = self.cache.generation
+        self.bus.invalidate("teams", ["2024"], ["a"])
+        self.cache.set(("2024", "a"), "old teams a", generation)
+        self.assertIsNone(self.cache.get(("2024", "a")))
+
+    def test_entries_expire(self):
+        """Test that entries are served with their age until their TTL."""
+        self.now = 30.0
+        self.assertEqual(self.cache.get(("2024", "a")), ("teams a", 30.0))
+        self.now = 60.0
+        self.assertIsNone(self.cache.get(("2024", "a")))
+
+    def test_large_invalidations_are_split(self):
+        """Test that many links are spread over payloads below the NOTIFY limit."""
+        links = [f"/events/{i:05d}/" for i in range(2000)]
+        payloads = invalidation_payloads("events", ["2024"], links)
+        self.assertGreater(len(payloads), 1)
+        self.assertTrue(all(len(p.encode("utf-8")) < NOTIFY_PAYLOAD_LIMIT for p in payloads))
+        received = [link for p in payloads for link in json.loads(p)["links"]]
+        self.assertEqual(received, links)
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """
+    Unit tests for entity tags and Cache-Control headers.
+
+    Tests tag derivation and If-None-Match matching.
+    """
+
+    def test_etag_depends_on_every_part(self):
+        """Test that equal parts give equal tags and any change gives another."""
+        etag = make_etag("key", "2024-05-01 10:00:00", 12)
+        self.assertEqual(etag, make_etag("key", "2024-05-01 10:00:00", 12))
+        self.assertNotEqual(etag, make_etag("key", "2024-05-01 10:00:00", 13))
+        self.assertNotEqual(make_etag("ab", "c"), make_etag("a", "bc"))
+        self.assertTrue(etag.startswith('W/"'))
+
+    def test_if_none_match(self):
+        """Test weak comparison, tag lists and the wildcard."""
+        etag = make_etag("key")
+        opaque = etag.removeprefix("W/")
+        self.assertTrue(etag_matches(etag, etag))
+        self.assertTrue(etag_matches(opaque, etag))
+        self.assertTrue(etag_matches(f'"other", {etag}', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches('"other"', etag))
+        self.assertFalse(etag_matches(None, etag))
+
+    def test_not_modified_has_no_body(self):
+        """Test that a 304 carries the validator and cache headers only."""
+        control = cache_control(60, 600)
+        self.assertEqual(
+            control, "public, max-age=0, s-maxage=60, stale-while-revalidate=600"
+        )
+        response = not_modified('W/"abc"', control)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+        self.assertEqual(response.headers["etag"], 'W/"abc"')
+        self.assertEqual(response.headers["cache-control"], control)
+
+
+class TestEventPagination(unittest.TestCase):
+    """
+    Unit tests for event list cursors and page cache keys.
+
+    Tests cursor round trips, rejection of malformed cursors and keys.
+    """
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the link it was built from."""
+        link = "/events/2024/кубок-россии?x=1&y=2"
+        cursor = encode_cursor(link)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor), link)
+
+    def test_malformed_cursors_are_rejected(self):
+        """Test that cursors not built by encode_cursor raise ValueError."""
+        for cursor in ["", "!!!", "bm90IGpzb24", encode_cursor("x")[:-2], "WzFd"]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
+
+    def test_pages_have_their_own_keys(self):
+        """Test that pages are cached apart and the full list keeps its key."""
+        filter_ = EventFilter(groups=["adults"])
+        self.assertEqual(events_page_key(filter_, None, None), event_filter_key(filter_))
+        keys = {
+            events_page_key(filter_, None, 10),
+            events_page_key(filter_, "/a", 10),
+            events_page_key(filter_, "/a", 20),
+        }
+        self.assertEqual(len(keys), 3)
+
+
+class TestEventPageSerialization(unittest.TestCase):
+    """
+    Unit tests for the single-pass /api/events serialization.
+
+    Tests that it produces the same JSON as the response models.
+    """
+
+    def make_row(self, i, **overrides):
+        row = {
+            "date": "1-3 марта",
+            "year": "2024",
+            "rank": None,
+            "startdate": "2024-03-01",
+            "enddate": None,
+            "link": f"/events/{i:05d}/",
+            "name": "Кубок \"Вертикаль\"",
+            "location": "Москва",
+            "type": "book_competition",
+            "groups": ["adults", "13-14"],
+            "disciplines": [],
+            "id": i,
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, 678901),
+            "updated_at": datetime(2024, 2, 3),
+        }
+        row.update(overrides)
+        return row
+
+    def test_matches_response_models(self):
+        """Test that plain rows encode to the bytes of PageResponse[List[EventResponse]]."""
+        rows = [self.make_row(1), self.make_row(2, rank="A", startdate=None, year=None)]
+        for next_cursor in (None, "abc"):
+            with self.subTest(next_cursor=next_cursor):
+                expected = PageResponse[List[EventResponse]](
+                    data=[EventResponse.model_validate(row) for row in rows],
+                    success=True,
+                    next_cursor=next_cursor,
+                ).model_dump_json()
+                actual = event_page_adapter.dump_json(
+                    {
+                        "success": True,
+                        "data": rows,
+                        "message": None,
+                        "next_cursor": next_cursor,
+                    }
+                )
+                self.assertEqual(actual.decode("utf-8"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,487 @@
+import asyncio
+import contextlib
+import tempfile
+import time
+import unittest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+
+from app.core.http_cache import CachingFetcher, DiskCacheBackend, FetchResult
+from app.core.http_client import HttpClient
+from app.services.crawl_planner import (
+    CrawlShard,
+    ShardResult,
+    plan_shards,
+    select_incremental_shards,
+)
+from app.services import event_service as event_service_module
+from app.services import job_service as job_service_module
+from app.services import season_crawl as season_crawl_module
+from app.services.event_service import EventService
+from app.services.ingestion_pipeline import IngestionPipeline
+from app.services.job_service import IngestionJobManager
+from app.services.season_crawl import SeasonTeamCrawl, extract_teams
+from app.utils.throttle import HostThrottle
+
+
+class TestPlanShards(unittest.TestCase):
+    """
+    Unit tests for plan_shards function.
+
+    Tests splitting of calendar queries into year and filter shards.
+    """
+
+    def test_split_by_year(self):
+        """Test that a date range is split into calendar years."""
+        shards = plan_shards("2021-03-15", "2023-06-01", types=["book_competition"])
+        self.assertEqual(
+            [(shard.start, shard.end) for shard in shards],
+            [
+                ("2021-03-15", "2021-12-31"),
+                ("2022-01-01", "2022-12-31"),
+                ("2023-01-01", "2023-06-01"),
+            ],
+        )
+        self.assertEqual([shard.year for shard in shards], ["2021", "2022", "2023"])
+
+    def test_split_by_filters(self):
+        """Test that split filters get one shard per value and others stay whole."""
+        shards = plan_shards(
+            "2024-01-01",
+            "2024-12-31",
+            ranks=["Всероссийские"],
+            types=["book_competition", "book_festival"],
+            groups=["adults", "juniors"],
+            split_filters=["types"],
+        )
+        self.assertEqual(len(shards), 2)
+        self.assertEqual([shard.types for shard in shards], [("book_competition",), ("book_festival",)])
+        self.assertTrue(all(shard.groups == ("adults", "juniors") for shard in shards))
+        self.assertEqual(len({shard.key for shard in shards}), 2)
+
+    def test_future_years_are_capped(self):
+        """Test that the far future is not crawled."""
+        shards = plan_shards("2000-01-01", "2100-12-31", years_ahead=1)
+        self.assertEqual(shards[-1].end, f"{date.today().year + 1}-12-31")
+
+    def test_unparsable_dates(self):
+        """Test that unparsable dates produce a single shard."""
+        shards = plan_shards("", "", types=["book_competition"])
+        self.assertEqual(shards, [CrawlShard("", "", types=("book_competition",))])
+
+
+class TestSelectIncrementalShards(unittest.TestCase):
+    """Unit tests for select_incremental_shards function."""
+
+    def test_selects_current_seasons_and_stale_shards(self):
+        """Test that fresh past seasons are skipped and everything else is crawled."""
+        now = datetime(2026, 10, 18, 12, 0)
+        shards = plan_shards("2023-01-01", "2027-12-31", years_ahead=5)
+        last_crawled = {
+            shards[0].key: now - timedelta(hours=1),  # 2023, fresh
+            shards[1].key: now - timedelta(days=30),  # 2024, stale
+            shards[3].key: now - timedelta(hours=1),  # 2026, current season
+        }
+        selected = select_incremental_shards(
+            shards, last_crawled, now=now, stale_after=timedelta(days=7)
+        )
+        # 2025 was never crawled, 2027 is upcoming
+        self.assertEqual([shard.year for shard in selected], ["2024", "2025", "2026", "2027"])
+
+
+class TestCachingFetcher(unittest.TestCase):
+    """
+    Unit tests for CachingFetcher.
+
+    Tests conditional refetches against a mocked upstream server.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.requests = []
+        self.body = "<html>календарь</html>".encode("utf-8")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Serve the page, answering 304 to a matching If-None-Match."""
+        self.requests.append(request)
+        etag = f'"{len(self.body)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.body, headers={"ETag": etag})
+
+    def fetch_twice(self):
+        """Fetch the same URL twice with a fresh client."""
+
+        async def run():
+            client = HttpClient()
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+            fetcher = CachingFetcher(DiskCacheBackend(self.directory.name), client)
+            try:
+                first = await fetcher.fetch("https://example.org/page")
+                second = await fetcher.fetch("https://example.org/page")
+            finally:
+                await client.aclose()
+            return first, second
+
+        return asyncio.run(run())
+
+    def test_not_modified(self):
+        """Test that a 304 is served from cache with the cached body hash."""
+        first, second = self.fetch_twice()
+        self.assertEqual(second.text, "<html>календарь</html>")
+        self.assertEqual(second.body_hash, first.body_hash)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], f'"{len(self.body)}"')
+
+    def test_identical_body_without_validators(self):
+        """Test that an identical body without validators has the same hash."""
+        self.handler = lambda request: httpx.Response(200, content=self.body)
+        first, second = self.fetch_twice()
+        self.assertEqual(first.body_hash, second.body_hash)
+
+    def test_declared_charset(self):
+        """Test that a body without a header charset is decoded by its <meta> charset."""
+        html = '<html><meta charset="windows-1251">календарь</html>'
+        self.handler = lambda request: httpx.Response(
+            200, content=html.encode("cp1251"), headers={"Content-Type": "text/html"}
+        )
+        first, _ = self.fetch_twice()
+        self.assertIsNone(first.encoding)
+        self.assertEqual(first.text, html)
+
+
+class TestParseShardPage(unittest.TestCase):
+    """
+    Unit tests for EventService.parse_shard_page.
+
+    Tests that only pages already written by a successful crawl are skipped.
+    """
+
+    def parse(self, stored_hash):
+        """Parse a page whose body hash is "current"."""
+        shard = plan_shards("2024-01-01", "2024-12-31", years_ahead=10)[0]
+        page = FetchResult(url="", content=b"<table></table>", encoding="utf-8", body_hash="current")
+        parse = mock.AsyncMock(return_value=[{"link": "2401msk"}])
+        with mock.patch.object(event_service_module, "parse_events_parallel", parse):
+            return asyncio.run(EventService(None).parse_shard_page(shard, page, stored_hash))
+
+    def test_stored_hash_skips_parsing(self):
+        """Test that a page with the hash of the crawl cursor is not parsed."""
+        result = self.parse("current")
+        self.assertTrue(result.unchanged)
+        self.assertEqual(result.events, [])
+
+    def test_other_hash_is_parsed(self):
+        """Test that a new or never recorded page is parsed."""
+        for stored_hash in ("previous", None):
+            with self.subTest(stored_hash=stored_hash):
+                result = self.parse(stored_hash)
+                self.assertFalse(result.unchanged)
+                self.assertEqual(result.events, [{"link": "2401msk"}])
+                self.assertEqual(result.content_hash, "current")
+
+
+class TestIngestionPipeline(unittest.TestCase):
+    """
+    Unit tests for IngestionPipeline.
+
+    Tests streaming of shards through fake fetch, parse and write stages.
+    """
+
+    def setUp(self):
+        self.shards = plan_shards("2021-01-01", "2024-12-31", years_ahead=10)
+        self.written = []
+
+    async def fetch_page(self, shard):
+        """Fail the 2022 shard, report the 2023 shard as unchanged."""
+        await asyncio.sleep(0)
+        if shard.year == "2022":
+            return None
+        return {"year": shard.year, "unchanged": shard.year == "2023"}
+
+    async def parse_page(self, shard, page):
+        """Produce three events per changed page, one of them without a name."""
+        if page["unchanged"]:
+            return ShardResult(shard=shard, unchanged=True)
+        if shard.year == self.fail_parse:
+            raise RuntimeError("broken process pool")
+        prefix = "shared" if self.shared_links else page["year"]
+        events = [
+            {"link": f"{prefix}-{i}", "name": "" if i == 2 else "event"}
+            for i in range(3)
+        ]
+        return ShardResult(shard=shard, events=events, event_count=len(events))
+
+    async def write_chunk(self, rows):
+        """Record written chunks, failing the first one if asked to."""
+        if self.fail_first and not self.written:
+            self.written.append(None)
+            raise RuntimeError("database unavailable")
+        self.written.append(rows)
+        return {"inserted": len(rows), "updated": 0, "skipped": 0}
+
+    def run_pipeline(self, fail_first=False, fail_parse=None, shared_links=False):
+        """Run the pipeline with small queues and chunks."""
+        self.fail_first = fail_first
+        self.fail_parse = fail_parse
+        self.shared_links = shared_links
+        progress = {}
+        pipeline = IngestionPipeline(
+            fetch_page=self.fetch_page,
+            parse_page=self.parse_page,
+            build_row=lambda event: dict(event) if event["name"] else None,
+            write_chunk=self.write_chunk,
+            progress=progress,
+            fetch_workers=2,
+            parse_workers=2,
+            queue_size=1,
+            chunk_size=3,
+        )
+        counts = asyncio.run(pipeline.run(self.shards))
+        return pipeline, counts, progress
+
+    def test_streams_rows_in_chunks(self):
+        """Test that rows of changed shards are written in bounded chunks."""
+        pipeline, counts, progress = self.run_pipeline()
+        self.assertEqual(counts, {"found": 6, "inserted": 4, "updated": 0, "skipped": 2})
+        self.assertEqual([len(chunk) for chunk in self.written], [3, 1])
+        self.assertEqual(
+            sorted(row["link"] for chunk in self.written for row in chunk),
+            ["2021-0", "2021-1", "2024-0", "2024-1"],
+        )
+        self.assertEqual(pipeline.failed_chunks, 0)
+
+        results = {result.shard.year: result for result in pipeline.shard_results}
+        self.assertTrue(results["2022"].failed)
+        self.assertTrue(results["2023"].unchanged)
+        self.assertEqual(results["2024"].event_count, 3)
+        self.assertEqual(results["2024"].events, [])
+
+        self.assertEqual(progress["shards_failed"], 1)
+        self.assertEqual(progress["shards_unchanged"], 1)
+        self.assertEqual(progress["pipeline"]["fetch"]["items_in"], 4)
+        self.assertEqual(progress["pipeline"]["write"]["items_out"], 2)
+        self.assertTrue(all(stage["finished"] for stage in progress["pipeline"].values()))
+
+    def test_failed_chunk_is_counted(self):
+        """Test that a failed write is counted and the pipeline keeps going."""
+        pipeline, counts, _ = self.run_pipeline(fail_first=True)
+        self.assertEqual(pipeline.failed_chunks, 1)
+        self.assertEqual(counts["inserted"], 1)
+
+    def test_failed_parse_fails_only_its_shard(self):
+        """Test that a parse error fails its shard and the other shards are written."""
+        pipeline, counts, progress = self.run_pipeline(fail_parse="2024")
+        self.assertEqual(counts, {"found": 3, "inserted": 2, "updated": 0, "skipped": 1})
+
+        results = {result.shard.year: result for result in pipeline.shard_results}
+        self.assertTrue(results["2024"].failed)
+        self.assertFalse(results["2021"].failed)
+        self.assertEqual(progress["shards_failed"], 2)
+
+    def test_events_of_several_shards_are_counted_once(self):
+        """Test that an event found by several shards is found and written once."""
+        _, counts, _ = self.run_pipeline(shared_links=True)
+        self.assertEqual(counts, {"found": 3, "inserted": 2, "updated": 0, "skipped": 1})
+        self.assertEqual(
+            sorted(row["link"] for chunk in self.written for row in chunk),
+            ["shared-0", "shared-1"],
+        )
+
+
+
+class TestIngestionJobLookup(unittest.TestCase):
+    """
+    Unit tests for IngestionJobManager.get_response.
+
+    Tests that jobs of other workers are found through their recorded run.
+    """
+
+    def lookup(self, job_id, run):
+        """Look up a job with the recorded run lookup answering `run`."""
+        repository = mock.Mock()
+        repository.get_by_run_id = mock.AsyncMock(return_value=run)
+
+        @contextlib.asynccontextmanager
+        async def session():
+            yield None
+
+        with mock.patch.object(job_service_module, "AsyncSessionLocal", session), \
+                mock.patch.object(
+                    job_service_module, "IngestionRunRepository", return_value=repository
+                ):
+            return asyncio.run(IngestionJobManager(workers=0).get_response(job_id))
+
+    def test_job_of_another_worker(self):
+        """Test that an unknown job is reported from its recorded run."""
+        started = datetime(2025, 3, 1, 12, 0, 0)
+        run = SimpleNamespace(
+            run_id="abc",
+            status="succeeded",
+            params={"mode": "full"},
+            result={"inserted": 3},
+            error=None,
+            started_at=started,
+            finished_at=started + timedelta(seconds=90),
+        )
+        response = self.lookup("abc", run)
+        self.assertEqual(response.id, "abc")
+        self.assertEqual(response.status.value, "succeeded")
+        self.assertEqual(response.result, {"inserted": 3})
+        self.assertEqual(response.duration_seconds, 90.0)
+
+    def test_unknown_job(self):
+        """Test that a job without a recorded run is not found."""
+        self.assertIsNone(self.lookup("missing", None))
+
+
+class TestHostThrottle(unittest.TestCase):
+    """
+    Unit tests for HostThrottle.
+
+    Tests spacing of requests to one host.
+    """
+
+    def test_same_host_is_spaced(self):
+        """Test that request starts to one host are spaced, other hosts are not."""
+        throttle = HostThrottle(0.05)
+        starts = {}
+
+        async def request(url):
+            await throttle.wait(url)
+            starts.setdefault(url.split("/")[2], []).append(time.monotonic())
+
+        async def run():
+            await asyncio.gather(
+                *(request("https://c-f-r.ru/live/page") for _ in range(3)),
+                request("https://example.org/page"),
+            )
+
+        asyncio.run(run())
+        gaps = [b - a for a, b in zip(starts["c-f-r.ru"], starts["c-f-r.ru"][1:])]
+        self.assertEqual(len(gaps), 2)
+        self.assertTrue(all(gap >= 0.045 for gap in gaps))
+        self.assertLess(starts["example.org"][0] - starts["c-f-r.ru"][0], 0.045)
+
+
+class TestSeasonTeamCrawl(unittest.TestCase):
+    """
+    Unit tests for SeasonTeamCrawl.
+
+    Tests team extraction and the bounded concurrency of season crawls.
+    """
+
+    def test_extract_teams(self):
+        """Test that team names are unique, sorted and non-empty."""
+        parsed = [
+            {"athlete": "Анна", "team": "Москва"},
+            {"athlete": "Мария", "team": ""},
+            {"athlete": "Иван", "team": "Казань"},
+            {"athlete": "Олег", "team": "Москва"},
+        ]
+        self.assertEqual(extract_teams(parsed), ["Казань", "Москва"])
+
+    def test_missing_pages_are_skipped(self):
+        """Test that 404 pages are skipped and events without pages return None."""
+        crawl = SeasonTeamCrawl("2025", host_delay=0)
+        pages = {
+            "2501msk/q.html": '<table><tr><td class="name">Анна</td>'
+            '<td class="command">Москва</td></tr></table>',
+        }
+
+        async def fetch(url, timeout=None):
+            path = url.split("/live/")[1]
+            if path not in pages:
+                request = httpx.Request("GET", url)
+                raise httpx.HTTPStatusError(
+                    "Not found", request=request, response=httpx.Response(404, request=request)
+                )
+            return SimpleNamespace(text=pages[path])
+
+        crawl.fetcher.fetch = fetch
+
+        async def run():
+            return (
+                await crawl.fetch_event_teams("2501msk"),
+                await crawl.fetch_event_teams("2502spb"),
+            )
+
+        with mock.patch.object(
+            season_crawl_module, "live_results_pages", return_value=["q.html", "f.html"]
+        ):
+            found, missing = asyncio.run(run())
+        self.assertEqual(found, ["Москва"])
+        self.assertIsNone(missing)
+
+    def test_concurrency_is_bounded(self):
+        """Test that at most `concurrency` events are crawled at once."""
+        crawl = SeasonTeamCrawl("2025", concurrency=3, host_delay=0)
+        events = [SimpleNamespace(link=f"25{i:02d}msk", name=str(i)) for i in range(10)]
+        active, peak, crawled = [0], [0], []
+
+        async def crawl_event(event_link, event_name):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            crawled.append(event_link)
+
+        class FakeEventRepository:
+            def __init__(self, session):
+                pass
+
+            async def get_by_year(self, year):
+                return events
+
+        @contextlib.asynccontextmanager
+        async def session():
+            yield None
+
+        crawl.crawl_event = crawl_event
+        with mock.patch.object(season_crawl_module, "AsyncSessionLocal", session), \
+                mock.patch.object(season_crawl_module, "EventRepository", FakeEventRepository):
+            asyncio.run(crawl._crawl())
+
+        self.assertEqual(peak[0], 3)
+        self.assertEqual(sorted(crawled), [event.link for event in events])
+        self.assertEqual(crawl.progress["events_total"], 10)
+
+    def test_failed_event_does_not_abort_crawl(self):
+        """Test that an error in one event is counted and the others are crawled."""
+        crawl = SeasonTeamCrawl("2025", host_delay=0)
+        events = [SimpleNamespace(link=f"25{i:02d}msk", name=str(i)) for i in range(4)]
+        crawled = []
+
+        async def crawl_event(event_link, event_name):
+            await asyncio.sleep(0.01)
+            if event_link == "2501msk":
+                raise RuntimeError("database unavailable")
+            crawled.append(event_link)
+
+        class FakeEventRepository:
+            def __init__(self, session):
+                pass
+
+            async def get_by_year(self, year):
+                return events
+
+        @contextlib.asynccontextmanager
+        async def session():
+            yield None
+
+        crawl.crawl_event = crawl_event
+        with mock.patch.object(season_crawl_module, "AsyncSessionLocal", session), \
+                mock.patch.object(season_crawl_module, "EventRepository", FakeEventRepository):
+            asyncio.run(crawl._crawl())
+
+        self.assertEqual(sorted(crawled), ["2500msk", "2502msk", "2503msk"])
+        self.assertEqual(crawl.progress["events_failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,98 @@
+import asyncio
 import unittest
+from unittest import mock
+
 from bs4 import BeautifulSoup
-from app.utils.parsers import parse_events
-from app.utils.utils import parse_date_range
+from app.utils.parse_pool import (
+    parse_events_parallel,
+    shutdown_parse_pool,
+    split_calendar_chunks,
+)
+from app.services.result_service import build_result_rows
+from app.utils.cell_stream import parse_cells_stream
+from app.utils.parsers import (
+    PARSER_BACKENDS,
+    parse_events,
+    parse_event_details,
+    parse_events_html,
+    parse_live_results,
+)
+from app.utils.utils import compute_event_hash, parse_date_range, parse_live_page_name
+
+
+# Calendar page of the parser backend and parse pool tests
+HTML_CALENDAR = """
+<li class="table__item" data-accordion="element">
+    <a class="table__content calendar__link" data-accordion="content" href="/competitions/2502kazan_pr/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>10 - 14 февраля</p>
+        <p class="table__text calendar__rank">Всероссийские</p>
+        <p class="table__text calendar__name"><span>Название мероприятия</span>Первенство России</p>
+        <p class="table__text calendar__type"><span>Тип</span>П</p>
+        <p class="table__text calendar__group">
+            <span>Группы</span>
+            13-14; 15-16                            </p>
+        <p class="table__text calendar__disciplines">
+            <span>Дисциплины</span>
+            Т; Б; С                            </p>
+        <p class="table__text calendar__location"><span>Локация</span>Казань</p>
+    </a>
+</li>
+<li class="table__item" data-accordion="element">
+    <a class="table__content calendar__link" data-accordion="content" href="/competitions/2503perm_kr/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>28 февраля - 02 марта</p>
+        <p class="table__text calendar__name"><span>Название мероприятия</span>Кубок России</p>
+        <p class="table__text calendar__type"><span>Тип</span>С</p>
+        <p class="table__text calendar__location"><span>Локация</span>Пермь</p>
+    </a>
+</li>
+<li class="table__item" data-accordion="element">
+    <a class="table__content calendar__link" data-accordion="content" href="/competitions/open_spb/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>05 апреля</p>
+        <p class="table__text calendar__name"><span>Название мероприятия</span>Открытый фестиваль</p>
+        <p class="table__text calendar__location"><span>Локация</span>Санкт-Петербург</p>
+    </a>
+</li>
+<li class="table__item" data-accordion="element">
+    <a class="table__content calendar__link" data-accordion="content" href="/competitions/2506ekb_vs/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>10 - 12 июня</p>
+        <p class="table__text calendar__name"><!-- draft --><span>Название мероприятия</span>
+            Кубок &amp; Первенство&nbsp;</p>
+        <p class="table__text calendar__group"><span>Группы</span>Ю</p>
+    </a>
+</li>
+<li class="table__item" data-accordion="element">
+    <a class="table__content calendar__link" data-accordion="content" href="/competitions/2505spb_cancel/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>01 мая</p>
+        <p class="table__text calendar__location"><span>Локация</span>ОТМЕНЕНО</p>
+    </a>
+</li>
+"""
+
+# Live results page fixtures
+HTML_LIVE_RESULTS = """
+<table>
+    <tr><td>Место</td><td>Участник</td><td>Команда</td><td>Результат</td></tr>
+    <tr>
+        <td class="place">1</td><td class="name">Иванова Анна</td>
+        <td class="command">Москва</td><td class="result">TOP</td>
+    </tr>
+    <tr>
+        <td class="place">=2.</td><td class="name">Петрова Мария</td>
+        <td class="command">Санкт-Петербург</td><td class="result">35+</td>
+    </tr>
+    <tr><td colspan="4"></td></tr>
+</table>
+"""
+
+HTML_LIVE_RESULTS_HEADERS = """
+<table>
+    <thead><tr><th>Место</th><th>Фамилия, имя</th><th>Год</th><th>Команда</th><th>Результат</th></tr></thead>
+    <tbody>
+        <tr><td>1</td><td>Сидорова Ольга</td><td>2012</td><td>Пермь</td><td>40</td></tr>
+        <tr><td>н/я</td><td>Козлова Вера</td><td>2011</td><td>Тюмень</td><td></td></tr>
+    </tbody>
+</table>
+"""
 
 
 class TestParseEvents(unittest.TestCase):
@@ -104,6 +195,294 @@ class TestParseEvents(unittest.TestCase):
         self.assertEqual(result_no_year[0]["link"], "no_year")
 
 
+class TestParserBackends(unittest.TestCase):
+    """
+    Unit tests for the pluggable calendar parser backends.
+
+    Every backend must produce exactly the same output as the
+    BeautifulSoup reference implementation.
+    """
+
+    fixtures = [HTML_CALENDAR, ""]
+
+    def test_backends_match_reference(self):
+        """Test that all backends produce output identical to BeautifulSoup."""
+        for html in self.fixtures:
+            expected = parse_events(BeautifulSoup(html, "html.parser"))
+            for backend in PARSER_BACKENDS:
+                with self.subTest(backend=backend, html=html[:60]):
+                    self.assertEqual(parse_events_html(html, backend), expected)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            parse_events_html(HTML_CALENDAR, "unknown")
+
+
+class TestParsePool(unittest.TestCase):
+    """
+    Unit tests for chunked parsing in the process pool.
+
+    Tests that splitting a page into fragments keeps every event and its order.
+    """
+
+    html_content = HTML_CALENDAR
+
+    def tearDown(self):
+        shutdown_parse_pool()
+
+    def test_split_calendar_chunks(self):
+        """Test that fragments hold whole links and cover the page."""
+        chunks = split_calendar_chunks(self.html_content, 2)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual([chunk.count("</a>") for chunk in chunks], [2, 2, 1])
+        self.assertTrue(all(chunk.startswith("<a ") for chunk in chunks))
+        self.assertEqual(split_calendar_chunks(self.html_content, 10), [self.html_content])
+
+    def test_parse_events_parallel_preserves_order(self):
+        """Test that parallel parsing matches sequential parsing."""
+        expected = parse_events(BeautifulSoup(self.html_content, "html.parser"))
+        with mock.patch("app.utils.parse_pool.settings.PARSE_CHUNK_LINKS", 1):
+            result = asyncio.run(parse_events_parallel(self.html_content))
+        self.assertEqual(result, expected)
+
+    def test_parse_events_parallel_without_pool(self):
+        """Test that parsing falls back to a thread when the pool is disabled."""
+        expected = parse_events(BeautifulSoup(self.html_content, "html.parser"))
+        with mock.patch("app.utils.parse_pool.settings.PARSE_POOL_SIZE", 0):
+            result = asyncio.run(parse_events_parallel(self.html_content))
+        self.assertEqual(result, expected)
+
+
+class TestComputeEventHash(unittest.TestCase):
+    """
+    Unit tests for compute_event_hash function.
+
+    Tests that the content hash is stable and tracks content changes.
+    """
+
+    html_content = """
+    <a class="table__content calendar__link" href="/competitions/2103voronezh_ch/">
+        <p class="table__text calendar__date"><span>Даты проведения</span>04 - 07 марта</p>
+        <p class="table__text calendar__name"><span>Название мероприятия</span>Чемпионат России</p>
+        <p class="table__text calendar__location"><span>Локация</span>Воронеж</p>
+    </a>
+    """
+
+    def test_parse_events_adds_stable_hash(self):
+        """Test that parsed events carry the same hash on every parse."""
+        first = parse_events(BeautifulSoup(self.html_content, "html.parser"))[0]
+        second = parse_events(BeautifulSoup(self.html_content, "html.parser"))[0]
+        self.assertEqual(len(first["content_hash"]), 64)
+        self.assertEqual(first["content_hash"], second["content_hash"])
+        self.assertEqual(first["content_hash"], compute_event_hash(first))
+
+    def test_hash_ignores_key_order(self):
+        """Test that the hash does not depend on dictionary key order."""
+        event = {"link": "2103voronezh_ch", "name": "Чемпионат России", "groups": ["В"]}
+        reordered = {"groups": ["В"], "name": "Чемпионат России", "link": "2103voronezh_ch"}
+        self.assertEqual(compute_event_hash(event), compute_event_hash(reordered))
+
+    def test_hash_changes_with_content(self):
+        """Test that renaming or moving an event changes its hash."""
+        event = parse_events(BeautifulSoup(self.html_content, "html.parser"))[0]
+        renamed = dict(event, name="Кубок России")
+        moved = dict(event, date="05 - 08 марта")
+        self.assertNotEqual(compute_event_hash(event), compute_event_hash(renamed))
+        self.assertNotEqual(compute_event_hash(event), compute_event_hash(moved))
+
+
+class TestParseLiveResults(unittest.TestCase):
+    """
+    Unit tests for parse_live_results function.
+
+    Tests parsing of live results tables by cell classes and by headers.
+    """
+
+    def test_parse_by_cell_classes(self):
+        """Test that rows are read by cell classes and places are normalized."""
+        results = parse_live_results(HTML_LIVE_RESULTS)
+        self.assertEqual(
+            results,
+            [
+                {"athlete": "Иванова Анна", "team": "Москва", "place": 1, "score": "TOP"},
+                {
+                    "athlete": "Петрова Мария",
+                    "team": "Санкт-Петербург",
+                    "place": 2,
+                    "score": "35+",
+                },
+            ],
+        )
+
+    def test_parse_by_headers(self):
+        """Test that tables without cell classes are read by column headers."""
+        results = parse_live_results(HTML_LIVE_RESULTS_HEADERS)
+        self.assertEqual([r["athlete"] for r in results], ["Сидорова Ольга", "Козлова Вера"])
+        self.assertEqual([r["team"] for r in results], ["Пермь", "Тюмень"])
+        self.assertEqual([r["place"] for r in results], [1, None])
+
+    def test_parse_empty(self):
+        """Test that an empty page has no results."""
+        self.assertEqual(parse_live_results(""), [])
+
+    def test_page_name(self):
+        """Test that discipline, round and group are taken from the page name."""
+        self.assertEqual(
+            parse_live_page_name("l_q_f13.html"),
+            {"discipline": "трудность", "round": "квалификация", "group": "f13"},
+        )
+        self.assertEqual(
+            parse_live_page_name("x.html"),
+            {"discipline": "x", "round": None, "group": None},
+        )
+
+    def test_build_result_rows(self):
+        """Test that rows get page metadata, hashes and are deduplicated."""
+        parsed = parse_live_results(HTML_LIVE_RESULTS)
+        rows = build_result_rows("2603msk", "l_f_m15.html", parsed + parsed[:1])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["round"], "финал")
+        self.assertEqual(rows[0]["group_name"], "m15")
+        self.assertEqual(len({row["content_hash"] for row in rows}), 2)
+
+
+# Live results page with markup the streaming parser has to cope with
+HTML_LIVE_TEAMS = """<html><head><meta charset="windows-1251"><title>Финал</title></head>
+<body><table>
+<tr><th>Место</th><th class="command">Команда</th></tr>
+<tr><td class="place">1</td><td class="name">Иванова Анна</td>
+    <td class="command cell"> Москва <b>&amp; МО</b> </td></tr>
+<tr><td class="place">2</td><td class="command"><!-- нет -->Санкт-Петербург</td></tr>
+<tr><td class="place">3</td><td class="command"></td></tr>
+<tr><td class="place">4</td><td class="command"><table><tr><td>Пермь</td></tr></table></td></tr>
+</table>""" + "<p>" + "x" * 5000 + "</p></body></html>"
+
+
+def iter_chunks(data: bytes, size: int, consumed: list = None):
+    """Yield data in chunks of `size` bytes like a streamed response body."""
+
+    async def chunks():
+        for i in range(0, len(data), size):
+            if consumed is not None:
+                consumed.append(i)
+            yield data[i : i + size]
+
+    return chunks()
+
+
+class TestParseCellsStream(unittest.TestCase):
+    """
+    Unit tests for parse_cells_stream function.
+
+    Tests streaming extraction of cell texts against BeautifulSoup.
+    """
+
+    def expected(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        return [td.get_text(strip=True) for td in soup.find_all("td", class_="command")]
+
+    def test_matches_beautifulsoup(self):
+        """Test that cells split over arbitrary chunks match get_text(strip=True)."""
+        data = HTML_LIVE_TEAMS.encode("utf-8")
+        for size in (1, 7, 64, len(data)):
+            with self.subTest(size=size):
+                cells = asyncio.run(
+                    parse_cells_stream(iter_chunks(data, size), "command", encoding="utf-8")
+                )
+                self.assertEqual(cells, ["Москва& МО", "Санкт-Петербург", "", "Пермь"])
+                self.assertEqual(cells, self.expected(HTML_LIVE_TEAMS))
+
+    def test_unclosed_cells(self):
+        """Test that a cell without an end tag ends at the next cell or row."""
+        html = (
+            '<table><tr><td class="command">Пермь<td class="command">Тюмень'
+            '<tr><td class="command">Омск</table><td class="command">Уфа'
+        )
+        cells = asyncio.run(
+            parse_cells_stream(iter_chunks(html.encode("utf-8"), 5), "command")
+        )
+        self.assertEqual(cells, ["Пермь", "Тюмень", "Омск", "Уфа"])
+
+    def test_declared_charset(self):
+        """Test that the page's meta charset is used without a response charset."""
+        data = HTML_LIVE_TEAMS.encode("windows-1251")
+        cells = asyncio.run(parse_cells_stream(iter_chunks(data, 100), "command"))
+        self.assertEqual(cells[:2], ["Москва& МО", "Санкт-Петербург"])
+
+    def test_limit_stops_reading(self):
+        """Test that the rest of the page is not read once the limit is reached."""
+        data = HTML_LIVE_TEAMS.encode("utf-8")
+        consumed = []
+        cells = asyncio.run(
+            parse_cells_stream(
+                iter_chunks(data, 100, consumed), "command", encoding="utf-8", limit=1
+            )
+        )
+        self.assertEqual(cells, ["Москва& МО"])
+        self.assertLess(len(consumed), len(data) // 100)
+
+
+# Event detail page fixture
+HTML_EVENT_DETAILS = """<html><body>
+<header><a href="/competitions/results/">Результаты</a></header>
+<nav><a href="/docs/polozhenie_2025.pdf">Положение о соревнованиях</a></nav>
+<main>
+  <h1>Первенство России</h1>
+  <a href="/upload/iblock/1/polozhenie.pdf">Положение</a>
+  <a href="/upload/iblock/2/reglament.docx">Регламент соревнований</a>
+  <a href="https://c-f-r.ru/live/2503msk/">Онлайн</a>
+  <a href="/competitions/2503msk/results/">Результаты</a>
+  <a href="/competitions/results/">Все результаты</a>
+  <a href="/upload/iblock/3/protocol_final.xlsx">Протокол финала</a>
+  <a href="/upload/iblock/4/schedule.pdf">Расписание</a>
+  <a href="/upload/iblock/1/polozhenie.pdf">Положение (дубль)</a>
+  <a href="#top">Наверх</a>
+</main>
+</body></html>"""
+
+
+class TestParseEventDetails(unittest.TestCase):
+    """
+    Unit tests for parse_event_details function.
+
+    Tests sorting of detail page links into categories.
+    """
+
+    def test_links_are_categorized(self):
+        """Test regulations, results, protocols and other documents."""
+        url = "https://www.rusclimbing.ru/competitions/2503msk/"
+        details = parse_event_details(HTML_EVENT_DETAILS, url)
+        urls = {kind: [link["url"] for link in links] for kind, links in details.items()}
+
+        self.assertEqual(
+            urls["regulations"],
+            [
+                "https://www.rusclimbing.ru/upload/iblock/1/polozhenie.pdf",
+                "https://www.rusclimbing.ru/upload/iblock/2/reglament.docx",
+            ],
+        )
+        self.assertEqual(
+            urls["results"],
+            [
+                "https://c-f-r.ru/live/2503msk/",
+                "https://www.rusclimbing.ru/competitions/2503msk/results/",
+            ],
+        )
+        self.assertEqual(
+            urls["protocols"], ["https://www.rusclimbing.ru/upload/iblock/3/protocol_final.xlsx"]
+        )
+        self.assertEqual(
+            urls["documents"], ["https://www.rusclimbing.ru/upload/iblock/4/schedule.pdf"]
+        )
+        self.assertEqual(details["regulations"][0]["title"], "Положение")
+
+    def test_empty_page(self):
+        """Test that an empty page has no links."""
+        details = parse_event_details("", "https://www.rusclimbing.ru/competitions/x/")
+        self.assertTrue(all(links == [] for links in details.values()))
+
+
 class TestParseDateRange(unittest.TestCase):
     """
     Unit tests for parse_date_range function.
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from app.core.config import settings
+from app.core.db.notify import NOTIFY_PAYLOAD_LIMIT, split_payload
+from app.schemas.event import EventFilter
+from app.services.broadcast import BroadcastHub, StreamMessage, event_matches
+
+
+def make_event(link, **fields):
+    """Build a serialized event for hub tests."""
+    event = {
+        "link": link,
+        "date": "1-3 марта",
+        "year": "2025",
+        "rank": "Всероссийские",
+        "startdate": "2025-03-01",
+        "enddate": "2025-03-03",
+        "name": f"Соревнования {link}",
+        "location": "Москва",
+        "type": "book_competition",
+        "groups": ["adults"],
+        "disciplines": ["bouldering"],
+    }
+    event.update(fields)
+    return event
+
+
+class TestSplitPayload(unittest.TestCase):
+    """
+    Unit tests for split_payload.
+
+    Tests splitting of notifications over the NOTIFY payload limit.
+    """
+
+    def test_small_list_is_one_payload(self):
+        """Test that a short list fits into a single payload."""
+        payloads = split_payload({"kind": "events"}, "links", ["a", "b"])
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(json.loads(payloads[0]), {"kind": "events", "links": ["a", "b"]})
+
+    def test_large_list_is_split_in_order(self):
+        """Test that a long list is spread over payloads below the limit, in order."""
+        links = [f"25{i:05d}абвгд" for i in range(2000)]
+        payloads = split_payload({"kind": "events"}, "links", links)
+
+        self.assertGreater(len(payloads), 1)
+        self.assertTrue(
+            all(len(payload.encode("utf-8")) <= NOTIFY_PAYLOAD_LIMIT for payload in payloads)
+        )
+        decoded = [json.loads(payload) for payload in payloads]
+        self.assertTrue(all(message["kind"] == "events" for message in decoded))
+        self.assertEqual([link for message in decoded for link in message["links"]], links)
+
+    def test_oversized_item_is_dropped(self):
+        """Test that an item that cannot fit on its own is skipped."""
+        payloads = split_payload({"kind": "events"}, "links", ["a", "x" * 9000, "b"])
+        self.assertEqual(json.loads(payloads[0])["links"], ["a", "b"])
+
+    def test_empty_list_has_no_payloads(self):
+        """Test that nothing is published for an empty list."""
+        self.assertEqual(split_payload({"kind": "events"}, "links", []), [])
+
+
+class TestEventMatches(unittest.TestCase):
+    """
+    Unit tests for event_matches.
+
+    Tests that stream filters select the same events as /api/events.
+    """
+
+    def test_empty_filter_matches(self):
+        """Test that an empty filter matches every event."""
+        self.assertTrue(event_matches(EventFilter(), make_event("1")))
+
+    def test_date_range(self):
+        """Test start and end bounds, and events without dates."""
+        event = make_event("1")
+        self.assertTrue(event_matches(EventFilter(start="2025-03-01", end="2025-03-03"), event))
+        self.assertFalse(event_matches(EventFilter(start="2025-03-02"), event))
+        self.assertFalse(event_matches(EventFilter(end="2025-03-02"), event))
+        self.assertFalse(
+            event_matches(EventFilter(start="2025-01-01"), make_event("2", startdate=None))
+        )
+
+    def test_lists_overlap(self):
+        """Test type membership and group and discipline overlap."""
+        event = make_event("1", groups=["adults", "juniors"])
+        self.assertTrue(event_matches(EventFilter(groups=["juniors", "v13"]), event))
+        self.assertFalse(event_matches(EventFilter(groups=["v13"]), event))
+        self.assertFalse(event_matches(EventFilter(disciplines=["skorost"]), event))
+        self.assertFalse(event_matches(EventFilter(types=["book_festival"]), event))
+
+    def test_ranks_ignored(self):
+        """Test that ranks do not filter the stream, as they do not filter /api/events."""
+        event = make_event("1", rank="Региональные")
+        self.assertTrue(event_matches(EventFilter(ranks=["Всероссийские"]), event))
+        self.assertTrue(event_matches(EventFilter(ranks=["Международные"]), make_event("2", rank="")))
+
+
+class TestBroadcastHub(unittest.TestCase):
+    """
+    Unit tests for BroadcastHub.
+
+    Tests fan-out of notifications to filtered subscribers.
+    """
+
+    def make_hub(self, events):
+        """Create a hub whose events are loaded from a dictionary."""
+        hub = BroadcastHub(pg_listener=mock.Mock())
+        hub.loads = []
+
+        async def load_events(links):
+            hub.loads.append(links)
+            return [events[link] for link in links if link in events]
+
+        hub.load_events = load_events
+        return hub
+
+    def test_events_are_matched_per_subscriber(self):
+        """Test that each subscriber gets only its events, loaded once."""
+        events = {
+            "1": make_event("1", groups=["adults"]),
+            "2": make_event("2", groups=["v13"]),
+        }
+        hub = self.make_hub(events)
+
+        async def run():
+            async with hub.subscribe(EventFilter(groups=["v13"])) as young, hub.subscribe(
+                EventFilter()
+            ) as everyone, hub.subscribe(EventFilter(types=["book_festival"])) as none:
+                await hub.dispatch(json.dumps({"kind": "events", "links": ["1", "2"]}))
+                return young.queue.get_nowait(), everyone.queue.get_nowait(), none.queue.empty()
+
+        young, everyone, none_empty = asyncio.run(run())
+        self.assertEqual(hub.loads, [["1", "2"]])
+        self.assertEqual([event["link"] for event in young.data], ["2"])
+        self.assertEqual([event["link"] for event in everyone.data], ["1", "2"])
+        self.assertTrue(none_empty)
+
+    def test_results_follow_event_filter(self):
+        """Test that result diffs reach subscribers whose filter matches the event."""
+        hub = self.make_hub({"1": make_event("1")})
+        notification = {
+            "kind": "results",
+            "event": "1",
+            "page": "l_q_f13.html",
+            "changed": [{"athlete": "Иванов Иван", "team": "Москва", "place": 1}],
+            "removed": [],
+        }
+
+        async def run():
+            async with hub.subscribe(EventFilter(groups=["adults"])) as matching, hub.subscribe(
+                EventFilter(groups=["v13"])
+            ) as other:
+                await hub.dispatch(json.dumps(notification))
+                return matching.queue.get_nowait(), other.queue.empty()
+
+        message, other_empty = asyncio.run(run())
+        self.assertEqual(message.kind, "results")
+        self.assertEqual(message.data["changed"][0]["athlete"], "Иванов Иван")
+        self.assertTrue(other_empty)
+
+    def test_idle_hub_does_not_load(self):
+        """Test that notifications are ignored without subscribers."""
+        hub = self.make_hub({"1": make_event("1")})
+        asyncio.run(hub.dispatch(json.dumps({"kind": "events", "links": ["1"]})))
+        self.assertEqual(hub.loads, [])
+
+    def test_slow_subscriber_is_asked_to_resync(self):
+        """Test that a full queue is replaced by a single resync message."""
+        hub = self.make_hub({"1": make_event("1")})
+
+        async def run():
+            with mock.patch.object(settings, "SSE_QUEUE_SIZE", 2):
+                async with hub.subscribe(EventFilter()) as subscription:
+                    for _ in range(5):
+                        await hub.dispatch(json.dumps({"kind": "events", "links": ["1"]}))
+                    queue = subscription.queue
+                    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        messages = asyncio.run(run())
+        self.assertEqual(messages, [StreamMessage("resync")])
+
+    def test_message_encoding(self):
+        """Test the Server-Sent Event wire format."""
+        message = StreamMessage("events", [{"name": "Кубок"}])
+        self.assertEqual(message.encode(), 'event: events\ndata: [{"name": "Кубок"}]\n\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
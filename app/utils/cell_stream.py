@@ -0,0 +1,157 @@
+"""Streaming extraction of table cell texts from pages being downloaded."""
+
+import codecs
+from html.parser import HTMLParser
+from typing import AsyncIterator, List, Optional
+
+from app.core.encoding import CHARSET_SNIFF_BYTES, sniff_encoding
+
+# Tags that implicitly close an open table cell
+CELL_BOUNDARY_TAGS = ("td", "th", "tr")
+
+
+class CellTextParser(HTMLParser):
+    """
+    Event-driven extractor of the texts of table cells with a given class.
+
+    Fed chunk by chunk, it keeps only the texts of the matching cells and
+    never builds a document tree, so memory use depends on the extracted
+    data rather than on the page size. Texts are produced the way
+    BeautifulSoup's get_text(strip=True) does.
+    """
+
+    def __init__(self, cell_class: str):
+        """
+        Initialize CellTextParser.
+
+        Args:
+            cell_class: Class of the td elements to extract, e.g. "command"
+        """
+        super().__init__(convert_charrefs=True)
+        self.cell_class = cell_class
+        self.cells: List[str] = []
+        self._parts: Optional[List[str]] = None
+        self._depth = 0
+        self._joins_text = False
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        """
+        Start a matching cell, or finish the open one at a cell boundary.
+
+        Args:
+            tag: Lowercased tag name
+            attrs: List of (name, value) attribute pairs
+        """
+        self._joins_text = False
+        if self._parts is not None:
+            if tag == "table":
+                self._depth += 1
+            elif tag in CELL_BOUNDARY_TAGS and self._depth == 0:
+                self._finish_cell()
+        if self._parts is None and tag == "td":
+            classes = (dict(attrs).get("class") or "").split()
+            if self.cell_class in classes:
+                self._parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Finish the open cell when its td, row or table ends.
+
+        Args:
+            tag: Lowercased tag name
+        """
+        self._joins_text = False
+        if self._parts is None:
+            return
+        # Tables nested in the cell belong to its text
+        if tag == "table" and self._depth:
+            self._depth -= 1
+        elif self._depth == 0 and tag in ("td", "tr", "table"):
+            self._finish_cell()
+
+    def handle_data(self, data: str) -> None:
+        """
+        Collect text inside the open cell.
+
+        Args:
+            data: Text between tags, with character references converted
+        """
+        if self._parts is None:
+            return
+        # Text split across chunks arrives in pieces but is one text node
+        if self._joins_text:
+            self._parts[-1] += data
+        else:
+            self._parts.append(data)
+        self._joins_text = True
+
+    def handle_comment(self, data: str) -> None:
+        """
+        Keep the texts around a comment apart, as BeautifulSoup does.
+
+        Args:
+            data: Comment text
+        """
+        self._joins_text = False
+
+    def close(self) -> None:
+        """Flush buffered input and store a cell left open at the end of the page."""
+        super().close()
+        if self._parts is not None:
+            self._finish_cell()
+
+    def _finish_cell(self) -> None:
+        """Store the text of the cell being read."""
+        self.cells.append("".join(part.strip() for part in self._parts if part.strip()))
+        self._parts = None
+        self._depth = 0
+
+
+async def parse_cells_stream(
+    chunks: AsyncIterator[bytes],
+    cell_class: str,
+    encoding: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[str]:
+    """
+    Extract cell texts from a page while it is being downloaded.
+
+    Chunks are decoded incrementally and fed to a CellTextParser as they
+    arrive. Once `limit` cells are found the rest of the page is not read,
+    so the caller can close the connection early.
+
+    Args:
+        chunks: Page body chunks, e.g. httpx.Response.aiter_bytes()
+        cell_class: Class of the td elements to extract
+        encoding: Charset from the response headers; if None, the charset
+            declared in the page is used, falling back to UTF-8
+        limit: Maximum number of cells to extract, all cells if None
+
+    Returns:
+        Cell texts in page order
+    """
+    parser = CellTextParser(cell_class)
+    decoder = None
+    head = b""
+
+    async for chunk in chunks:
+        if decoder is None:
+            head += chunk
+            if encoding is None and len(head) < CHARSET_SNIFF_BYTES:
+                continue
+            decoder = codecs.getincrementaldecoder(
+                encoding or sniff_encoding(head) or "utf-8"
+            )(errors="replace")
+            chunk, head = head, b""
+        parser.feed(decoder.decode(chunk))
+        if limit is not None and len(parser.cells) >= limit:
+            return parser.cells[:limit]
+
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(
+            encoding or sniff_encoding(head) or "utf-8"
+        )(errors="replace")
+        parser.feed(decoder.decode(head))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.cells[:limit] if limit is not None else parser.cells
@@ -0,0 +1,144 @@
+"""Circuit breaker for calls to unreliable upstream sites."""
+
+import time
+from enum import Enum
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        """
+        Initialize CircuitOpenError.
+
+        Args:
+            name: Name of the circuit breaker
+            retry_after: Seconds until a probe call is allowed
+        """
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{name}' is open, retry in {retry_after:.0f} s")
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after repeated upstream failures.
+
+    The circuit opens after `failure_threshold` consecutive failures and
+    rejects calls with CircuitOpenError for `reset_timeout` seconds. Then
+    it becomes half-open and lets a single probe call through: a success
+    closes the circuit, a failure opens it for another cooldown period.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            name: Name used in errors and logs
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            is_failure: Decides whether an exception counts as an upstream
+                failure; other exceptions count as successful calls. By
+                default every exception is a failure.
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure or (lambda e: True)
+        self.clock = clock
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self._opened_at < self.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until a probe call is allowed, 0 if calls are allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Call an upstream coroutine function through the breaker.
+
+        Args:
+            fn: Coroutine function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of the call
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+            Exception: Whatever the call raised
+        """
+        self._before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure(e):
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        except BaseException:
+            # Cancelled calls say nothing about the upstream
+            self._probing = False
+            raise
+        self._record_success()
+        return result
+
+    def _before_call(self) -> None:
+        """Reject the call if the circuit does not allow it."""
+        state = self.state
+        if state == CircuitState.OPEN or (state == CircuitState.HALF_OPEN and self._probing):
+            raise CircuitOpenError(self.name, self.retry_after)
+        if state == CircuitState.HALF_OPEN:
+            self._probing = True
+
+    def _record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._opened_at is not None:
+            print(f"Circuit '{self.name}' closed")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def _record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            print(f"Circuit '{self.name}' opened after {self.failures} failures")
+            self._opened_at = self.clock()
+        self._probing = False
@@ -0,0 +1,87 @@
+"""HTTP validators and cache headers for conditional GET."""
+
+import hashlib
+from typing import Dict, Optional
+
+from fastapi.responses import Response
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak entity tag from the values a response is derived from.
+
+    Args:
+        *parts: Values identifying the response data, converted with str()
+
+    Returns:
+        Quoted weak entity tag
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Tags are compared weakly, as RFC 9110 requires for If-None-Match.
+
+    Args:
+        if_none_match: If-None-Match request header value
+        etag: Current entity tag of the response
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_control(s_maxage: int, stale_while_revalidate: int) -> str:
+    """
+    Build a Cache-Control value for shared caches such as a CDN.
+
+    Browsers always revalidate (max-age=0) with the entity tag, while shared
+    caches serve the response for `s_maxage` seconds and then a stale copy
+    for up to `stale_while_revalidate` seconds while they revalidate it.
+
+    Args:
+        s_maxage: Seconds shared caches serve the response as fresh
+        stale_while_revalidate: Seconds a stale response may be served while revalidating
+
+    Returns:
+        Cache-Control header value
+    """
+    return (
+        f"public, max-age=0, s-maxage={s_maxage}, "
+        f"stale-while-revalidate={stale_while_revalidate}"
+    )
+
+
+def cache_headers(etag: str, control: str) -> Dict[str, str]:
+    """Build the validator and Cache-Control headers of a response."""
+    return {"ETag": etag, "Cache-Control": control}
+
+
+def not_modified(etag: str, control: str) -> Response:
+    """
+    Build a body-less 304 Not Modified response.
+
+    Args:
+        etag: Current entity tag
+        control: Cache-Control header value
+
+    Returns:
+        304 response carrying the same validator and cache headers
+    """
+    return Response(status_code=304, headers=cache_headers(etag, control))
@@ -0,0 +1,43 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+
+
+def encode_cursor(key: str) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    Args:
+        key: Sort key of the last row
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps({"after": key}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Sort key of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key = data["after"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(key, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key
@@ -0,0 +1,103 @@
+"""Process pool offload for CPU-bound HTML parsing."""
+
+import asyncio
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from app.core.config import settings
+from app.utils.parsers import parse_events_html
+
+# Opening tag of a calendar entry link, used to cut the page into fragments
+CALENDAR_LINK_TAG_RE = re.compile(r"<a\b[^>]*\bcalendar__link\b", re.IGNORECASE)
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def split_calendar_chunks(html: str, links_per_chunk: int) -> List[str]:
+    """
+    Split a calendar page into fragments of whole calendar links.
+
+    Every fragment starts at a calendar link's opening tag and ends right
+    before the first link of the next fragment, so no link is ever cut in
+    two. Parsing the fragments in order yields the same events, in the
+    same order, as parsing the whole page.
+
+    Args:
+        html: Calendar page HTML
+        links_per_chunk: Maximum number of calendar links per fragment
+
+    Returns:
+        List of HTML fragments; the whole page if it is small enough
+    """
+    starts = [match.start() for match in CALENDAR_LINK_TAG_RE.finditer(html)]
+    if len(starts) <= links_per_chunk:
+        return [html]
+
+    boundaries = starts[::links_per_chunk]
+    ends = boundaries[1:] + [len(html)]
+    return [html[start:end] for start, end in zip(boundaries, ends)]
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared parsing process pool, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor, or None if the pool is disabled by settings
+    """
+    global _parse_pool
+    if settings.PARSE_POOL_SIZE <= 0:
+        return None
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=settings.PARSE_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the parsing process pool. Called on application shutdown."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def parse_events_parallel(html: str, backend: Optional[str] = None) -> list:
+    """
+    Parse calendar HTML off the event loop thread.
+
+    Large pages are split into fragments of settings.PARSE_CHUNK_LINKS
+    calendar links which are parsed in parallel by the process pool and
+    merged back in document order. When the pool is disabled
+    (PARSE_POOL_SIZE = 0, e.g. on serverless hosts) the page is parsed
+    in a worker thread instead.
+
+    Args:
+        html: Calendar page HTML
+        backend: Parser backend name, defaults to settings.HTML_PARSER_BACKEND
+
+    Returns:
+        List of dictionaries containing parsed event information
+    """
+    backend = backend or settings.HTML_PARSER_BACKEND
+    pool = get_parse_pool()
+    if pool is None:
+        return await asyncio.to_thread(parse_events_html, html, backend)
+
+    loop = asyncio.get_running_loop()
+    chunks = split_calendar_chunks(html, settings.PARSE_CHUNK_LINKS)
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, parse_events_html, chunk, backend)
+            for chunk in chunks
+        )
+    )
+
+    events = []
+    for chunk_events in results:
+        events.extend(chunk_events)
+    return events
@@ -1,7 +1,120 @@
 """Parser utilities for extracting data from HTML."""
 
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+import lxml.html
+from bs4 import BeautifulSoup
+
 from app.core.config import settings
-from app.utils.utils import extract_link_id, extract_year_from_link
+from app.utils.utils import (
+    compute_event_hash,
+    extract_link_id,
+    extract_year_from_link,
+)
+
+# Class of the calendar entry links
+CALENDAR_LINK_CLASS = "table__content calendar__link"
+
+# Classes of the paragraphs holding each event field inside a calendar link
+EVENT_FIELD_CLASSES = {
+    "date": "table__text calendar__date",
+    "startdate": "table__text calendar__startdate",
+    "enddate": "table__text calendar__enddate",
+    "name": "table__text calendar__name",
+    "location": "table__text calendar__location",
+    "type": "table__text calendar__type",
+    "groups": "table__text calendar__group",
+    "disciplines": "table__text calendar__disciplines",
+    "rank": "table__text calendar__rank",
+}
+
+
+def _build_event(href: str, texts: Dict[str, Optional[str]]) -> Optional[dict]:
+    """
+    Build an event dictionary from the raw texts of its fields.
+
+    Shared by all parser backends so that they only differ in how the
+    texts are extracted from the HTML.
+
+    Args:
+        href: Value of the calendar link's href attribute
+        texts: Field name to stripped element text, None if the element is missing
+
+    Returns:
+        Dictionary with event information, or None if the event is cancelled
+    """
+    date_text = texts.get("date")
+    date = (
+        date_text.replace("Даты проведения", "").strip() if date_text is not None else ""
+    )
+
+    # Extract startdate and enddate
+    startdate = (texts.get("startdate") or "").strip()
+    enddate = (texts.get("enddate") or "").strip()
+
+    # Extract link
+    link_id = extract_link_id(href)
+
+    # Extract name
+    name_text = texts.get("name")
+    name = (
+        name_text.replace("Название мероприятия", "").strip()
+        if name_text is not None
+        else ""
+    )
+
+    # Extract location
+    location_text = texts.get("location")
+    location = (
+        location_text.replace("Локация", "").strip() if location_text is not None else ""
+    )
+
+    # Filter out events with cancelled status
+    if any(rejected_word in location for rejected_word in settings.REJECTED_WORDS):
+        return None
+
+    # Extract type
+    type_text = texts.get("type")
+    type_ = type_text.replace("Тип", "").strip() if type_text is not None else ""
+
+    # Extract groups
+    groups = []
+    groups_text = texts.get("groups")
+    if groups_text is not None:
+        groups_text = groups_text.replace("Группы", "").strip()
+        groups = [g.strip() for g in groups_text.split(";")]
+
+    # Extract disciplines
+    disciplines = []
+    disciplines_text = texts.get("disciplines")
+    if disciplines_text is not None:
+        disciplines_text = disciplines_text.replace("Дисциплины", "").strip()
+        disciplines = [d.strip() for d in disciplines_text.split(";")]
+
+    # Extract rank
+    rank_text = texts.get("rank")
+    rank = rank_text.strip() if rank_text is not None else None
+
+    # Extract year from link (format: 2112kna -> year = `20` + first 2 digits)
+    year = extract_year_from_link(href)
+
+    event = {
+        "date": date,
+        "year": year,
+        "rank": rank,
+        "link": link_id,
+        "name": name,
+        "location": location,
+        "type": type_,
+        "groups": groups,
+        "disciplines": disciplines,
+        "startdate": startdate,
+        "enddate": enddate,
+    }
+    event["content_hash"] = compute_event_hash(event)
+    return event
 
 
 def parse_events(soup) -> list:
@@ -9,7 +122,8 @@ def parse_events(soup) -> list:
     Parse HTML content to extract climbing competition events.
 
     Extracts event information from BeautifulSoup object containing
-    competition calendar data.
+    competition calendar data. This is the reference implementation the
+    other parser backends are checked against.
 
     Args:
         soup: BeautifulSoup object with HTML content
@@ -23,7 +137,7 @@ def parse_events(soup) -> list:
     events = []
 
     # Find all links with calendar class
-    calendar_links = soup.find_all("a", class_="table__content calendar__link")
+    calendar_links = soup.find_all("a", class_=CALENDAR_LINK_CLASS)
     print(f"DEBUG: Found {len(calendar_links)} calendar links")
 
     if len(calendar_links) == 0:
@@ -36,114 +150,329 @@ def parse_events(soup) -> list:
 
     for link in calendar_links:
         try:
-            # Extract date
-            date_span = link.find("p", class_="table__text calendar__date")
-            if date_span:
-                date = (
-                    date_span.get_text(strip=True)
-                    .replace("Даты проведения", "")
-                    .strip()
-                )
-            else:
-                date = ""
-
-            # Extract startdate and enddate
-            startdate_span = link.find("p", class_="table__text calendar__startdate")
-            enddate_span = link.find("p", class_="table__text calendar__enddate")
-
-            startdate = ""
-            enddate = ""
-
-            if startdate_span:
-                startdate = startdate_span.get_text(strip=True).strip()
-
-            if enddate_span:
-                enddate = enddate_span.get_text(strip=True).strip()
-
-            # Extract link
-            href = link.get("href", "")
-            link_id = extract_link_id(href)
-
-            # Extract name
-            name_span = link.find("p", class_="table__text calendar__name")
-            name = (
-                name_span.get_text(strip=True)
-                .replace("Название мероприятия", "")
-                .strip()
-                if name_span
-                else ""
-            )
+            texts = {}
+            for field, class_name in EVENT_FIELD_CLASSES.items():
+                span = link.find("p", class_=class_name)
+                texts[field] = span.get_text(strip=True) if span else None
 
-            # Extract location
-            location_span = link.find("p", class_="table__text calendar__location")
-            location = (
-                location_span.get_text(strip=True).replace("Локация", "").strip()
-                if location_span
-                else ""
-            )
+            event = _build_event(link.get("href", ""), texts)
+            if event is not None:
+                events.append(event)
+
+        except Exception as e:
+            print(f"Error parsing event: {e}")
+            continue
+
+    return events
+
+
+def parse_events_bs4(html: str) -> list:
+    """
+    Parse calendar HTML with the BeautifulSoup backend.
+
+    Args:
+        html: Calendar page HTML
+
+    Returns:
+        List of dictionaries containing parsed event information
+    """
+    return parse_events(BeautifulSoup(html, "html.parser"))
+
+
+def _lxml_text(element) -> str:
+    """
+    Get element text the way BeautifulSoup's get_text(strip=True) does.
+
+    Every text node is stripped, empty ones are dropped and the rest are
+    joined without a separator. Comments and processing instructions are skipped.
+
+    Args:
+        element: lxml element
+
+    Returns:
+        Stripped text content of the element
+    """
+    parts = []
+
+    def collect(node) -> None:
+        if isinstance(node.tag, str) and node.text:
+            parts.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    collect(element)
+    return "".join(part.strip() for part in parts if part.strip())
+
+
+def _class_name(element) -> str:
+    """Get the element's class attribute with normalized whitespace."""
+    return " ".join(element.get("class", "").split())
+
+
+def parse_events_lxml(html: str) -> list:
+    """
+    Parse calendar HTML with the lxml backend.
+
+    Each calendar link is walked once and every field is picked up in
+    that single pass, instead of one search per field. Produces exactly
+    the same output as the BeautifulSoup backend.
+
+    Args:
+        html: Calendar page HTML
+
+    Returns:
+        List of dictionaries containing parsed event information
+    """
+    if not html or not html.strip():
+        return []
+
+    document = lxml.html.document_fromstring(html)
+    field_by_class = {
+        class_name: field for field, class_name in EVENT_FIELD_CLASSES.items()
+    }
+
+    events = []
+    calendar_links = [
+        element
+        for element in document.iter("a")
+        if _class_name(element) == CALENDAR_LINK_CLASS
+    ]
+
+    for link in calendar_links:
+        try:
+            texts = dict.fromkeys(EVENT_FIELD_CLASSES)
+            for element in link.iter("p"):
+                field = field_by_class.get(_class_name(element))
+                if field is not None and texts[field] is None:
+                    texts[field] = _lxml_text(element)
 
-            # Filter out events with cancelled status
-            if any(
-                rejected_word in location for rejected_word in settings.REJECTED_WORDS
-            ):
+            event = _build_event(link.get("href", ""), texts)
+            if event is not None:
+                events.append(event)
+
+        except Exception as e:
+            print(f"Error parsing event: {e}")
+            continue
+
+    return events
+
+
+# Available calendar parser backends, selected by settings.HTML_PARSER_BACKEND
+PARSER_BACKENDS = {
+    "bs4": parse_events_bs4,
+    "lxml": parse_events_lxml,
+}
+
+
+def parse_events_html(html: str, backend: Optional[str] = None) -> list:
+    """
+    Parse calendar HTML with the configured parser backend.
+
+    Args:
+        html: Calendar page HTML
+        backend: Backend name from PARSER_BACKENDS, defaults to settings.HTML_PARSER_BACKEND
+
+    Returns:
+        List of dictionaries containing parsed event information
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or settings.HTML_PARSER_BACKEND
+    parser = PARSER_BACKENDS.get(backend)
+    if parser is None:
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    return parser(html)
+
+
+# Classes of live results table cells, by result field
+LIVE_RESULT_CELL_CLASSES = {
+    "place": "place",
+    "name": "athlete",
+    "command": "team",
+    "result": "score",
+}
+
+# Column header prefixes of live results tables, used when cells have no classes
+LIVE_RESULT_HEADERS = {
+    "место": "place",
+    "участник": "athlete",
+    "спортсмен": "athlete",
+    "фамилия": "athlete",
+    "команда": "team",
+    "результат": "score",
+    "итог": "score",
+}
+
+
+# Place cell such as "1", "3." or "=5"
+LIVE_RESULT_PLACE_RE = re.compile(r"=?\s*(\d+)\.?")
+
+
+def _parse_place(text: str) -> Optional[int]:
+    """Parse a place cell, None if it is not a single place number."""
+    match = LIVE_RESULT_PLACE_RE.fullmatch(text.strip())
+    return int(match.group(1)) if match else None
+
+
+def _header_columns(cells) -> Dict[int, str]:
+    """Map column indexes of a header row to result fields."""
+    columns = {}
+    for index, cell in enumerate(cells):
+        text = _lxml_text(cell).lower()
+        for prefix, field in LIVE_RESULT_HEADERS.items():
+            if text.startswith(prefix) and field not in columns.values():
+                columns[index] = field
+                break
+    return columns
+
+
+def parse_live_results(html: str) -> list:
+    """
+    Parse every result row of a c-f-r.ru live results page.
+
+    Cells are recognized by their class (place, name, command, result).
+    Tables without cell classes are read by the column headers instead.
+    Rows without an athlete, such as headers and separators, are skipped.
+
+    Args:
+        html: Live results page HTML
+
+    Returns:
+        List of dictionaries with athlete, team, place and score, in page order
+    """
+    if not html or not html.strip():
+        return []
+
+    document = lxml.html.document_fromstring(html)
+    results = []
+
+    for table in document.iter("table"):
+        columns: Dict[int, str] = {}
+        # Only the table's own rows, nested tables are visited separately
+        for row in table.xpath("./tr | ./thead/tr | ./tbody/tr"):
+            cells = [cell for cell in row if cell.tag in ("td", "th")]
+            if not cells:
                 continue
 
-            # Extract type
-            type_span = link.find("p", class_="table__text calendar__type")
-            type_text = (
-                type_span.get_text(strip=True).replace("Тип", "").strip()
-                if type_span
-                else ""
-            )
-            type_ = type_text
-
-            # Extract groups
-            groups_span = link.find("p", class_="table__text calendar__group")
-            groups = []
-            if groups_span:
-                groups_text = (
-                    groups_span.get_text(strip=True).replace("Группы", "").strip()
-                )
-                groups = [g.strip() for g in groups_text.split(";")]
-
-            # Extract disciplines
-            disciplines_span = link.find(
-                "p", class_="table__text calendar__disciplines"
-            )
-            disciplines = []
-            if disciplines_span:
-                disciplines_text = (
-                    disciplines_span.get_text(strip=True)
-                    .replace("Дисциплины", "")
-                    .strip()
-                )
-                disciplines = [d.strip() for d in disciplines_text.split(";")]
-
-            # Extract rank
-            rank_span = link.find("p", class_="table__text calendar__rank")
-            rank = rank_span.get_text(strip=True).strip() if rank_span else None
-
-            # Extract year from link (format: 2112kna -> year = `20` + first 2 digits)
-            year = extract_year_from_link(href)
-
-            events.append(
+            values = {}
+            for index, cell in enumerate(cells):
+                field = next(
+                    (
+                        LIVE_RESULT_CELL_CLASSES[name]
+                        for name in cell.get("class", "").split()
+                        if name in LIVE_RESULT_CELL_CLASSES
+                    ),
+                    None,
+                ) or columns.get(index)
+                if field is not None and field not in values:
+                    values[field] = _lxml_text(cell)
+
+            if not values:
+                header = _header_columns(cells)
+                if "athlete" in header.values():
+                    columns = header
+                continue
+            if not values.get("athlete"):
+                continue
+
+            place_text = values.get("place", "")
+            results.append(
                 {
-                    "date": date,
-                    "year": year,
-                    "rank": rank,
-                    "link": link_id,
-                    "name": name,
-                    "location": location,
-                    "type": type_,
-                    "groups": groups,
-                    "disciplines": disciplines,
-                    "startdate": startdate,
-                    "enddate": enddate,
+                    "athlete": values["athlete"],
+                    "team": values.get("team", ""),
+                    "place": _parse_place(place_text) if place_text else None,
+                    "score": values.get("score", ""),
                 }
             )
 
-        except Exception as e:
-            print(f"Error parsing event: {e}")
+    return results
+
+
+# Extensions of files attached to event detail pages
+DOCUMENT_EXTENSIONS = (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".rtf", ".zip", ".rar")
+
+# Detail page link categories, by words in the link text or URL
+DETAIL_LINK_KEYWORDS = {
+    "protocols": ("протокол", "protocol"),
+    "regulations": ("положени", "регламент", "reglament", "polozhenie"),
+    "results": ("результат", "results"),
+}
+
+# Page regions whose links are site navigation, not event content
+NAVIGATION_TAGS = ("nav", "header", "footer")
+
+
+def parse_event_details(html: str, page_url: str) -> Dict[str, List[dict]]:
+    """
+    Extract document and results links from an event detail page.
+
+    Links are sorted into regulations, results and protocols by the words
+    in their text or URL; other attached files go to documents. Links to
+    the live results site always count as results, while other pages of
+    the same site only count if they are below the event's page.
+    Navigation, header and footer links are ignored, and every URL is
+    kept once.
+
+    Args:
+        html: Detail page HTML
+        page_url: URL of the page, used to resolve relative links
+
+    Returns:
+        Dictionary with regulations, results, protocols and documents,
+        each a list of {"title", "url"} in page order
+    """
+    details: Dict[str, List[dict]] = {
+        "regulations": [],
+        "results": [],
+        "protocols": [],
+        "documents": [],
+    }
+    if not html or not html.strip():
+        return details
+
+    document = lxml.html.document_fromstring(html)
+    live_host = urlsplit(settings.LIVE_RESULTS_BASE_URL).netloc
+    page = urlsplit(page_url)
+    seen = set()
+
+    for link in document.iter("a"):
+        href = (link.get("href") or "").strip()
+        if not href or href.startswith(("#", "mailto:", "javascript:")):
+            continue
+        if any(ancestor.tag in NAVIGATION_TAGS for ancestor in link.iterancestors()):
             continue
 
-    return events
+        url = urljoin(page_url, href)
+        if url in seen:
+            continue
+        title = _lxml_text(link)
+        haystack = f"{title} {href}".lower()
+        parts = urlsplit(url)
+        is_file = parts.path.lower().endswith(DOCUMENT_EXTENSIONS)
+
+        kind = next(
+            (
+                name
+                for name, words in DETAIL_LINK_KEYWORDS.items()
+                if any(word in haystack for word in words)
+            ),
+            None,
+        )
+        if parts.netloc == live_host:
+            kind = "results"
+        elif kind is None and is_file:
+            kind = "documents"
+        elif kind is not None and not is_file and parts.netloc == page.netloc:
+            # Pages of this site count only below the event's own page
+            if not parts.path.startswith(page.path):
+                continue
+        if kind is None:
+            continue
+
+        seen.add(url)
+        details[kind].append({"title": title, "url": url})
+
+    return details
@@ -0,0 +1,166 @@
+"""Bounded in-process cache of serialized responses."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class CacheEntry:
+    """
+    Serialized response stored in a ResponseCache.
+
+    Attributes:
+        body: Response body
+        generation: Data generation the body was built from
+        expires_at: Clock time after which the entry is not served
+        etag: Validator of the data the body was built from, if any
+    """
+
+    body: bytes
+    generation: int
+    expires_at: float
+    etag: Optional[str] = None
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies with a TTL and a data generation.
+
+    The cache is bounded both by the number of entries and by the total
+    size of the bodies; the least recently used entries are evicted
+    first. Every entry records the generation of the data it was built
+    from, and bumping the generation drops all entries at once, so a body
+    built before a write is never served after it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of the cached bodies
+            ttl: Seconds an entry is served for
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.generation = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Body, or None if it is missing, expired or of an older generation
+        """
+        entry = self.lookup(key)
+        return entry.body if entry is not None else None
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry, or None if it is missing, expired or of an older generation
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.generation != self.generation:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(
+        self, key: str, body: bytes, generation: int, etag: Optional[str] = None
+    ) -> None:
+        """
+        Store a body, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            body: Response body
+            generation: Generation read before the body was built; bodies of
+                an older generation are not stored
+            etag: Validator of the data the body was built from
+        """
+        if generation != self.generation or len(body) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(
+            body, generation, self._clock() + self.ttl, etag
+        )
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def bump_generation(self) -> int:
+        """
+        Start a new data generation, dropping every cached body.
+
+        Returns:
+            New generation
+        """
+        self.generation += 1
+        self.clear()
+        return self.generation
+
+    def clear(self) -> None:
+        """Drop every cached body."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with hit and miss counters, hit rate, number of
+            entries, their total size in bytes and the current generation
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "generation": self.generation,
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size."""
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
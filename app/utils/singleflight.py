@@ -0,0 +1,58 @@
+"""Coalescing of concurrent identical async calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time within the process.
+
+    Callers arriving while a call with the same key is in flight wait for
+    its result instead of starting their own. The call runs in its own
+    task, so a cancelled caller does not cancel it for the others.
+    """
+
+    def __init__(self):
+        """Initialize SingleFlight."""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `fn` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identifier of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            Result of the call, shared by all callers
+
+        Raises:
+            Exception: Whatever the call raised, for every caller
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._calls.get(key) is done:
+                    del self._calls[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """
+        Check whether a call with the key is running.
+
+        Args:
+            key: Identifier of the call
+
+        Returns:
+            True if a call is in flight, False otherwise
+        """
+        return key in self._calls
@@ -0,0 +1,44 @@
+"""Per-host request pacing for polite crawling."""
+
+import asyncio
+import time
+from typing import Callable, Dict
+from urllib.parse import urlsplit
+
+
+class HostThrottle:
+    """
+    Spaces out the start of requests to the same host.
+
+    Each host gets its own lock and its own clock, so a crawl touching
+    several hosts is only slowed down per host. The cap on simultaneous
+    requests per host is enforced separately by the shared HttpClient.
+    """
+
+    def __init__(self, min_interval: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize HostThrottle.
+
+        Args:
+            min_interval: Minimum seconds between request starts to one host
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.min_interval = min_interval
+        self._clock = clock
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        """
+        Wait until a request to the URL's host may start.
+
+        Args:
+            url: Request URL
+        """
+        host = urlsplit(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._next_start.get(host, 0.0) - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start[host] = self._clock() + self.min_interval
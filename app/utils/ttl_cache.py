@@ -0,0 +1,97 @@
+"""Bounded in-process cache of arbitrary values."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU cache of values that expire a fixed time after they are stored.
+
+    Unlike ResponseCache, entries can be evicted one by one, so the cache
+    suits data invalidated per key rather than all at once. Every eviction
+    starts a new generation; a value loaded before it is not stored, so a
+    read racing a write cannot put the old value back.
+    """
+
+    def __init__(
+        self, max_entries: int, ttl: float, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize TTLCache.
+
+        Args:
+            max_entries: Maximum number of entries
+            ttl: Seconds an entry is served for
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, seconds since it was stored), or None if it is
+            missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        held = self._clock() - stored_at
+        if held >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value, held
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Generation read before the value was loaded; values
+                of an older generation are not stored
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (value, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Evict the entries whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key
+
+        Returns:
+            Number of evicted entries
+        """
+        self.generation += 1
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of entries, expired ones included."""
+        return len(self._entries)
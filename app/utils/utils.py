@@ -1,3 +1,5 @@
+import hashlib
+import json
 import re
 from typing import Union, Optional, Tuple
 
@@ -45,6 +47,54 @@ def extract_year_from_link(href: str) -> str:
     return ""
 
 
+def compute_event_hash(event: dict) -> str:
+    """
+    Вычисляет стабильный хэш содержимого соревнования.
+
+    Хэш считается по всем полям, полученным парсером (кроме самого хэша),
+    поэтому меняется при переносе дат, переименовании или отмене соревнования
+    и не зависит от порядка ключей в словаре.
+
+    Args:
+        event: Словарь с данными соревнования из parse_events
+
+    Returns:
+        Хэш SHA-256 в шестнадцатеричном виде
+    """
+    content = {key: value for key, value in event.items() if key != "content_hash"}
+    payload = json.dumps(content, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Коды дисциплин и раундов в именах страниц онлайн-результатов
+LIVE_PAGE_DISCIPLINES = {"l": "трудность", "b": "боулдеринг", "s": "скорость"}
+LIVE_PAGE_ROUNDS = {"q": "квалификация", "s": "полуфинал", "f": "финал"}
+
+
+def parse_live_page_name(page: str) -> dict:
+    """
+    Извлекает дисциплину, раунд и группу из имени страницы онлайн-результатов.
+
+    Имя состоит из кодов дисциплины, раунда и группы через подчёркивание,
+    например "l_q_f13.html" - трудность, квалификация, группа f13.
+    Неизвестные коды возвращаются как есть.
+
+    Args:
+        page: Имя страницы
+
+    Returns:
+        Словарь с ключами discipline, round и group (None, если часть отсутствует)
+    """
+    stem = page.rsplit("/", 1)[-1].split(".", 1)[0]
+    parts = stem.split("_")
+    discipline, round_, group = (parts + [None, None, None])[:3]
+    return {
+        "discipline": LIVE_PAGE_DISCIPLINES.get(discipline, discipline) or None,
+        "round": LIVE_PAGE_ROUNDS.get(round_, round_) or None,
+        "group": group or None,
+    }
+
+
 def parse_date_range(date_str: str, year: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Распарсить диапазон дат в формат YYYY-MM-DD.
@@ -0,0 +1,147 @@
+"""
+Benchmark of /api/events response serialization.
+
+Compares the former path, which copied each Event's __dict__, fixed up
+empty dates, validated an EventResponse per row and a BaseResponse
+around them before dumping JSON, with the current path, which encodes
+plain column rows in one event_page_adapter pass. Database time is not
+included; both paths start from already loaded rows.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://u:p@localhost/db \\
+        python -m benchmarks.events_serialization --events 10000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from app.models.event import Event
+from app.schemas.event import EventResponse, PageResponse, event_page_adapter
+
+
+def make_rows(count: int) -> List[dict]:
+    """
+    Build synthetic event rows shaped like EventRepository.get_rows_by_filters output.
+
+    Args:
+        count: Number of rows
+
+    Returns:
+        List of column dictionaries, ordered by link
+    """
+    created = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    return [
+        {
+            "date": f"{i % 28 + 1}-{i % 28 + 3} марта",
+            "year": "2024",
+            "rank": None if i % 3 else "Всероссийские",
+            "startdate": None if i % 10 == 0 else "2024-03-01",
+            "enddate": "2024-03-03",
+            "link": f"/competitions/{i:06d}/",
+            "name": f"Первенство России по скалолазанию №{i}",
+            "location": "Москва, ЦСКА",
+            "type": "book_competition",
+            "groups": ["adults", "13-14", "15-16"],
+            "disciplines": ["lead", "boulder", "speed"],
+            "id": i,
+            "created_at": created,
+            "updated_at": created + timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+
+
+def make_events(rows: List[dict]) -> List[Event]:
+    """
+    Build ORM events as the former path loaded them, empty dates as "".
+
+    Args:
+        rows: Rows made by make_rows
+
+    Returns:
+        List of transient Event objects
+    """
+    return [
+        Event(
+            **{
+                **row,
+                "startdate": row["startdate"] or "",
+                "enddate": row["enddate"] or "",
+            }
+        )
+        for row in rows
+    ]
+
+
+def serialize_models(events: List[Event]) -> bytes:
+    """Serialize events the way fetch_events did before the single-pass path."""
+    event_dict_list = []
+    for event in events:
+        event_dict = event.__dict__.copy()
+        if event_dict.get("startdate") == "":
+            event_dict["startdate"] = None
+        if event_dict.get("enddate") == "":
+            event_dict["enddate"] = None
+        event_dict_list.append(event_dict)
+    event_responses = [
+        EventResponse.model_validate(event_dict) for event_dict in event_dict_list
+    ]
+    event_responses.sort(key=lambda x: x.link)
+    response = PageResponse[List[EventResponse]](data=event_responses, success=True)
+    return response.model_dump_json().encode("utf-8")
+
+
+def serialize_rows(rows: List[dict]) -> bytes:
+    """Serialize rows the way fetch_events does now."""
+    return event_page_adapter.dump_json(
+        {"success": True, "data": rows, "message": None, "next_cursor": None}
+    )
+
+
+def measure(fn: Callable[[], bytes], repeat: int) -> float:
+    """
+    Get the best wall time of several runs of a function.
+
+    Args:
+        fn: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Shortest run time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print throughput of both paths."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000, help="Number of events")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path, best is kept")
+    args = parser.parse_args()
+
+    rows = make_rows(args.events)
+    events = make_events(rows)
+    if serialize_models(events) != serialize_rows(rows):
+        raise SystemExit("The two paths produce different JSON")
+
+    results = {
+        "models (former)": measure(lambda: serialize_models(events), args.repeat),
+        "single pass": measure(lambda: serialize_rows(rows), args.repeat),
+    }
+    size = len(serialize_rows(rows))
+    print(f"{args.events} events, {size / 1024:.0f} KiB of JSON, best of {args.repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<16} {seconds * 1000:8.1f} ms  {args.events / seconds:10.0f} events/s")
+    speedup = results["models (former)"] / results["single pass"]
+    print(f"  speedup          {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()